@@ -27,6 +27,7 @@ from report_exporter import export_fda_report
 
 # Import all digital twin components
 from models.molecule_twin import MoleculeTwin, ProcessConditions, MolecularState
+from models.molecule_lineage import LineageIndex
 from quantum.production_simulator import (
     QuantumProductionSimulator,
     ProductionScenario,
@@ -88,6 +89,8 @@ class DigitalTwinOrchestrator:
     def __init__(self, config: SystemConfiguration):
         self.config = config
         self.molecule_twins: Dict[str, MoleculeTwin] = {}
+        # Transformation edges between this system's twins, used for recall impact
+        self.lineage = LineageIndex()
         self.quantum_simulator = QuantumProductionSimulator(config.quantum_backend)
         self.quality_engines: Dict[str, QualityForecastingEngine] = {}
         self.doc_generator = RegulatoryDocumentGenerator(
@@ -156,8 +159,7 @@ class DigitalTwinOrchestrator:
             ("CC(C)(C)NCC(C1=CC(=C(C=C1)O)O)O", "Salbutamol", "18559-94-9"),
         ]
 
-        for smiles, name, cas in example_molecules:
-            twin = MoleculeTwin(smiles, name, cas)
+        for twin in MoleculeTwin.from_many(example_molecules, namespace="library"):
             self.molecule_twins[twin.id] = twin
 
         logger.info(f"Loaded {len(self.molecule_twins)} molecules into library")
@@ -226,21 +228,17 @@ class DigitalTwinOrchestrator:
             "created_at": datetime.utcnow(),
             "molecule_twins": [],
             "process_data": {},
+            "environmental_data": None,  # Latest reading, set by the batch monitor
             "quality_data": {},
             "predictions": {},
             "documents": {},
         }
 
         # Create molecule twins for batch components
-        for material in batch_config.get("materials", []):
-            if material.get("smiles"):
-                mol_twin = MoleculeTwin(
-                    material["smiles"],
-                    material["name"],
-                    material.get("cas_number"),
-                )
-                batch_twin["molecule_twins"].append(mol_twin.id)
-                self.molecule_twins[mol_twin.id] = mol_twin
+        materials = [m for m in batch_config.get("materials", []) if m.get("smiles")]
+        for mol_twin in MoleculeTwin.from_many(materials, namespace=str(batch_id)):
+            batch_twin["molecule_twins"].append(mol_twin.id)
+            self.molecule_twins[mol_twin.id] = mol_twin
 
         # Store batch twin
         self.active_batches[batch_id] = batch_twin
@@ -265,17 +263,10 @@ class DigitalTwinOrchestrator:
                 process_data = await self._collect_process_data(batch_id)
                 environmental_data = await self._collect_environmental_data(batch_id)
 
-                # Update batch twin
+                # Update batch twin; its quality predictions come from
+                # score_active_batches in the system monitoring loop
                 batch["process_data"].update(process_data)
-
-                # Run quality predictions
-                if batch["product_id"] in self.quality_engines:
-                    prediction = await self._run_quality_prediction(
-                        batch_id,
-                        process_data,
-                        environmental_data,
-                    )
-                    batch["predictions"][datetime.utcnow().isoformat()] = prediction
+                batch["environmental_data"] = environmental_data
 
                 # Check for deviations
                 deviations = await self._check_deviations(batch_id, process_data)
@@ -316,23 +307,70 @@ class DigitalTwinOrchestrator:
             shift="day",
         )
 
-    async def _run_quality_prediction(
-        self,
-        batch_id: str,
-        process_data: Dict[str, Any],
-        environmental_data: EnvironmentalData,
-    ) -> Dict[str, Any]:
-        """Run AI quality prediction"""
-        batch = self.active_batches[batch_id]
-        engine = self.quality_engines.get(batch["product_id"])
+    async def score_active_batches(self) -> Dict[str, Dict[str, Any]]:
+        """Run quality predictions for every monitored batch in one pass
+
+        Batches are grouped by product so that each product's engine scores
+        all of its batches with a single ``predict_batch`` call. Each batch is
+        scored on the latest readings its monitor collected, or on a fresh
+        reading if it has none yet. Returns the prediction for each batch id,
+        which is also recorded on the batch. A product whose engine cannot be
+        trained or fails to predict is logged and skipped, so its batches are
+        missing from the result.
+        """
+        inputs_by_product: Dict[str, List[Tuple[str, Tuple]]] = {}
+        for batch_id, batch in list(self.active_batches.items()):
+            if batch["status"] in ["completed", "failed", "cancelled"]:
+                continue
+            if batch["product_id"] not in self.quality_engines:
+                continue
+            environmental_data = batch.get("environmental_data")
+            if environmental_data is None:
+                batch["process_data"].update(await self._collect_process_data(batch_id))
+                environmental_data = await self._collect_environmental_data(batch_id)
+                batch["environmental_data"] = environmental_data
+            inputs_by_product.setdefault(batch["product_id"], []).append(
+                (batch_id, self._quality_prediction_inputs(batch, batch["process_data"], environmental_data))
+            )
+
+        predictions = {}
+        for product_id, entries in inputs_by_product.items():
+            engine = self.quality_engines[product_id]
+            try:
+                await self._ensure_quality_engine_trained(product_id, engine)
+                results = engine.predict_batch(
+                    [inputs for _, inputs in entries],
+                    self.config.prediction_horizon_days,
+                )
+            except Exception as e:
+                # One product's engine failing must not stop scoring for the others
+                logger.error(f"Error scoring {len(entries)} batches of product {product_id}: {e}")
+                continue
 
+            for (batch_id, _), prediction in zip(entries, results):
+                self.active_batches[batch_id]["predictions"][datetime.utcnow().isoformat()] = prediction
+                predictions[batch_id] = prediction
+
+        self.system_metrics["predictions_made"] += len(predictions)
+
+        return predictions
+
+    async def _ensure_quality_engine_trained(self, product_id: str, engine: QualityForecastingEngine):
+        """Train an engine on historical data if it has not been trained yet"""
         if not engine or not engine.is_trained:
             # Train model if needed (in production, models would be pre-trained)
-            historical_data = await self._get_historical_data(batch["product_id"])
+            historical_data = await self._get_historical_data(product_id)
             if len(historical_data) > 100:
-                specs = await self._get_quality_specifications(batch["product_id"])
+                specs = await self._get_quality_specifications(product_id)
                 engine.train(historical_data, specs)
 
+    def _quality_prediction_inputs(
+        self,
+        batch: Dict[str, Any],
+        process_data: Dict[str, Any],
+        environmental_data: EnvironmentalData,
+    ) -> Tuple[ProcessParameters, EnvironmentalData, Optional[QualityMetrics]]:
+        """Engine inputs for a batch from its collected process and environmental data"""
         # Prepare process parameters
         process_params = ProcessParameters(
             temperature=process_data.get("temperature", 25),
@@ -355,17 +393,7 @@ class DigitalTwinOrchestrator:
             if latest_quality:
                 current_quality = QualityMetrics(**latest_quality)
 
-        # Run prediction
-        prediction = engine.predict(
-            process_params,
-            environmental_data,
-            current_quality,
-            self.config.prediction_horizon_days,
-        )
-
-        self.system_metrics["predictions_made"] += 1
-
-        return prediction
+        return process_params, environmental_data, current_quality
 
     async def run_quantum_simulation(
         self,
@@ -650,6 +678,9 @@ class DigitalTwinOrchestrator:
                 # Process pending tasks
                 await self._process_pending_tasks()
 
+                # Quality predictions for every monitored batch, one engine call per product
+                await self.score_active_batches()
+
                 # Generate periodic reports
                 if datetime.utcnow().hour == 0:  # Daily reports at midnight
                     await self._generate_daily_reports()
@@ -728,6 +759,28 @@ class DigitalTwinOrchestrator:
             else "not applied",
         }
 
+    def transform_molecule(self, twin_id: str, reaction_type: str, reagents: List[str],
+                           conditions: ProcessConditions) -> MoleculeTwin:
+        """Apply a transformation to a library twin and register the product"""
+        product = self.molecule_twins[twin_id].apply_transformation(
+            reaction_type, reagents, conditions, lineage=self.lineage
+        )
+        self.molecule_twins[product.id] = product
+        return product
+
+    def get_recall_impact(self, twin_id: str) -> Dict[str, Any]:
+        """Twins derived from a material and the active batches using any of them"""
+        derived = self.lineage.descendants(twin_id)
+        affected = {twin_id, *derived}
+        return {
+            "material_id": twin_id,
+            "derived_twins": derived,
+            "affected_batches": [
+                batch_id for batch_id, batch in self.active_batches.items()
+                if affected.intersection(batch["molecule_twins"])
+            ],
+        }
+
     def get_system_metrics(self) -> Dict[str, Any]:
         """Get overall system metrics"""
         return {
@@ -737,6 +790,10 @@ class DigitalTwinOrchestrator:
             "active_batches": len(self.active_batches),
             "molecule_library_size": len(self.molecule_twins),
             "quality_models_count": len(self.quality_engines),
+            "quantum_cache": self.quantum_simulator.simulation_cache.stats(),
+            "quantum_optimizer": self.quantum_simulator.parameter_optimizer.stats(),
+            "molecule_property_cache": MoleculeTwin.property_cache.stats(),
+            "molecule_lineage_edges": len(self.lineage),
         }
 
     def set_scenario_options(self, **options: bool) -> None:
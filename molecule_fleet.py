@@ -0,0 +1,287 @@
+"""
+Molecule Fleet
+Struct-of-arrays process simulation and shelf-life prediction for many molecule twins at once
+"""
+
+import numpy as np
+from dataclasses import fields
+from typing import List, Dict, Optional, Sequence, Union, Mapping
+from datetime import datetime
+
+from molecule_twin_model import (
+    MoleculeTwin,
+    MolecularProperty,
+    ProcessConditions,
+    PROCESS_CONDITION_FIELDS,
+    STORAGE_RECOMMENDATIONS
+)
+from degradation_kinetics import ArrheniusModel, arrhenius_model, stability_indices
+
+# Process efficiency below reproduces the scalar MoleculeTwin model term by
+# term, in the same order of operations; degradation and stability come from
+# the kinetics module both share, so a fleet step gives the same numbers as
+# calling simulate_process_step on each twin.
+
+CONDITION_FIELDS = PROCESS_CONDITION_FIELDS
+
+HOURS_PER_MONTH = 24 * 30
+MAX_SHELF_LIFE_MONTHS = 36  # Reported when there is no degradation
+
+# ICH Q1A climatic zones: long-term storage temperature (Celsius) and relative humidity (%)
+ICH_CLIMATIC_ZONES = {
+    "I": (21.0, 45.0),
+    "II": (25.0, 60.0),
+    "III": (30.0, 35.0),
+    "IVa": (30.0, 65.0),
+    "IVb": (30.0, 75.0)
+}
+
+ConditionsLike = Union[ProcessConditions, Sequence[ProcessConditions], Mapping[str, np.ndarray]]
+
+
+def condition_columns(conditions: ConditionsLike) -> Dict[str, np.ndarray]:
+    """Process conditions as one float array per ProcessConditions field
+
+    Accepts a single ``ProcessConditions`` (0-d arrays that broadcast over
+    any fleet), a sequence of them (one row each), or a mapping from field
+    name to array-like. A mapping may omit fields it does not vary; missing
+    fields are not filled in, so the caller gets an error only if a model
+    actually needs them.
+    """
+    if isinstance(conditions, ProcessConditions):
+        return {name: np.asarray(getattr(conditions, name), dtype=float) for name in CONDITION_FIELDS}
+    if isinstance(conditions, Mapping):
+        unknown = set(conditions) - set(CONDITION_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown process condition fields: {sorted(unknown)}")
+        return {name: np.asarray(values, dtype=float) for name, values in conditions.items()}
+    return {name: np.array([getattr(c, name) for c in conditions], dtype=float)
+            for name in CONDITION_FIELDS}
+
+
+def condition_grid(base: ProcessConditions, *axes: Mapping[str, Sequence[float]],
+                   **single_axes: Sequence[float]) -> Dict[str, np.ndarray]:
+    """Cartesian grid of conditions as broadcastable columns
+
+    Each positional axis maps one or more fields to equal-length value
+    lists that vary together (e.g. ``ich_zone_axis()``); each keyword adds
+    an axis for one field. Axes are taken in order, positional first, and
+    every other field is fixed at its value in ``base``. Columns are
+    shaped to broadcast against each other rather than being expanded,
+    so a grid costs memory proportional to the sum of its axis lengths.
+    """
+    axes = list(axes) + [{name: values} for name, values in single_axes.items()]
+    columns = condition_columns(base)
+    for position, axis in enumerate(axes):
+        shape = [1] * len(axes)
+        for name, values in axis.items():
+            if name not in CONDITION_FIELDS:
+                raise ValueError(f"Unknown process condition field: {name}")
+            values = np.asarray(values, dtype=float).ravel()
+            shape[position] = len(values)
+            if columns[name].ndim:
+                raise ValueError(f"Condition field {name} appears in more than one axis")
+            columns[name] = values.reshape(shape)
+        if len({columns[name].size for name in axis}) > 1:
+            raise ValueError("Fields sharing an axis need the same number of values")
+    return columns
+
+
+def ich_zone_axis(zones: Sequence[str] = tuple(ICH_CLIMATIC_ZONES)) -> Dict[str, List[float]]:
+    """Grid axis pairing the temperature and humidity of each ICH climatic zone"""
+    return {
+        "temperature": [ICH_CLIMATIC_ZONES[zone][0] for zone in zones],
+        "humidity": [ICH_CLIMATIC_ZONES[zone][1] for zone in zones]
+    }
+
+
+def _range_penalty(values: np.ndarray, low: float, high: float, slope: float, floor: float) -> np.ndarray:
+    """Efficiency multiplier that falls linearly with distance outside [low, high]"""
+    deviation = np.minimum(np.abs(values - low), np.abs(values - high))
+    inside = (low <= values) & (values <= high)
+    return np.where(inside, 1.0, np.maximum(floor, 1 - slope * deviation))
+
+
+def process_efficiencies(temperature, ph, mixing_speed) -> np.ndarray:
+    """Process efficiency (0-1), elementwise over broadcast inputs"""
+    temperature, ph, mixing_speed = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (temperature, ph, mixing_speed)))
+
+    efficiency = 1.0 * _range_penalty(temperature, 20, 25, 0.02, 0.5)
+    efficiency = efficiency * _range_penalty(ph, 6.5, 7.5, 0.1, 0.6)
+    mixing_factor = np.where(mixing_speed < 100, 0.8, np.where(mixing_speed > 300, 0.9, 1.0))
+    return efficiency * mixing_factor
+
+
+def predict_shelf_life_grid(conditions: ConditionsLike, acceptance_criteria: Dict[str, float],
+                            current_purity=99.9, kinetics: Optional[ArrheniusModel] = None) -> Dict:
+    """Shelf life and stability over many storage conditions in one broadcast pass
+
+    Mirrors ``MoleculeTwin.predict_shelf_life`` elementwise. Result arrays
+    take the broadcast shape of the condition columns and ``current_purity``
+    (a scalar, or an array such as a fleet's purity column). Storage
+    recommendations depend only on the conditions and are derived from
+    them last, as string arrays keyed like the scalar recommendations.
+    Rates come from ``kinetics``, the default Arrhenius model if not given.
+    """
+    columns = condition_columns(conditions)
+    min_acceptable_purity = acceptance_criteria.get("min_purity", 95.0)
+    current_purity = np.asarray(current_purity, dtype=float)
+    kinetics = kinetics or arrhenius_model()
+
+    degradation_rate = kinetics.rates(
+        columns["temperature"], columns["ph"], columns["humidity"], columns["light_exposure"]
+    )
+    positive = degradation_rate > 0
+    shelf_life_hours = (current_purity - min_acceptable_purity) / np.where(positive, degradation_rate, 1.0)
+    shelf_life_months = np.where(positive, shelf_life_hours / HOURS_PER_MONTH, MAX_SHELF_LIFE_MONTHS)
+
+    return {
+        "shelf_life_months": shelf_life_months,
+        "degradation_rate_per_month": degradation_rate * HOURS_PER_MONTH,
+        "stability_index": stability_indices(degradation_rate),
+        "storage_recommendations": storage_recommendation_arrays(columns)
+    }
+
+
+def storage_recommendation_arrays(columns: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Storage recommendations for every grid point, as arrays of advice strings"""
+    shape = np.broadcast_shapes(*(np.shape(values) for values in columns.values()))
+    return {
+        key: np.broadcast_to(np.where(columns[field] > threshold, above, otherwise), shape)
+        for key, (field, threshold, above, otherwise) in STORAGE_RECOMMENDATIONS.items()
+    }
+
+
+def property_columns(properties: Sequence[MolecularProperty]) -> Dict[str, np.ndarray]:
+    """Molecular properties as NumPy columns
+
+    Scalar fields become one column each. Dict-valued fields are flattened
+    to ``"<field>.<key>"`` columns with NaN where a molecule lacks the key,
+    and ``pka_values`` becomes an (N, max_pka) array padded with NaN.
+    """
+    columns: Dict[str, np.ndarray] = {}
+    for field in fields(MolecularProperty):
+        values = [getattr(p, field.name) for p in properties]
+        if field.name == "pka_values":
+            width = max((len(v) for v in values), default=0)
+            pka = np.full((len(values), width), np.nan)
+            for row, v in enumerate(values):
+                pka[row, :len(v)] = v
+            columns["pka_values"] = pka
+        elif values and isinstance(values[0], Mapping):
+            keys = sorted({key for v in values for key in v})
+            for key in keys:
+                columns[f"{field.name}.{key}"] = np.array([v.get(key, np.nan) for v in values], dtype=float)
+        elif field.name == "synthesis_complexity":
+            columns[field.name] = np.array(values, dtype=np.int64)
+        else:
+            columns[field.name] = np.array(values, dtype=float)
+    return columns
+
+
+class MoleculeFleet:
+    """Quality metrics and properties of N molecules held as NumPy columns
+
+    A fleet is a what-if workspace: stepping it updates its own purity,
+    yield and stability columns and leaves the source twins untouched.
+    Unlike ``MoleculeTwin`` it keeps no per-molecule process history.
+    Every molecule degrades under one ``kinetics`` model.
+    """
+
+    def __init__(self, ids: Sequence[str], purity: np.ndarray, yield_: np.ndarray,
+                 stability_index: Optional[np.ndarray] = None,
+                 properties: Optional[Dict[str, np.ndarray]] = None,
+                 kinetics: Optional[ArrheniusModel] = None):
+        self.ids = list(ids)
+        n = len(self.ids)
+        self.purity = np.broadcast_to(np.asarray(purity, dtype=float), (n,)).copy()
+        self.yield_ = np.broadcast_to(np.asarray(yield_, dtype=float), (n,)).copy()
+        # NaN until a molecule has been through a process step
+        self.stability_index = (np.full(n, np.nan) if stability_index is None
+                                else np.broadcast_to(np.asarray(stability_index, dtype=float), (n,)).copy())
+        self.properties = properties or {}
+        self.kinetics = kinetics or arrhenius_model()
+        self.steps = 0
+
+    @classmethod
+    def from_twins(cls, twins: Sequence[MoleculeTwin],
+                   kinetics: Optional[ArrheniusModel] = None) -> 'MoleculeFleet':
+        """Snapshot the current quality metrics and properties of existing twins
+
+        The fleet uses the twins' kinetics model unless ``kinetics`` is
+        given; twins with different models need an explicit one.
+        """
+        if kinetics is None:
+            models = {id(twin.kinetics): twin.kinetics for twin in twins}
+            if len(models) > 1:
+                raise ValueError("Twins use different kinetics models; pass kinetics explicitly")
+            kinetics = next(iter(models.values()), MoleculeTwin.kinetics)
+        metrics = [twin.quality_metrics for twin in twins]
+        return cls(
+            ids=[twin.id for twin in twins],
+            purity=np.array([m.get("purity", 99.9) for m in metrics], dtype=float),
+            yield_=np.array([m.get("yield", 100.0) for m in metrics], dtype=float),
+            stability_index=np.array([m.get("stability_index", np.nan) for m in metrics], dtype=float),
+            properties=property_columns([twin.properties for twin in twins]),
+            kinetics=kinetics
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def simulate_process_step(self, conditions: ConditionsLike, duration) -> Dict:
+        """Apply one process step to every molecule
+
+        ``conditions`` is shared by the whole fleet or given per molecule
+        (see ``condition_columns``); ``duration`` in minutes may also be an
+        array. Returns a record shaped like ``MoleculeTwin``'s process record
+        with arrays in place of scalars.
+        """
+        columns = condition_columns(conditions)
+        n = len(self)
+
+        degradation_rate = np.broadcast_to(self.kinetics.rates(
+            columns["temperature"], columns["ph"], columns["humidity"], columns["light_exposure"]
+        ), (n,))
+        purity_loss = degradation_rate * np.asarray(duration, dtype=float) / 60  # Convert to hours
+
+        efficiency = process_efficiencies(columns["temperature"], columns["ph"], columns["mixing_speed"])
+        yield_factor = efficiency * (1 - purity_loss / 100)
+
+        self.purity = np.maximum(0, self.purity - purity_loss)
+        self.yield_ = self.yield_ * yield_factor
+        self.stability_index = np.broadcast_to(stability_indices(degradation_rate), (n,)).copy()
+        self.steps += 1
+
+        return {
+            "timestamp": datetime.utcnow().isoformat(),
+            "conditions": columns,
+            "duration_minutes": duration,
+            "quality_metrics": {
+                "purity": self.purity,
+                "yield": self.yield_,
+                "stability_index": self.stability_index
+            },
+            "degradation_rate": degradation_rate
+        }
+
+    def predict_shelf_life_grid(self, storage_conditions: ConditionsLike,
+                                acceptance_criteria: Dict[str, float]) -> Dict:
+        """Shelf life of every molecule under every storage condition
+
+        Arrays are shaped ``(N,) + grid shape``, except the storage
+        recommendations, which depend only on the conditions.
+        """
+        columns = condition_columns(storage_conditions)
+        grid_ndim = len(np.broadcast_shapes(*(np.shape(c) for c in columns.values())))
+        purity = self.purity.reshape((len(self),) + (1,) * grid_ndim)
+        return predict_shelf_life_grid(columns, acceptance_criteria, current_purity=purity,
+                                       kinetics=self.kinetics)
+
+    def quality_metrics(self, index: int) -> Dict[str, float]:
+        """Quality metrics of one molecule, keyed like ``MoleculeTwin.quality_metrics``"""
+        metrics = {"purity": float(self.purity[index]), "yield": float(self.yield_[index])}
+        if not np.isnan(self.stability_index[index]):
+            metrics["stability_index"] = float(self.stability_index[index])
+        return metrics
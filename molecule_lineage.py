@@ -0,0 +1,139 @@
+"""
+Molecule Lineage Index
+Parent/child adjacency of molecule twins created by chemical transformations
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+class LineageIndex:
+    """Synthesis lineage of twins, keyed by twin id
+
+    Each transformation adds one edge from the parent twin to the product
+    twin, with the reaction type and timestamp. Every twin has at most one
+    parent, so ancestor queries walk parent pointers in O(depth), and each
+    twin lists its children so a descendant subtree costs O(subtree size).
+    With ``max_edges`` set, the oldest edges are dropped once the index holds
+    more than that many, so routes reach back only as far as the kept edges.
+    """
+
+    def __init__(self, max_edges: Optional[int] = None):
+        if max_edges is not None and max_edges <= 0:
+            raise ValueError("max_edges must be positive")
+        self.max_edges = max_edges
+        self.evicted = 0
+        self._parent: Dict[str, str] = {}
+        self._children: Dict[str, List[str]] = {}
+        self._edges: Dict[str, Dict[str, Any]] = {}  # Child id -> edge record
+
+    def record(self, parent_id: str, child_id: str, reaction_type: Optional[str] = None,
+               timestamp: Optional[str] = None):
+        """Add the edge for one transformation
+
+        Recording the same edge again is a no-op. A twin cannot get a second
+        parent or become its own ancestor.
+        """
+        existing = self._parent.get(child_id)
+        if existing == parent_id:
+            return
+        if existing is not None:
+            raise ValueError(f"Twin {child_id} already derives from {existing}")
+        if child_id == parent_id or child_id in self.iter_ancestors(parent_id):
+            raise ValueError(f"Edge {parent_id} -> {child_id} would create a cycle")
+
+        self._parent[child_id] = parent_id
+        self._children.setdefault(parent_id, []).append(child_id)
+        self._edges[child_id] = {
+            "parent_id": parent_id,
+            "child_id": child_id,
+            "reaction_type": reaction_type,
+            "timestamp": timestamp
+        }
+        if self.max_edges is not None:
+            while len(self._edges) > self.max_edges:
+                self._evict_oldest()
+
+    def parent(self, twin_id: str) -> Optional[str]:
+        return self._parent.get(twin_id)
+
+    def children(self, twin_id: str) -> List[str]:
+        return list(self._children.get(twin_id, ()))
+
+    def iter_ancestors(self, twin_id: str) -> Iterator[str]:
+        """Parent, grandparent, ... up to the root"""
+        parent = self._parent.get(twin_id)
+        while parent is not None:
+            yield parent
+            parent = self._parent.get(parent)
+
+    def ancestors(self, twin_id: str) -> List[str]:
+        """Ancestor ids, nearest first"""
+        return list(self.iter_ancestors(twin_id))
+
+    def root(self, twin_id: str) -> str:
+        """The raw material a twin ultimately derives from (itself if none)"""
+        root = twin_id
+        for root in self.iter_ancestors(twin_id):
+            pass
+        return root
+
+    def route(self, twin_id: str) -> List[Dict[str, Any]]:
+        """Transformation edges from the root down to ``twin_id``, i.e. its synthesis route"""
+        edges = []
+        while twin_id in self._edges:
+            edges.append(self._edges[twin_id])
+            twin_id = self._parent[twin_id]
+        return [dict(edge) for edge in reversed(edges)]
+
+    def descendants(self, twin_id: str) -> List[str]:
+        """Every twin derived from ``twin_id``, breadth first"""
+        found = []
+        queue = deque(self._children.get(twin_id, ()))
+        while queue:
+            child = queue.popleft()
+            found.append(child)
+            queue.extend(self._children.get(child, ()))
+        return found
+
+    def export(self) -> List[Dict[str, Any]]:
+        """All edges as records, parents before their children
+
+        The list can be passed back to ``from_edges`` to rebuild the index.
+        """
+        roots = [twin_id for twin_id in self._children if twin_id not in self._parent]
+        return [dict(self._edges[child]) for root in roots for child in self.descendants(root)]
+
+    def adjacency(self) -> Dict[str, List[str]]:
+        """Parent id -> child ids, for every twin that has children"""
+        return {parent: list(children) for parent, children in self._children.items()}
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Dict[str, Any]], max_edges: Optional[int] = None) -> 'LineageIndex':
+        index = cls(max_edges)
+        for edge in edges:
+            index.record(edge["parent_id"], edge["child_id"], edge.get("reaction_type"), edge.get("timestamp"))
+        return index
+
+    def clear(self):
+        self._parent.clear()
+        self._children.clear()
+        self._edges.clear()
+
+    def _evict_oldest(self):
+        """Drop the oldest edge; its child becomes the root of its subtree"""
+        child = next(iter(self._edges))
+        del self._edges[child]
+        parent = self._parent.pop(child)
+        siblings = self._children[parent]
+        siblings.remove(child)
+        if not siblings:
+            del self._children[parent]
+        self.evicted += 1
+
+    def __len__(self) -> int:
+        """Number of edges"""
+        return len(self._edges)
+
+    def __contains__(self, twin_id: str) -> bool:
+        return twin_id in self._parent or twin_id in self._children
@@ -0,0 +1,137 @@
+"""
+Molecule Twin Memory Benchmark
+Measures the resident footprint of live MoleculeTwin objects per twin
+
+Run as a script to print the per-twin footprint of the current layout next
+to the baseline layout it replaced:
+
+    python molecule_memory_benchmark.py --twins 100000 --steps 5
+    python molecule_memory_benchmark.py --twins 100000 --steps 5 --distinct
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Dict, List
+
+from molecule_property_cache import PropertyCache
+from molecule_twin_model import MoleculeTwin, ProcessConditions, _random_properties
+
+IBUPROFEN = "CC(C)CC1=CC=C(C=C1)C(C)C(=O)O"
+LAYOUTS = ("current", "baseline")
+
+# Chain atoms used to spell a distinct molecule per twin
+_CHAIN_ATOMS = ("C", "N", "O", "S")
+
+
+class _StepList(list):
+    """Plain list of step dicts, as the baseline twin kept its history"""
+
+    def append_step(self, record: Dict, timestamp):
+        self.append(record)
+
+
+class _BaselineTwin(MoleculeTwin):
+    """MoleculeTwin laid out as before the memory work
+
+    No ``__slots__`` (so every twin has a ``__dict__``), process history as
+    a list of dicts and a private property record drawn per twin.
+    """
+
+    def _init_state(self, *args):
+        super()._init_state(*args)
+        self.process_history = _StepList()
+
+    def _initialize_properties(self):
+        return _random_properties()
+
+
+def distinct_smiles(num_molecules: int) -> List[str]:
+    """``num_molecules`` SMILES of different molecules, all the same length
+
+    Each is a carboxylic acid on a fixed-length chain spelling the index in
+    base 4, so no two strings describe the same molecule.
+    """
+    width = 1
+    while len(_CHAIN_ATOMS) ** width < num_molecules:
+        width += 1
+    smiles = []
+    for index in range(num_molecules):
+        chain = []
+        for _ in range(width):
+            index, digit = divmod(index, len(_CHAIN_ATOMS))
+            chain.append(_CHAIN_ATOMS[digit])
+        smiles.append("OC(=O)" + "".join(chain))
+    return smiles
+
+
+def measure_twin_footprint(num_twins: int = 10000, steps: int = 0, layout: str = "current",
+                           distinct_molecules: bool = False) -> Dict[str, float]:
+    """Bytes allocated per live twin, optionally after some process steps
+
+    ``layout`` is ``"current"`` or ``"baseline"`` (see _BaselineTwin). With
+    ``distinct_molecules`` every twin gets its own SMILES, so no property
+    record is shared; otherwise all twins are ibuprofen lots. Current-layout
+    twins use a fresh property cache, so records cached by earlier runs are
+    not reused. Only allocations made while the twins are created and
+    stepped are counted, so the shared ProcessConditions and module state
+    are excluded.
+    """
+    if layout == "current":
+        twin_class = type("_MeasuredTwin", (MoleculeTwin,),
+                          {"__slots__": (), "property_cache": PropertyCache(max(num_twins, 1))})
+    elif layout == "baseline":
+        twin_class = _BaselineTwin
+    else:
+        raise ValueError(f"layout must be one of {LAYOUTS}")
+
+    conditions = ProcessConditions(
+        temperature=25.0, pressure=1.0, ph=7.0, humidity=45.0,
+        light_exposure=100.0, oxygen_level=21.0, mixing_speed=200.0, reaction_time=30.0
+    )
+    smiles = distinct_smiles(num_twins) if distinct_molecules else [IBUPROFEN] * num_twins
+    gc.collect()
+    tracemalloc.start()
+    try:
+        twins = [twin_class(smiles[i], f"Lot-{i}") for i in range(num_twins)]
+        created, _ = tracemalloc.get_traced_memory()
+        for twin in twins:
+            for _ in range(steps):
+                twin.simulate_process_step(conditions, duration=30)
+        stepped, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "layout": layout,
+        "distinct_molecules": distinct_molecules,
+        "twins": num_twins,
+        "steps": steps,
+        "bytes_per_twin": created / num_twins,
+        "bytes_per_twin_after_steps": stepped / num_twins,
+        "bytes_per_step": (stepped - created) / (num_twins * steps) if steps else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-twin memory footprint of MoleculeTwin")
+    parser.add_argument("--twins", type=int, default=10000)
+    parser.add_argument("--steps", type=int, default=5)
+    parser.add_argument("--layout", choices=LAYOUTS + ("both",), default="both")
+    parser.add_argument("--distinct", action="store_true",
+                        help="give every twin its own molecule instead of sharing one")
+    args = parser.parse_args()
+
+    layouts = LAYOUTS if args.layout == "both" else (args.layout,)
+    molecules = "distinct molecules" if args.distinct else "one shared molecule"
+    print(f"{args.twins} twins, {molecules}")
+    for layout in layouts:
+        result = measure_twin_footprint(args.twins, args.steps, layout, args.distinct)
+        print(f"{layout}:")
+        print(f"  per twin:                 {result['bytes_per_twin']:8.0f} bytes")
+        print(f"  per twin after {result['steps']} steps: {result['bytes_per_twin_after_steps']:8.0f} bytes")
+        print(f"  per process step:         {result['bytes_per_step']:8.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Molecular Property Cache
+Size-bounded, SMILES-keyed store of property records shared between molecule twins
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _load_rdkit_chem():
+    """RDKit's Chem module, or None when RDKit is not installed"""
+    try:
+        from rdkit import Chem
+    except ImportError:
+        logger.info("RDKit not available; SMILES are cached verbatim")
+        return None
+    return Chem
+
+
+@contextmanager
+def _rdkit_logs_blocked():
+    """Silence RDKit's log output for the enclosed calls only"""
+    from rdkit import rdBase
+    block = rdBase.BlockLogs()
+    try:
+        yield
+    finally:
+        del block  # Logging is restored when the block is released
+
+
+@lru_cache(maxsize=65536)
+def canonical_smiles(smiles: str) -> str:
+    """Canonical form of a SMILES string used as the cache key
+
+    Uses RDKit's canonical SMILES when RDKit is installed and can parse the
+    string; otherwise the string itself, stripped of surrounding whitespace.
+    """
+    smiles = smiles.strip()
+    chem = _load_rdkit_chem()
+    if chem is not None:
+        # Unparseable strings are expected here; don't let RDKit log them
+        with _rdkit_logs_blocked():
+            molecule = chem.MolFromSmiles(smiles)
+        if molecule is not None:
+            return chem.MolToSmiles(molecule)
+    return smiles
+
+
+class PropertyCache:
+    """LRU cache of property records by canonical SMILES
+
+    Records are shared by every twin of the same molecule, so they must be
+    treated as immutable; derive a new record instead of changing one. At
+    most ``max_entries`` records are kept, least recently used first out.
+    """
+
+    def __init__(self, max_entries: int = 100000):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._records: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, smiles: str) -> Optional[Any]:
+        key = canonical_smiles(smiles)
+        record = self._records.get(key)
+        if record is None:
+            self.misses += 1
+            return None
+        self._records.move_to_end(key)
+        self.hits += 1
+        return record
+
+    def put(self, smiles: str, record: Any):
+        self._store(canonical_smiles(smiles), record)
+
+    def get_or_create(self, smiles: str, create: Callable[[], Any]) -> Any:
+        """Cached record for ``smiles``, calling ``create`` on a miss"""
+        record = self.get(smiles)
+        if record is None:
+            record = create()
+            self.put(smiles, record)
+        return record
+
+    def get_many(self, smiles_list: Sequence[str], create_many: Callable[[List[str]], List[Any]]) -> List[Any]:
+        """Records for many SMILES, creating every missing one in a single call
+
+        ``create_many(keys)`` must return one new record per key; it is
+        called once with the canonical SMILES of the distinct uncached
+        molecules.
+        """
+        keys = [canonical_smiles(smiles) for smiles in smiles_list]
+        found: Dict[Hashable, Any] = {}
+        missing: List[Hashable] = []
+        for key in keys:
+            if key in found:
+                continue
+            record = self._records.get(key)
+            if record is None:
+                found[key] = None
+                missing.append(key)
+            else:
+                self._records.move_to_end(key)
+                found[key] = record
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            # Missing keys are new, so updating appends them as most recently used
+            created = dict(zip(missing, create_many(missing)))
+            found.update(created)
+            self._records.update(created)
+            self._trim()
+        return [found[key] for key in keys]
+
+    def clear(self):
+        self._records.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and hit/miss counters"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._records),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, smiles: str) -> bool:
+        return canonical_smiles(smiles) in self._records
+
+    def _store(self, key: Hashable, record: Any):
+        self._records[key] = record
+        self._records.move_to_end(key)
+        self._trim()
+
+    def _trim(self):
+        while len(self._records) > self.max_entries:
+            self._records.popitem(last=False)
@@ -4,13 +4,20 @@ Handles molecular structure simulation and property prediction
 """
 
 import numpy as np
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, fields, replace
+from typing import List, Dict, Optional, Tuple, Iterable, Mapping, Union
 from enum import Enum
+from types import MappingProxyType
 import hashlib
+import itertools
 import json
 from datetime import datetime
 
+from process_history import ProcessHistory, DEFAULT_CAPACITY
+from molecule_property_cache import PropertyCache, canonical_smiles
+from molecule_lineage import LineageIndex
+from degradation_kinetics import arrhenius_model, stability_index
+
 class MolecularState(Enum):
     """Possible states of a molecule in the manufacturing process"""
     RAW_MATERIAL = "raw_material"
@@ -20,22 +27,67 @@ class MolecularState(Enum):
     FINAL_PRODUCT = "final_product"
     DEGRADED = "degraded"
 
-@dataclass
+# Dict-valued MolecularProperty fields, held as read-only mappings
+MAPPING_PROPERTY_FIELDS = ("solubility", "stability_profile", "toxicity_profile")
+
+# Edges kept by the class-level MoleculeTwin.lineage index
+DEFAULT_LINEAGE_EDGES = 100000
+
+# Per-process twin counter mixed into generated ids
+_twin_sequence = itertools.count()
+
+# The model classes declare __slots__ so that large twin populations carry no
+# per-instance __dict__; use to_dict() where a plain mapping is needed.
+
+@dataclass(frozen=True)
 class MolecularProperty:
-    """Properties of a molecule relevant to pharmaceutical manufacturing"""
+    """Properties of a molecule relevant to pharmaceutical manufacturing
+    
+    Records are shared between twins of the same molecule through the
+    property cache, so they are frozen all the way down: dict fields are
+    stored as read-only mappings and ``pka_values`` as a tuple. Use
+    ``dataclasses.replace`` to derive a modified record.
+    """
+    __slots__ = ("molecular_weight", "melting_point", "solubility", "stability_profile", "pka_values",
+                 "logp", "bioavailability", "toxicity_profile", "synthesis_complexity")
     molecular_weight: float
     melting_point: float  # Celsius
-    solubility: Dict[str, float]  # Solvent -> g/L
-    stability_profile: Dict[str, float]  # Condition -> half-life in hours
-    pka_values: List[float]
+    solubility: Mapping[str, float]  # Solvent -> g/L
+    stability_profile: Mapping[str, float]  # Condition -> half-life in hours
+    pka_values: Tuple[float, ...]
     logp: float  # Partition coefficient
     bioavailability: float  # 0-1 scale
-    toxicity_profile: Dict[str, float]  # Target -> IC50
+    toxicity_profile: Mapping[str, float]  # Target -> IC50
     synthesis_complexity: int  # 1-10 scale
 
+    def __post_init__(self):
+        # Private copies behind read-only views, so no caller can change a shared record
+        for name in MAPPING_PROPERTY_FIELDS:
+            object.__setattr__(self, name, MappingProxyType(dict(getattr(self, name))))
+        object.__setattr__(self, "pka_values", tuple(self.pka_values))
+
+    def to_dict(self) -> Dict:
+        """Plain dict of the properties, with mutable copies of the containers"""
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        for name in MAPPING_PROPERTY_FIELDS:
+            data[name] = dict(data[name])
+        data["pka_values"] = list(data["pka_values"])
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'MolecularProperty':
+        return cls(**{f.name: data[f.name] for f in fields(cls)})
+    
+    def __reduce__(self):
+        # Frozen slotted instances cannot be restored attribute by attribute,
+        # and read-only mappings cannot be pickled, so rebuild from plain values
+        return self.__class__.from_dict, (self.to_dict(),)
+
 @dataclass
 class ProcessConditions:
     """Manufacturing process conditions"""
+    __slots__ = ("temperature", "pressure", "ph", "humidity", "light_exposure", "oxygen_level",
+                 "mixing_speed", "reaction_time")
     temperature: float  # Celsius
     pressure: float  # Bar
     ph: float
@@ -45,39 +97,101 @@ class ProcessConditions:
     mixing_speed: float  # RPM
     reaction_time: float  # Minutes
 
+    def to_dict(self) -> Dict[str, float]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+PROCESS_CONDITION_FIELDS = tuple(f.name for f in fields(ProcessConditions))
+
+# Recommendation -> (condition field, threshold, advice above threshold, advice otherwise)
+STORAGE_RECOMMENDATIONS = {
+    "temperature": ("temperature", 25, "Store at 2-8°C", "Store at controlled room temperature"),
+    "humidity": ("humidity", 60, "Store in tight container", "Normal storage"),
+    "light": ("light_exposure", 100, "Protect from light", "No special light protection needed"),
+    "packaging": ("humidity", 70, "Use moisture-barrier packaging", "Standard packaging acceptable")
+}
+
 class MoleculeTwin:
     """Digital twin for pharmaceutical molecules"""
     
-    def __init__(self, smiles: str, name: str, cas_number: Optional[str] = None):
+    __slots__ = ("smiles", "name", "cas_number", "id", "state", "properties",
+                 "process_history", "quality_metrics", "stability_data")
+    
+    # Property records shared by every twin of the same canonical SMILES
+    property_cache = PropertyCache()
+    # Parent -> product edges of apply_transformation calls not given their own index
+    lineage = LineageIndex(max_edges=DEFAULT_LINEAGE_EDGES)
+    # Degradation model, shared with MoleculeFleet; a subclass can use another activation energy
+    kinetics = arrhenius_model()
+
+    def __init__(self, smiles: str, name: str, cas_number: Optional[str] = None,
+                 history_capacity: int = DEFAULT_CAPACITY, history_spill_path: Optional[str] = None):
+        self._init_state(smiles, name, cas_number, history_capacity, history_spill_path)
+        self.id = self._generate_id()
+        self.properties = self._initialize_properties()
+    
+    def _init_state(self, smiles: str, name: str, cas_number: Optional[str],
+                    history_capacity: int, history_spill_path: Optional[str]):
+        """Set everything a new twin starts with apart from its id and properties"""
         self.smiles = smiles
         self.name = name
         self.cas_number = cas_number
-        self.id = self._generate_id()
         self.state = MolecularState.RAW_MATERIAL
-        self.properties = self._initialize_properties()
-        self.process_history: List[Dict] = []
+        # Keeps the latest history_capacity records; older ones spill to history_spill_path if set
+        self.process_history = ProcessHistory(PROCESS_CONDITION_FIELDS, history_capacity, history_spill_path)
         self.quality_metrics: Dict[str, float] = {}
         self.stability_data: List[Dict] = []
+    
+    @classmethod
+    def from_many(cls, records: Iterable[Union[Tuple, Mapping]], seed: Optional[int] = None,
+                  namespace: str = "", history_capacity: int = DEFAULT_CAPACITY) -> List['MoleculeTwin']:
+        """Create many twins at once with deterministic ids and bulk-drawn properties
+        
+        Each record is a ``(smiles, name[, cas_number])`` tuple or a mapping
+        with those keys. Ids are ``stable_twin_id`` hashes, so the same
+        records in the same ``namespace`` always get the same ids; repeats of
+        a record within one call are told apart by their occurrence count.
+        New property records follow the same distributions as
+        ``_initialize_properties`` and are drawn for all molecules in one
+        vectorized pass. Without a ``seed`` they are shared records from
+        ``property_cache``, and only uncached molecules get new ones (seeded
+        from the global NumPy RNG). With a ``seed`` each molecule's record
+        depends only on the seed and its canonical SMILES, so the cache is
+        bypassed and a molecule gets the same properties whatever else is
+        cached or in the call.
+        """
+        materials = [_material_fields(record) for record in records]
+        smiles_list = [smiles for smiles, _, _ in materials]
+        if seed is None:
+            seed = _global_seed()
+            properties = cls.property_cache.get_many(smiles_list, lambda keys: _draw_properties(keys, seed))
+        else:
+            keys = [canonical_smiles(smiles) for smiles in smiles_list]
+            unique_keys = list(dict.fromkeys(keys))
+            drawn = dict(zip(unique_keys, _draw_properties(unique_keys, seed)))
+            properties = [drawn[key] for key in keys]
+        
+        occurrences: Dict[Tuple, int] = {}
+        twins = []
+        for material, twin_properties in zip(materials, properties):
+            occurrence = occurrences.get(material, 0)
+            occurrences[material] = occurrence + 1
+            
+            twin = cls.__new__(cls)
+            twin._init_state(*material, history_capacity, None)
+            twin.id = stable_twin_id(namespace, *material, occurrence=occurrence)
+            twin.properties = twin_properties
+            twins.append(twin)
+        return twins
         
     def _generate_id(self) -> str:
         """Generate unique ID for the molecule twin"""
-        data = f"{self.smiles}_{self.name}_{datetime.utcnow().isoformat()}"
+        # The sequence number keeps twins made within one clock tick apart
+        data = f"{self.smiles}_{self.name}_{datetime.utcnow().isoformat()}_{next(_twin_sequence)}"
         return hashlib.sha256(data.encode()).hexdigest()[:16]
     
     def _initialize_properties(self) -> MolecularProperty:
-        """Initialize molecular properties (in real implementation, would use cheminformatics)"""
-        # Placeholder - in production, integrate with RDKit or similar
-        return MolecularProperty(
-            molecular_weight=np.random.uniform(150, 500),
-            melting_point=np.random.uniform(50, 250),
-            solubility={"water": np.random.uniform(0.1, 100), "ethanol": np.random.uniform(1, 500)},
-            stability_profile={"25C_60RH": np.random.uniform(720, 8760)},  # hours
-            pka_values=[np.random.uniform(2, 12) for _ in range(np.random.randint(1, 3))],
-            logp=np.random.uniform(-2, 5),
-            bioavailability=np.random.uniform(0.1, 0.9),
-            toxicity_profile={"hERG": np.random.uniform(0.1, 100)},
-            synthesis_complexity=np.random.randint(1, 10)
-        )
+        """Shared property record for this molecule, created on first sight of its SMILES"""
+        return self.property_cache.get_or_create(self.smiles, _random_properties)
     
     def simulate_process_step(self, conditions: ProcessConditions, duration: float) -> Dict:
         """Simulate the effect of a process step on the molecule"""
@@ -95,44 +209,25 @@ class MoleculeTwin:
         # Update quality metrics
         self.quality_metrics["purity"] = max(0, initial_purity - purity_loss)
         self.quality_metrics["yield"] = initial_yield * yield_factor
-        self.quality_metrics["stability_index"] = self._calculate_stability_index(conditions)
+        self.quality_metrics["stability_index"] = self._calculate_stability_index(conditions, degradation_rate)
         
         # Log process step
+        now = datetime.utcnow()
         process_record = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "conditions": conditions.__dict__,
+            "timestamp": now.isoformat(),
+            "conditions": conditions.to_dict(),
             "duration_minutes": duration,
             "quality_metrics": self.quality_metrics.copy(),
             "degradation_rate": degradation_rate
         }
-        self.process_history.append(process_record)
+        self.process_history.append_step(process_record, now)
         
         return process_record
     
     def _calculate_degradation_rate(self, conditions: ProcessConditions) -> float:
         """Calculate degradation rate based on Arrhenius equation and stress factors"""
-        # Simplified Arrhenius model
-        reference_temp = 25.0  # Celsius
-        activation_energy = 80000  # J/mol (typical for drug degradation)
-        gas_constant = 8.314  # J/(mol·K)
-        
-        # Temperature factor
-        temp_k = conditions.temperature + 273.15
-        ref_temp_k = reference_temp + 273.15
-        temp_factor = np.exp(activation_energy / gas_constant * (1/ref_temp_k - 1/temp_k))
-        
-        # pH factor (assuming optimal pH of 7)
-        ph_factor = 1 + 0.1 * abs(conditions.ph - 7)
-        
-        # Humidity factor
-        humidity_factor = 1 + 0.01 * (conditions.humidity - 60) if conditions.humidity > 60 else 1
-        
-        # Light factor
-        light_factor = 1 + 0.0001 * conditions.light_exposure
-        
-        # Combined degradation rate (% per hour)
-        base_rate = 0.01  # 0.01% per hour at reference conditions
-        return base_rate * temp_factor * ph_factor * humidity_factor * light_factor
+        return self.kinetics.rate(conditions.temperature, conditions.ph,
+                                  conditions.humidity, conditions.light_exposure)
     
     def _calculate_process_efficiency(self, conditions: ProcessConditions) -> float:
         """Calculate process efficiency based on conditions"""
@@ -171,20 +266,16 @@ class MoleculeTwin:
         
         return efficiency
     
-    def _calculate_stability_index(self, conditions: ProcessConditions) -> float:
-        """Calculate stability index (0-100) based on current conditions"""
-        degradation_rate = self._calculate_degradation_rate(conditions)
+    def _calculate_stability_index(self, conditions: ProcessConditions,
+                                   degradation_rate: Optional[float] = None) -> float:
+        """Calculate stability index (0-100) based on current conditions
         
-        # Convert degradation rate to stability index
-        # 0.01% per hour = stability index of 95
-        # 0.1% per hour = stability index of 50
-        # 1% per hour = stability index of 0
-        if degradation_rate <= 0.01:
-            return 95 + 5 * (0.01 - degradation_rate) / 0.01
-        elif degradation_rate <= 0.1:
-            return 50 + 45 * (0.1 - degradation_rate) / 0.09
-        else:
-            return max(0, 50 * (1 - degradation_rate) / 0.9)
+        Pass ``degradation_rate`` when it has already been computed for
+        ``conditions`` to avoid working it out again.
+        """
+        if degradation_rate is None:
+            degradation_rate = self._calculate_degradation_rate(conditions)
+        return stability_index(degradation_rate)
     
     def predict_shelf_life(self, storage_conditions: ProcessConditions, 
                           acceptance_criteria: Dict[str, float]) -> Tuple[float, Dict]:
@@ -205,7 +296,7 @@ class MoleculeTwin:
         stability_profile = {
             "predicted_shelf_life_months": round(shelf_life_months, 1),
             "degradation_rate_per_month": degradation_rate * 24 * 30,
-            "stability_index": self._calculate_stability_index(storage_conditions),
+            "stability_index": self._calculate_stability_index(storage_conditions, degradation_rate),
             "critical_quality_attributes": {
                 "purity": {
                     "initial": current_purity,
@@ -218,13 +309,23 @@ class MoleculeTwin:
         
         return shelf_life_months, stability_profile
     
+    def predict_shelf_life_grid(self, storage_conditions, acceptance_criteria: Dict[str, float]) -> Dict:
+        """Shelf life over many storage conditions at once
+
+        ``storage_conditions`` is anything ``molecule_fleet.condition_columns``
+        accepts, typically a ``condition_grid``. See
+        ``molecule_fleet.predict_shelf_life_grid`` for the returned arrays.
+        """
+        from molecule_fleet import predict_shelf_life_grid
+        return predict_shelf_life_grid(storage_conditions, acceptance_criteria,
+                                       current_purity=self.quality_metrics.get("purity", 99.9),
+                                       kinetics=self.kinetics)
+    
     def _generate_storage_recommendations(self, conditions: ProcessConditions) -> Dict:
         """Generate storage recommendations based on stability data"""
         recommendations = {
-            "temperature": "Store at 2-8°C" if conditions.temperature > 25 else "Store at controlled room temperature",
-            "humidity": "Store in tight container" if conditions.humidity > 60 else "Normal storage",
-            "light": "Protect from light" if conditions.light_exposure > 100 else "No special light protection needed",
-            "packaging": "Use moisture-barrier packaging" if conditions.humidity > 70 else "Standard packaging acceptable"
+            key: above if getattr(conditions, field) > threshold else otherwise
+            for key, (field, threshold, above, otherwise) in STORAGE_RECOMMENDATIONS.items()
         }
         return recommendations
     
@@ -236,45 +337,163 @@ class MoleculeTwin:
             "name": self.name,
             "cas_number": self.cas_number,
             "state": self.state.value,
-            "properties": {
-                "molecular_weight": self.properties.molecular_weight,
-                "melting_point": self.properties.melting_point,
-                "solubility": self.properties.solubility,
-                "stability_profile": self.properties.stability_profile,
-                "pka_values": self.properties.pka_values,
-                "logp": self.properties.logp,
-                "bioavailability": self.properties.bioavailability,
-                "toxicity_profile": self.properties.toxicity_profile,
-                "synthesis_complexity": self.properties.synthesis_complexity
-            },
+            "properties": self.properties.to_dict(),
             "quality_metrics": self.quality_metrics,
             "process_history": self.process_history[-10:],  # Last 10 process steps
             "timestamp": datetime.utcnow().isoformat()
         }
     
     def apply_transformation(self, reaction_type: str, reagents: List[str], 
-                           conditions: ProcessConditions) -> 'MoleculeTwin':
-        """Apply chemical transformation and create new molecule twin"""
+                           conditions: ProcessConditions,
+                           lineage: Optional[LineageIndex] = None) -> 'MoleculeTwin':
+        """Apply chemical transformation and create new molecule twin
+        
+        The parent -> product edge is recorded in ``lineage``, or in the
+        class-level ``lineage`` index if none is given.
+        """
         # In production, this would use reaction prediction models
         # For now, create a modified version
         new_smiles = f"{self.smiles}_modified_{reaction_type}"
         new_name = f"{self.name}_{reaction_type}_product"
         
-        new_twin = MoleculeTwin(new_smiles, new_name)
+        # The product keeps the parent's class, and with it any overridden kinetics
+        new_twin = type(self)(new_smiles, new_name, history_capacity=self.process_history.capacity)
         new_twin.state = MolecularState.INTERMEDIATE
         
         # Transfer some properties with modifications
-        new_twin.properties.molecular_weight = self.properties.molecular_weight * 1.1
-        new_twin.properties.synthesis_complexity = min(10, self.properties.synthesis_complexity + 1)
+        new_twin.properties = replace(
+            new_twin.properties,
+            molecular_weight=self.properties.molecular_weight * 1.1,
+            synthesis_complexity=min(10, self.properties.synthesis_complexity + 1)
+        )
+        self.property_cache.put(new_smiles, new_twin.properties)
         
         # Log transformation
         transformation_record = {
             "parent_id": self.id,
             "reaction_type": reaction_type,
             "reagents": reagents,
-            "conditions": conditions.__dict__,
+            "conditions": conditions.to_dict(),
             "timestamp": datetime.utcnow().isoformat()
         }
         new_twin.process_history.append(transformation_record)
+        if lineage is None:
+            lineage = self.lineage
+        lineage.record(self.id, new_twin.id, reaction_type, transformation_record["timestamp"])
         
-        return new_twin
\ No newline at end of file
+        return new_twin
+
+
+def stable_twin_id(namespace: str, smiles: str, name: str, cas_number: Optional[str] = None,
+                   occurrence: int = 0) -> str:
+    """Deterministic 16-character twin id for a material within a namespace"""
+    data = "\x1f".join((namespace, smiles, name, cas_number or "", str(occurrence)))
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+def _material_fields(record: Union[Tuple, Mapping]) -> Tuple[str, str, Optional[str]]:
+    """(smiles, name, cas_number) of a from_many record"""
+    if isinstance(record, tuple):
+        if len(record) == 3:
+            return record
+        if len(record) == 2:
+            return (*record, None)
+        raise ValueError(f"Expected (smiles, name[, cas_number]), got {record!r}")
+    if isinstance(record, Mapping):
+        return record["smiles"], record["name"], record.get("cas_number")
+    return _material_fields(tuple(record))
+
+
+# Uniform variates drawn per molecule by _draw_properties, one per random field
+PROPERTY_DRAWS = 12
+
+# Slot descriptors' setters in __slots__ order; they bypass the frozen __setattr__
+_PROPERTY_SLOT_SETTERS = tuple(vars(MolecularProperty)[name].__set__ for name in MolecularProperty.__slots__)
+
+
+def _random_properties() -> MolecularProperty:
+    """Initialize molecular properties (in real implementation, would use cheminformatics)"""
+    # Placeholder - in production, integrate with RDKit or similar
+    return MolecularProperty(
+        molecular_weight=np.random.uniform(150, 500),
+        melting_point=np.random.uniform(50, 250),
+        solubility={"water": np.random.uniform(0.1, 100), "ethanol": np.random.uniform(1, 500)},
+        stability_profile={"25C_60RH": np.random.uniform(720, 8760)},  # hours
+        pka_values=[np.random.uniform(2, 12) for _ in range(np.random.randint(1, 3))],
+        logp=np.random.uniform(-2, 5),
+        bioavailability=np.random.uniform(0.1, 0.9),
+        toxicity_profile={"hERG": np.random.uniform(0.1, 100)},
+        synthesis_complexity=np.random.randint(1, 10)
+    )
+
+
+def _global_seed() -> int:
+    """A seed drawn from the global NumPy RNG"""
+    return int(np.random.randint(np.iinfo(np.int64).max, dtype=np.int64))
+
+
+# SplitMix64 constants, used to expand one hash per molecule into its draws
+_SPLITMIX_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_SPLITMIX_MULTIPLIERS = (np.uint64(0xBF58476D1CE4E5B9), np.uint64(0x94D049BB133111EB))
+
+
+def _molecule_uniforms(keys: List[str], seed: int) -> np.ndarray:
+    """(len(keys), PROPERTY_DRAWS) uniforms in [0, 1), fixed by the seed and each key
+    
+    Each key is hashed once, with a 64-bit BLAKE2b digest of the seed and
+    the key, and the SplitMix64 sequence from that hash gives its row, so a
+    molecule's draws do not depend on which other molecules are drawn with it.
+    """
+    prefix = f"{seed}\x1f".encode()
+    data = b"".join(hashlib.blake2b(prefix + key.encode(), digest_size=8).digest() for key in keys)
+    state = np.frombuffer(data, dtype="<u8").astype(np.uint64)[:, None]
+    bits = state + _SPLITMIX_GAMMA * np.arange(1, PROPERTY_DRAWS + 1, dtype=np.uint64)
+    first, second = _SPLITMIX_MULTIPLIERS
+    bits = (bits ^ (bits >> np.uint64(30))) * first
+    bits = (bits ^ (bits >> np.uint64(27))) * second
+    bits ^= bits >> np.uint64(31)
+    return (bits >> np.uint64(11)) * 2.0 ** -53  # Top 53 bits, as NumPy's generators do
+
+
+def _draw_properties(keys: List[str], seed: int) -> List[MolecularProperty]:
+    """Placeholder properties for molecules with the given canonical SMILES"""
+    count = len(keys)
+    draws = _molecule_uniforms(keys, seed)
+    
+    def uniform(column: int, low: float, high: float) -> List[float]:
+        return (low + (high - low) * draws[:, column]).tolist()
+    
+    def integers(column: int, low: int, high: int) -> List[int]:
+        return (low + np.floor((high - low) * draws[:, column])).astype(int).tolist()
+    
+    molecular_weight = uniform(0, 150, 500)
+    melting_point = uniform(1, 50, 250)
+    solubility = [MappingProxyType({"water": water, "ethanol": ethanol})
+                  for water, ethanol in zip(uniform(2, 0.1, 100), uniform(3, 1, 500))]
+    stability = [MappingProxyType({"25C_60RH": hours}) for hours in uniform(4, 720, 8760)]
+    pka = [tuple(row[:pka_count]) for row, pka_count in
+           zip(np.column_stack((uniform(6, 2, 12), uniform(7, 2, 12))).tolist(), integers(5, 1, 3))]
+    logp = uniform(8, -2, 5)
+    bioavailability = uniform(9, 0.1, 0.9)
+    toxicity = [MappingProxyType({"hERG": ic50}) for ic50 in uniform(10, 0.1, 100)]
+    complexity = integers(11, 1, 10)
+    
+    # The containers above are already private and read-only, so records
+    # are filled slot by slot, skipping __init__ and the __post_init__ copies
+    (set_weight, set_melting_point, set_solubility, set_stability, set_pka,
+     set_logp, set_bioavailability, set_toxicity, set_complexity) = _PROPERTY_SLOT_SETTERS
+    new_record = MolecularProperty.__new__
+    records = []
+    for i in range(count):
+        record = new_record(MolecularProperty)
+        set_weight(record, molecular_weight[i])
+        set_melting_point(record, melting_point[i])
+        set_solubility(record, solubility[i])
+        set_stability(record, stability[i])
+        set_pka(record, pka[i])
+        set_logp(record, logp[i])
+        set_bioavailability(record, bioavailability[i])
+        set_toxicity(record, toxicity[i])
+        set_complexity(record, complexity[i])
+        records.append(record)
+    return records
@@ -0,0 +1,218 @@
+"""
+Columnar Process History
+Bounded store of a molecule twin's process records with optional on-disk spill
+"""
+
+import numpy as np
+import json
+from functools import lru_cache
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Sequence, Iterator, Union, Any
+
+# Process steps are stored as one row of a structured array: the step's
+# conditions, duration, degradation rate and resulting quality metrics.
+# Any other record (e.g. a transformation) keeps its dict and gets a row of
+# kind EVENT so ordering is preserved. Rows are rebuilt into the original
+# dicts on access, so the store reads like the list it replaces.
+
+STEP, EVENT = 0, 1
+DEFAULT_CAPACITY = 1000
+INITIAL_ROWS = 4  # Storage grows by doubling up to the capacity
+
+STEP_KEYS = frozenset(("timestamp", "conditions", "duration_minutes", "quality_metrics", "degradation_rate"))
+METRIC_FIELDS = ("purity", "yield", "stability_index")
+NUMBER_TYPES = (int, float, np.integer, np.floating)
+
+# Timestamps are written as integer microseconds, which NumPy stores
+# directly; converting datetime objects to datetime64 is several times slower
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+@lru_cache(maxsize=None)
+def history_dtype(condition_fields: Sequence[str]) -> np.dtype:
+    """Row layout for process steps under the given condition fields"""
+    return np.dtype(
+        [("sequence", np.int64), ("kind", np.int8), ("timestamp", "datetime64[us]"),
+         ("duration_minutes", np.float64), ("degradation_rate", np.float64)]
+        + [(name, np.float64) for name in METRIC_FIELDS]
+        + [(name, np.float64) for name in condition_fields]
+    )
+
+
+class ProcessHistory:
+    """List-like process history backed by preallocated NumPy columns
+
+    At most ``capacity`` records are retained. When the store is full the
+    oldest quarter is evicted in one block; if ``spill_path`` is set the
+    evicted rows are first appended to that file as raw rows (read them
+    back with ``read_spill``), and evicted non-step records also go, as
+    JSON lines, to ``spill_path + ".events.jsonl"``. Indexing, ``len`` and
+    iteration cover the retained records only; ``appended`` counts every
+    record ever added.
+    """
+
+    __slots__ = ("condition_fields", "dtype", "capacity", "spill_path", "appended", "evicted",
+                 "_rows", "_size", "_events")
+
+    def __init__(self, condition_fields: Sequence[str], capacity: int = DEFAULT_CAPACITY,
+                 spill_path: Optional[str] = None):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.condition_fields = tuple(condition_fields)
+        self.dtype = history_dtype(self.condition_fields)
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.appended = 0
+        self.evicted = 0
+        self._rows: Optional[np.ndarray] = None  # Allocated on first append
+        self._size = 0
+        self._events: Optional[Dict[int, Dict]] = None  # Non-step records by sequence, made on first use
+
+    def append(self, record: Dict[str, Any]):
+        """Add a record, as a step row if it has exactly the step layout"""
+        timestamp = self._step_timestamp(record)
+        if timestamp is not None:
+            self.append_step(record, timestamp)
+            return
+        index = self._next_row()
+        self._rows[index] = (self.appended, EVENT, None) + (0.0,) * (len(self.dtype) - 3)
+        if self._events is None:
+            self._events = {}
+        self._events[self.appended] = record
+        self.appended += 1
+
+    def append_step(self, record: Dict[str, Any], timestamp: datetime):
+        """Add a process step record without checking its layout
+
+        ``timestamp`` is the naive datetime that ``record["timestamp"]`` is
+        the isoformat of, which saves parsing it back.
+        """
+        metrics, conditions = record["quality_metrics"], record["conditions"]
+        index = self._next_row()
+        self._rows[index] = (
+            self.appended, STEP, (timestamp - EPOCH) // MICROSECOND, record["duration_minutes"], record["degradation_rate"],
+            *(metrics[name] for name in METRIC_FIELDS),
+            *(conditions[name] for name in self.condition_fields)
+        )
+        self.appended += 1
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only view of one column over the retained records
+
+        Any metric, condition field, ``timestamp``, ``duration_minutes`` or
+        ``degradation_rate``. Non-step records hold zeros (NaT timestamps);
+        use ``kind`` to mask them out.
+        """
+        if self._rows is None:
+            return np.empty(0, dtype=self.dtype[name])
+        view = self._rows[name][:self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Read-only structured view of the retained records"""
+        if self._rows is None:
+            return np.empty(0, dtype=self.dtype)
+        view = self._rows[:self._size]
+        view.flags.writeable = False
+        return view
+
+    def read_spill(self) -> np.ndarray:
+        """Every row spilled to disk so far, oldest first"""
+        if self.spill_path is None:
+            return np.empty(0, dtype=self.dtype)
+        try:
+            return np.fromfile(self.spill_path, dtype=self.dtype)
+        except FileNotFoundError:
+            return np.empty(0, dtype=self.dtype)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict, List[Dict]]:
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("process history index out of range")
+        return self._record(index)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(self._size):
+            yield self._record(i)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (ProcessHistory, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ProcessHistory({len(self)} of {self.capacity} records, {self.evicted} evicted)"
+
+    def _next_row(self) -> int:
+        """Index of a free row, growing or evicting as needed"""
+        if self._rows is None:
+            self._rows = np.empty(min(INITIAL_ROWS, self.capacity), dtype=self.dtype)
+        elif self._size == len(self._rows):
+            if len(self._rows) < self.capacity:
+                grown = np.empty(min(2 * len(self._rows), self.capacity), dtype=self.dtype)
+                grown[:self._size] = self._rows
+                self._rows = grown
+            else:
+                self._evict(max(1, self.capacity // 4))
+        self._size += 1
+        return self._size - 1
+
+    def _step_timestamp(self, record: Dict[str, Any]) -> Optional[datetime]:
+        """Timestamp of a record that fits a step row exactly, else None"""
+        if record.keys() != STEP_KEYS:
+            return None
+        conditions, metrics = record["conditions"], record["quality_metrics"]
+        if not (isinstance(conditions, dict) and conditions.keys() == set(self.condition_fields)
+                and isinstance(metrics, dict) and metrics.keys() == set(METRIC_FIELDS)):
+            return None
+        values = [record["duration_minutes"], record["degradation_rate"], *conditions.values(), *metrics.values()]
+        if not all(isinstance(v, NUMBER_TYPES) for v in values):
+            return None
+        try:
+            timestamp = datetime.fromisoformat(record["timestamp"])
+        except (TypeError, ValueError):
+            return None
+        # Only naive timestamps that print back identically can be stored as datetime64
+        if timestamp.tzinfo is not None or timestamp.isoformat() != record["timestamp"]:
+            return None
+        return timestamp
+
+    def _record(self, index: int) -> Dict[str, Any]:
+        row = self._rows[index]
+        if row["kind"] == EVENT:
+            return self._events[int(row["sequence"])]
+        values = dict(zip(self.dtype.names, row.item()))
+        return {
+            "timestamp": values["timestamp"].isoformat(),
+            "conditions": {name: values[name] for name in self.condition_fields},
+            "duration_minutes": values["duration_minutes"],
+            "quality_metrics": {name: values[name] for name in METRIC_FIELDS},
+            "degradation_rate": values["degradation_rate"]
+        }
+
+    def _evict(self, count: int):
+        """Drop the oldest ``count`` rows, spilling them first if configured"""
+        block = self._rows[:count]
+        evicted_events = [int(seq) for seq in block["sequence"][block["kind"] == EVENT]]
+        if self.spill_path is not None:
+            with open(self.spill_path, "ab") as f:
+                block.tofile(f)
+            if evicted_events:
+                with open(self.spill_path + ".events.jsonl", "a") as f:
+                    for seq in evicted_events:
+                        f.write(json.dumps({"sequence": seq, "record": self._events[seq]}, default=str) + "\n")
+        for seq in evicted_events:
+            del self._events[seq]
+
+        self._rows[:self._size - count] = self._rows[count:self._size]
+        self._size -= count
+        self.evicted += count
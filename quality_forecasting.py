@@ -5,7 +5,7 @@ AI-powered system for predicting pharmaceutical quality metrics 30+ days in adva
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple, Optional, Union
+from typing import Any, List, Dict, Tuple, Optional, Sequence, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
@@ -15,6 +15,7 @@ import tensorflow as tf
 from tensorflow import keras
 from tensorflow.keras import layers
 import joblib
+import itertools
 import json
 import logging
 import warnings
@@ -89,6 +90,7 @@ class QualityForecastingEngine:
         self.prediction_history = []
         self.model_performance = {}
         self.is_trained = False
+        self._prediction_sequence = itertools.count()  # Keeps ids of one batch distinct
         
         # Initialize models
         self._initialize_models()
@@ -245,78 +247,100 @@ class QualityForecastingEngine:
                 current_quality: Optional[QualityMetrics] = None,
                 forecast_days: int = 30) -> Dict[str, Any]:
         """Predict quality metrics for future timepoints"""
+        return self.predict_batch([(process_params, environmental_data, current_quality)], forecast_days)[0]
+    
+    def predict_batch(self, inputs: Sequence[Tuple[ProcessParameters, EnvironmentalData, Optional[QualityMetrics]]],
+                      forecast_days: int = 30) -> List[Dict[str, Any]]:
+        """Predict quality metrics for many batches at once
+        
+        The feature rows of all inputs are stacked into one matrix, so each
+        model runs once per metric instead of once per metric and row.
+        Returns one result per input, in order, each shaped like ``predict``'s.
+        """
         if not self.is_trained:
             raise ValueError("Model must be trained before making predictions")
+        if not inputs:
+            return []
         
         # Prepare input features
-        features = self._prepare_features(process_params, environmental_data, current_quality)
+        features = np.vstack([
+            self._prepare_features(process_params, environmental_data, current_quality)
+            for process_params, environmental_data, current_quality in inputs
+        ])
         
-        predictions = {}
-        confidence_intervals = {}
-        risk_assessments = {}
+        # Mean prediction and uncertainty of each metric for every row
+        scores = {metric: self._score_metric(metric, features) for metric in self.models.keys()}
         
-        # Generate predictions for each metric
-        for metric in self.models.keys():
-            # Scale features
-            features_scaled = self.scalers[metric].transform(features.reshape(1, -1))
+        results = []
+        for row in range(len(features)):
+            predictions = {}
+            confidence_intervals = {}
+            risk_assessments = {}
             
-            if isinstance(self.models[metric], dict):
-                # Ensemble prediction
-                metric_predictions = []
-                for model_name, model in self.models[metric].items():
-                    if model_name == 'nn':
-                        pred = model.predict(features_scaled, verbose=0).flatten()[0]
-                    else:
-                        pred = model.predict(features_scaled)[0]
-                    metric_predictions.append(pred)
+            for metric, (mean_preds, std_preds) in scores.items():
+                # Generate time series forecast
+                forecast = self._generate_time_series_forecast(
+                    metric, mean_preds[row], std_preds[row], forecast_days
+                )
                 
-                # Calculate mean and uncertainty
-                mean_pred = np.mean(metric_predictions)
-                std_pred = np.std(metric_predictions)
-            else:
-                # Single model prediction
-                mean_pred = self.models[metric].predict(features_scaled)[0]
-                # Estimate uncertainty using model's feature importances
-                std_pred = self._estimate_prediction_uncertainty(metric, features_scaled)
-            
-            # Generate time series forecast
-            forecast = self._generate_time_series_forecast(
-                metric, mean_pred, std_pred, forecast_days
-            )
-            
-            predictions[metric] = forecast
+                predictions[metric] = forecast
+                
+                # Calculate confidence intervals
+                confidence_intervals[metric] = {
+                    'lower_95': forecast['values'] - 1.96 * forecast['uncertainty'],
+                    'upper_95': forecast['values'] + 1.96 * forecast['uncertainty'],
+                    'lower_99': forecast['values'] - 2.58 * forecast['uncertainty'],
+                    'upper_99': forecast['values'] + 2.58 * forecast['uncertainty']
+                }
+                
+                # Risk assessment
+                if metric in self.quality_specifications:
+                    risk_assessments[metric] = self._assess_quality_risk(
+                        forecast, self.quality_specifications[metric]
+                    )
             
-            # Calculate confidence intervals
-            confidence_intervals[metric] = {
-                'lower_95': forecast['values'] - 1.96 * forecast['uncertainty'],
-                'upper_95': forecast['values'] + 1.96 * forecast['uncertainty'],
-                'lower_99': forecast['values'] - 2.58 * forecast['uncertainty'],
-                'upper_99': forecast['values'] + 2.58 * forecast['uncertainty']
+            # Generate overall prediction summary
+            prediction_result = {
+                'prediction_id': self._generate_prediction_id(),
+                'timestamp': datetime.utcnow().isoformat(),
+                'forecast_horizon_days': forecast_days,
+                'predictions': predictions,
+                'confidence_intervals': confidence_intervals,
+                'risk_assessments': risk_assessments,
+                'model_performance': self.model_performance,
+                'feature_importance': self._get_top_features(),
+                'recommendations': self._generate_recommendations(predictions, risk_assessments)
             }
             
-            # Risk assessment
-            if metric in self.quality_specifications:
-                risk_assessments[metric] = self._assess_quality_risk(
-                    forecast, self.quality_specifications[metric]
-                )
+            # Store prediction for tracking
+            self.prediction_history.append(prediction_result)
+            results.append(prediction_result)
         
-        # Generate overall prediction summary
-        prediction_result = {
-            'prediction_id': self._generate_prediction_id(),
-            'timestamp': datetime.utcnow().isoformat(),
-            'forecast_horizon_days': forecast_days,
-            'predictions': predictions,
-            'confidence_intervals': confidence_intervals,
-            'risk_assessments': risk_assessments,
-            'model_performance': self.model_performance,
-            'feature_importance': self._get_top_features(),
-            'recommendations': self._generate_recommendations(predictions, risk_assessments)
-        }
-        
-        # Store prediction for tracking
-        self.prediction_history.append(prediction_result)
-        
-        return prediction_result
+        return results
+    
+    def _score_metric(self, metric: str, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Mean prediction and uncertainty of one metric for each feature row"""
+        features_scaled = self.scalers[metric].transform(features)
+        
+        if isinstance(self.models[metric], dict):
+            # Ensemble prediction
+            metric_predictions = []
+            for model_name, model in self.models[metric].items():
+                if model_name == 'nn':
+                    # Calling the network directly avoids predict()'s per-call setup
+                    pred = np.asarray(model(features_scaled, training=False)).ravel()
+                else:
+                    pred = model.predict(features_scaled)
+                metric_predictions.append(pred)
+            
+            # Calculate mean and uncertainty across the ensemble
+            return np.mean(metric_predictions, axis=0), np.std(metric_predictions, axis=0)
+        
+        # Single model prediction
+        mean_preds = self.models[metric].predict(features_scaled)
+        # Estimate uncertainty using model's feature importances
+        std_pred = self._estimate_prediction_uncertainty(metric, features_scaled)
+        return mean_preds, np.full(len(mean_preds), std_pred)
     
     def _prepare_features(self, process_params: ProcessParameters,
                          environmental_data: EnvironmentalData,
@@ -556,7 +580,8 @@ class QualityForecastingEngine:
     def _generate_prediction_id(self) -> str:
         """Generate unique prediction ID"""
         import hashlib
-        data = f"{self.product_id}_{datetime.utcnow().isoformat()}"
+        # Rows scored in one predict_batch call can share a timestamp
+        data = f"{self.product_id}_{datetime.utcnow().isoformat()}_{next(self._prediction_sequence)}"
         return hashlib.sha256(data.encode()).hexdigest()[:12]
     
     def update_with_actual_data(self, prediction_id: str, 
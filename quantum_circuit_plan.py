@@ -0,0 +1,192 @@
+"""
+Compiled Circuit Plans for Production Process Steps
+Turns process-step lists into fused gate sequences that are cached by route
+"""
+
+import numpy as np
+from typing import List, Dict, Tuple, Optional, Union
+from dataclasses import dataclass
+from functools import lru_cache
+
+from quantum_gate_kernels import (
+    apply_single_qubit_matrix,
+    apply_diagonal,
+    apply_controlled_rotation,
+    apply_crystallization,
+)
+
+# Process step keywords in matching priority order
+STEP_KINDS = ("mixing", "reaction", "purification", "crystallization")
+
+HADAMARD = np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)
+REACTION_ANGLE = np.pi / 4  # Reaction extent
+PURIFICATION_PHASE = np.pi / 6
+
+
+@dataclass(frozen=True)
+class SingleQubitOp:
+    """Fused 2x2 unitary acting on one qubit"""
+    qubit: int
+    matrix: np.ndarray
+
+
+@dataclass(frozen=True)
+class DiagonalOp:
+    """Tensor product of per-qubit diagonal gates, applied as one multiply"""
+    factors: np.ndarray  # (n_qubits, 2)
+
+
+@dataclass(frozen=True)
+class ControlledRotationOp:
+    """Controlled rotation between two qubits"""
+    control: int
+    target: int
+    angle: float
+
+
+@dataclass(frozen=True)
+class CrystallizationOp:
+    """Non-unitary amplitude reweighting; acts as a fusion barrier"""
+
+
+PlanOp = Union[SingleQubitOp, DiagonalOp, ControlledRotationOp, CrystallizationOp]
+
+
+@dataclass(frozen=True)
+class CircuitPlan:
+    """Fused gate sequence for one process route on a fixed register size"""
+    signature: Tuple[str, ...]
+    num_qubits: int
+    operations: Tuple[PlanOp, ...]
+    gate_count: int  # Gates before fusion
+
+    def apply(self, amplitudes: np.ndarray,
+              workspace: Optional[np.ndarray] = None) -> np.ndarray:
+        """Run the plan on a state vector, returning the evolved amplitudes
+
+        The state is evolved in place, ping-ponging between ``amplitudes``
+        and one spare buffer of the same shape (``workspace``, allocated on
+        first use if not given), so peak memory stays at two state vectors
+        however long the route is. The result is returned in whichever
+        buffer holds it last; the other is left holding scratch data.
+        """
+        current, spare = amplitudes, workspace
+        for op in self.operations:
+            if isinstance(op, DiagonalOp):
+                apply_diagonal(current, op.factors, out=current)
+                continue
+            if spare is None:
+                spare = np.empty_like(current)
+            if isinstance(op, SingleQubitOp):
+                apply_single_qubit_matrix(current, op.qubit, op.matrix, out=spare)
+                current, spare = spare, current
+            elif isinstance(op, ControlledRotationOp):
+                apply_controlled_rotation(current, op.control, op.target, op.angle, out=spare)
+                current, spare = spare, current
+            else:
+                apply_crystallization(current, workspace=spare)
+        return current
+
+
+def classify_step(step: str) -> Optional[str]:
+    """Map a free-text process step to its gate kind, or None if it has no gate"""
+    lowered = step.lower()
+    for kind in STEP_KINDS:
+        if kind in lowered:
+            return kind
+    return None
+
+
+def step_signature(process_steps: List[str]) -> Tuple[str, ...]:
+    """Canonical route signature: the gate kinds of the steps, in order"""
+    kinds = (classify_step(step) for step in process_steps)
+    return tuple(kind for kind in kinds if kind is not None)
+
+
+def compile_process_steps(process_steps: List[str], num_qubits: int) -> CircuitPlan:
+    """Compile process steps into a fused circuit plan, reusing cached plans"""
+    return compile_signature(step_signature(process_steps), num_qubits)
+
+
+@lru_cache(maxsize=256)
+def compile_signature(signature: Tuple[str, ...], num_qubits: int) -> CircuitPlan:
+    """Compile a route signature into a fused circuit plan"""
+    compiler = _PlanCompiler(num_qubits)
+    for kind in signature:
+        if kind == "mixing":
+            # Hadamard-like transformation on half the qubits
+            for qubit in range(num_qubits // 2):
+                compiler.single(qubit, HADAMARD)
+        elif kind == "reaction":
+            for control in range(num_qubits - 1):
+                compiler.controlled_rotation(control, control + 1, REACTION_ANGLE)
+        elif kind == "purification":
+            phase_gate = np.diag([1, np.exp(1j * PURIFICATION_PHASE)])
+            for qubit in range(num_qubits):
+                compiler.single(qubit, phase_gate)
+        elif kind == "crystallization":
+            compiler.barrier()
+    return CircuitPlan(signature, num_qubits, compiler.finish(), compiler.gate_count)
+
+
+class _PlanCompiler:
+    """Accumulates pending single-qubit gates per wire and fuses them on flush"""
+
+    def __init__(self, num_qubits: int):
+        self.num_qubits = num_qubits
+        self.pending: Dict[int, np.ndarray] = {}
+        self.operations: List[PlanOp] = []
+        self.gate_count = 0
+
+    def single(self, qubit: int, matrix: np.ndarray):
+        self.gate_count += 1
+        current = self.pending.get(qubit)
+        self.pending[qubit] = matrix if current is None else matrix @ current
+
+    def controlled_rotation(self, control: int, target: int, angle: float):
+        self.gate_count += 1
+        # Gates on other wires commute with this one and can stay pending
+        self._flush([control, target])
+        self.operations.append(ControlledRotationOp(control, target, angle))
+
+    def barrier(self):
+        self.gate_count += 1
+        self._flush(list(self.pending))
+        self.operations.append(CrystallizationOp())
+
+    def finish(self) -> Tuple[PlanOp, ...]:
+        self._flush(list(self.pending))
+        for op in self.operations:
+            for array in vars(op).values():
+                if isinstance(array, np.ndarray):
+                    array.setflags(write=False)
+        return tuple(self.operations)
+
+    def _flush(self, qubits: List[int]):
+        # Pending diagonal gates on untouched wires are flushed too, so all of
+        # them land in the same diagonal multiply
+        qubits = set(qubits) | {
+            qubit for qubit, matrix in self.pending.items() if _is_diagonal(matrix)
+        }
+        diagonal_factors = None
+        for qubit in sorted(qubits):
+            matrix = self.pending.pop(qubit, None)
+            if matrix is None:
+                continue
+            if _is_diagonal(matrix):
+                if diagonal_factors is None:
+                    diagonal_factors = np.ones((self.num_qubits, 2), dtype=complex)
+                diagonal_factors[qubit] = np.diag(matrix)
+            else:
+                self.operations.append(SingleQubitOp(qubit, matrix))
+
+        if diagonal_factors is None:
+            return
+        # Merge with a directly preceding diagonal multiply
+        if self.operations and isinstance(self.operations[-1], DiagonalOp):
+            diagonal_factors = diagonal_factors * self.operations.pop().factors
+        self.operations.append(DiagonalOp(diagonal_factors))
+
+
+def _is_diagonal(matrix: np.ndarray) -> bool:
+    return matrix[0, 1] == 0 and matrix[1, 0] == 0
@@ -1,120 +1,149 @@
-"""Simplified quantum scenario simulator avoiding heavy external dependencies."""
+"""Quantum scenario simulation utilities.
+
+``QuantumScenarioSimulator`` prepares one RY rotation per qubit from a list
+of parameter angles and measures every qubit. The default ``"numpy"``
+backend samples that product state exactly without any quantum SDK. The
+``"qiskit"`` backend runs the same circuit on qiskit-aer; qiskit is imported
+only when that backend is chosen, so importing this module stays cheap.
+
+Counts follow qiskit's convention: qubit 0 is the rightmost character of a
+bitstring, and outcomes that were never observed are omitted.
+"""
 
 from __future__ import annotations
 
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional
+
 import numpy as np
 
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import Aer
+BACKENDS = ("numpy", "qiskit")
 
-class QuantumScenarioSimulator:
-    """Lightweight stand-in for quantum simulations.
 
-    The original implementation relied on qiskit. To keep tests lightweight and
-    self-contained, this version generates pseudo-random measurement counts
-    without executing a real quantum circuit.
-    """
+@lru_cache(maxsize=None)
+def _load_qiskit():
+    """Import qiskit on first use, with a clear error when it is missing"""
+    try:
+        from qiskit import QuantumCircuit, transpile
+        from qiskit.circuit import ParameterVector
+        from qiskit_aer import AerSimulator
+    except ImportError as exc:
+        raise ImportError(
+            "The qiskit backend requires the 'qiskit' and 'qiskit-aer' packages"
+        ) from exc
+    return QuantumCircuit, transpile, AerSimulator, ParameterVector
+
 
-    def __init__(self, num_qubits: int = 4, shots: int = 1024):
+class QuantumScenarioSimulator:
+    """Samples measurement counts of an RY-rotated product state."""
+
+    def __init__(self, num_qubits: int = 4, shots: int = 1024, backend: str = "numpy",
+                 seed: Optional[int] = None):
         if num_qubits <= 0:
             raise ValueError("num_qubits must be positive")
         if shots <= 0:
             raise ValueError("shots must be positive")
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}")
         self.num_qubits = num_qubits
         self.shots = shots
+        self.backend = backend
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+        self._aer = None
+        self._circuit = None  # Transpiled circuit with one angle parameter per qubit
 
     def run_simulation(self, parameters: List[float]) -> Dict[str, int]:
-        """Produce deterministic counts based on supplied parameters.
-"""Quantum scenario simulation utilities.
+        """Measure the state prepared by RY(parameters[i]) on qubit i.
 
-This module originally depended on :mod:`qiskit` for quantum circuit
-simulation.  The test environment used for this kata does not provide a full
-qiskit installation, so importing it would raise an ``ImportError`` during
-test collection.  To keep the public API stable while avoiding a hard
-dependency on qiskit, the import is now optional with a lightweight numpy
-based fallback.  When qiskit is available the original behaviour is preserved;
-otherwise ``run_simulation`` returns pseudo‑random counts that mimic the shape
-of qiskit's output.  This allows unit tests to execute in minimal
-environments without compiling heavy scientific dependencies.
-"""
-
-import numpy as np
+        Args:
+            parameters: Rotation angles in radians, at most one per qubit;
+                        qubits without an angle stay in |0>.
+        Returns:
+            Mapping from bitstring to integer counts summing to ``shots``.
+        """
+        angles = self._angles(parameters)
+        if self.backend == "qiskit":
+            return self._run_qiskit(angles)
 
-try:  # pragma: no cover - exercised indirectly in tests
-    from qiskit import QuantumCircuit, transpile, Aer, execute
-    _HAS_QISKIT = True
-except Exception:  # pragma: no cover - environment may lack qiskit
-    QuantumCircuit = transpile = Aer = execute = None
-    _HAS_QISKIT = False
+        counts = self._rng.multinomial(self.shots, self.probabilities(angles))
+        return self._count_dict(counts)
 
-class QuantumScenarioSimulator:
-    def __init__(self, num_qubits: int = 4):
-        """Create a simulator for a given number of qubits.
+    def run_sweep(self, param_matrix: np.ndarray) -> np.ndarray:
+        """Measure one product state per row of an (M, num_qubits) angle matrix.
 
-        When qiskit is installed, a real ``qasm_simulator`` backend is used.
-        Otherwise, a placeholder backend is created and a simple numpy based
-        simulation is performed when :meth:`run_simulation` is called.
+        Returns an (M, 2**num_qubits) integer count matrix whose rows sum to
+        ``shots``; column j counts the bitstring ``format(j, f"0{n}b")``. The
+        NumPy backend computes every row's distribution and draws all counts
+        in one vectorized pass; the qiskit backend binds one parameterized
+        circuit M times and runs them as a single job.
         """
-
-        self.num_qubits = num_qubits
-        self.backend = None
-        if _HAS_QISKIT:  # pragma: no branch - trivial branch
-            self.backend = Aer.get_backend("qasm_simulator")
-
-        Args:
-            parameters: List of floats representing adjustable parameters.
-                        Length may differ from num_qubits; only the provided
-                        values are used to seed the RNG.
-            parameters: List of floats representing adjustable parameters (length == num_qubits)
-        Returns:
-            Dictionary of measurement counts.
+        angles = self._angles(param_matrix, batched=True)
+        if self.backend == "qiskit":
+            return self._run_qiskit_sweep(angles)
+        return self._rng.multinomial(self.shots, self.probabilities(angles))
+
+    def probabilities(self, angles: np.ndarray) -> np.ndarray:
+        """Exact outcome distribution of the product state, indexed like qiskit.
+
+        Qubit i in RY(theta)|0> reads 1 with probability sin^2(theta / 2) and
+        qubits are independent, so the distribution is a Kronecker product.
+        Qubit 0 is the least significant bit of the basis index. A (M, n)
+        angle matrix gives an (M, 2**n) matrix of distributions.
         """
-        if _HAS_QISKIT and self.backend is not None:
+        angles = np.asarray(angles, dtype=float)
+        one = np.sin(angles / 2) ** 2
+        probabilities = np.ones(angles.shape[:-1] + (1,))
+        for qubit in range(angles.shape[-1]):
+            p_one = one[..., qubit, None, None]
+            factor = np.concatenate([1 - p_one, p_one], axis=-2)
+            probabilities = (factor * probabilities[..., None, :]).reshape(angles.shape[:-1] + (-1,))
+        return probabilities
+
+    def _angles(self, parameters, batched: bool = False) -> np.ndarray:
+        """Angles padded with zeros to one per qubit, as a vector or (M, n) matrix"""
+        values = np.asarray(parameters, dtype=float)
+        values = np.atleast_2d(values) if batched else values.ravel()
+        if values.ndim != (2 if batched else 1):
+            raise ValueError("param_matrix must be a 2-D (M, num_qubits) array")
+        if values.shape[-1] > self.num_qubits:
+            raise ValueError(f"Expected at most {self.num_qubits} parameters, got {values.shape[-1]}")
+        angles = np.zeros(values.shape[:-1] + (self.num_qubits,))
+        angles[..., :values.shape[-1]] = values
+        return angles
+
+    def _qiskit_circuit(self):
+        """Build and transpile the parameterized circuit once per simulator"""
+        if self._circuit is None:
+            QuantumCircuit, transpile, AerSimulator, ParameterVector = _load_qiskit()
+            self._aer = AerSimulator(seed_simulator=self.seed)
+            theta = ParameterVector("theta", self.num_qubits)
             qc = QuantumCircuit(self.num_qubits, self.num_qubits)
-            for i, param in enumerate(parameters):
-                qc.ry(param, i)
+            for i in range(self.num_qubits):
+                qc.ry(theta[i], i)
             qc.barrier()
             qc.measure(range(self.num_qubits), range(self.num_qubits))
-            job = execute(qc, self.backend, shots=1024)
-            result = job.result()
-            counts = result.get_counts(qc)
-            return counts
-
-        # Fallback: generate synthetic bitstring counts using numpy to mimic
-        # qiskit's return structure.  This keeps the interface identical for
-        # downstream code and tests while remaining lightweight.
-        shots = 1024
-        bitstrings = ["".join(np.random.choice(["0", "1"], self.num_qubits)) for _ in range(shots)]
-        counts = {}
-        for bits in bitstrings:
-            counts[bits] = counts.get(bits, 0) + 1
-        qc = QuantumCircuit(self.num_qubits, self.num_qubits)
-        for i, param in enumerate(parameters):
-            qc.ry(param, i)
-        qc.barrier()
-        qc.measure(range(self.num_qubits), range(self.num_qubits))
-        compiled = transpile(qc, self.backend)
-        job = self.backend.run(compiled, shots=1024)
-        result = job.result()
-        counts = result.get_counts()
+            self._circuit = (transpile(qc, self._aer), theta)
+        return self._circuit
+
+    def _run_qiskit_sweep(self, angles: np.ndarray) -> np.ndarray:
+        circuit, theta = self._qiskit_circuit()
+        bound = [circuit.assign_parameters(dict(zip(theta, map(float, row)))) for row in angles]
+        result = self._aer.run(bound, shots=self.shots).result()
+
+        counts = np.zeros((len(angles), 2 ** self.num_qubits), dtype=np.int64)
+        for row in range(len(angles)):
+            for bits, count in result.get_counts(row).items():
+                counts[row, int(bits.replace(" ", ""), 2)] = count
         return counts
 
-        Returns:
-            Mapping from bitstring state to integer counts that sum to `shots`.
-        """
-        # Deterministic seed based on rounded parameters to stabilize across platforms
-        seed = hash(tuple(round(float(p), 6) for p in parameters)) & 0xFFFFFFFF
-        rng = np.random.default_rng(seed=seed)
-
-        # Enumerate computational basis states
-        states = [format(i, f"0{self.num_qubits}b") for i in range(2 ** self.num_qubits)]
-
-        # Random probability simplex and multinomial sampling to ensure sum == shots
-        probs = rng.dirichlet(np.ones(len(states)))
-        counts_array = rng.multinomial(self.shots, probs)
+    def _run_qiskit(self, angles: np.ndarray) -> Dict[str, int]:
+        return self._count_dict(self._run_qiskit_sweep(angles[None, :])[0])
 
-        return {state: int(count) for state, count in zip(states, counts_array)}
+    def _count_dict(self, counts: np.ndarray) -> Dict[str, int]:
+        """Bitstring-keyed counts of the observed outcomes in a count vector"""
+        observed = np.flatnonzero(counts)
+        return {format(index, f"0{self.num_qubits}b"): int(counts[index]) for index in observed}
 
 
 if __name__ == "__main__":  # pragma: no cover
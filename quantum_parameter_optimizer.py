@@ -0,0 +1,147 @@
+"""
+Production Parameter Optimizer
+Memoized, warm-started L-BFGS-B over the yield/purity/time factors of a simulation
+"""
+
+import numpy as np
+from typing import Dict, List, Tuple, Optional, Any
+from collections import OrderedDict
+from scipy.optimize import minimize
+import logging
+
+logger = logging.getLogger(__name__)
+
+# yield, purity and time factors
+DEFAULT_START = np.array([0.8, 0.9, 1.0])
+FACTOR_BOUNDS = [(0.5, 1.0), (0.5, 1.0), (0.5, 2.0)]
+
+
+def production_cost(params: np.ndarray, yield_target: float, purity_target: float,
+                    entanglement: float) -> float:
+    """Cost balancing yield, purity and time, favouring entangled states"""
+    yield_factor, purity_factor, time_factor = params
+    cost = -(
+        0.4 * yield_factor * yield_target +
+        0.4 * purity_factor * purity_target +
+        0.2 * (1 / time_factor)  # Minimize time
+    )
+    return cost + 0.1 * (1 - entanglement)
+
+
+def production_cost_gradient(params: np.ndarray, yield_target: float, purity_target: float,
+                             entanglement: float) -> np.ndarray:
+    """Analytic gradient of production_cost"""
+    return np.array([-0.4 * yield_target, -0.4 * purity_target, 0.2 / params[2] ** 2])
+
+
+class ParameterOptimizer:
+    """Solves the production-factor optimization, reusing earlier solutions
+
+    The cost depends only on the yield and purity targets and the state's
+    entanglement measure, so solutions are memoized on those values, with
+    entanglement rounded to ``entanglement_decimals``. A miss is solved with
+    an analytic gradient, starting from the nearest previously solved point.
+    At most ``max_entries`` solutions are kept, least recently used first out.
+
+    The solved points are also kept in a fixed ``(max_entries, 3)`` array,
+    with an evicted point's row reused for its replacement, so the nearest
+    point search is one vectorized pass rather than a rebuild of the memo.
+    """
+
+    def __init__(self, max_entries: int = 4096, entanglement_decimals: int = 6):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.entanglement_decimals = entanglement_decimals
+        self._solutions: "OrderedDict[Tuple[float, float, float], Tuple[np.ndarray, bool]]" = OrderedDict()
+        self._points = np.empty((max_entries, 3))
+        self._point_keys: List[Tuple[float, float, float]] = []
+        self._point_rows: Dict[Tuple[float, float, float], int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.warm_starts = 0
+        self.function_evaluations = 0
+
+    def optimize(self, quality_targets: Dict[str, float],
+                 entanglement: float) -> Tuple[np.ndarray, bool, float]:
+        """Optimal (yield, purity, time) factors, convergence flag and cost
+
+        The returned cost is evaluated at the exact ``entanglement`` even
+        when the factors come from the memo.
+        """
+        yield_target = quality_targets.get('yield', 0.9)
+        purity_target = quality_targets.get('purity', 0.99)
+        key = (yield_target, purity_target, round(float(entanglement), self.entanglement_decimals))
+
+        solution = self._solutions.get(key)
+        if solution is not None:
+            self._solutions.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+            solution = self._solve(key)
+            self._remember(key, solution)
+
+        params, converged = solution
+        cost = production_cost(params, yield_target, purity_target, entanglement)
+        return params.copy(), converged, cost
+
+    def clear(self):
+        self._solutions.clear()
+        self._point_keys.clear()
+        self._point_rows.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Memo hit/miss counters and solver work"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._solutions),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'warm_starts': self.warm_starts,
+            'function_evaluations': self.function_evaluations,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def __len__(self) -> int:
+        return len(self._solutions)
+
+    def _solve(self, key: Tuple[float, float, float]) -> Tuple[np.ndarray, bool]:
+        x0 = self._warm_start(key)
+        if x0 is None:
+            x0 = DEFAULT_START
+        else:
+            self.warm_starts += 1
+
+        result = minimize(production_cost, x0, args=key, jac=production_cost_gradient,
+                          method='L-BFGS-B', bounds=FACTOR_BOUNDS)
+        self.function_evaluations += result.nfev
+        params = np.asarray(result.x, dtype=float)
+        params.setflags(write=False)
+        return params, bool(result.success)
+
+    def _warm_start(self, key: Tuple[float, float, float]) -> Optional[np.ndarray]:
+        """Solution of the nearest solved (yield, purity, entanglement) point"""
+        if not self._point_keys:
+            return None
+        # Rows fill from the top and evictions reuse their row, so the
+        # occupied rows are always the first len(_point_keys)
+        offsets = self._points[:len(self._point_keys)] - key
+        distances = np.einsum('ij,ij->i', offsets, offsets)
+        params, _ = self._solutions[self._point_keys[int(np.argmin(distances))]]
+        return params
+
+    def _remember(self, key: Tuple[float, float, float], solution: Tuple[np.ndarray, bool]):
+        row = self._point_rows.get(key)
+        if row is None:
+            if len(self._solutions) >= self.max_entries:
+                evicted, _ = self._solutions.popitem(last=False)
+                row = self._point_rows.pop(evicted)
+                self._point_keys[row] = key
+            else:
+                row = len(self._point_keys)
+                self._point_keys.append(key)
+            self._point_rows[key] = row
+            self._points[row] = key
+        self._solutions[key] = solution
@@ -4,15 +4,36 @@ Leverages quantum computing principles for complex pharmaceutical process optimi
 """
 
 import numpy as np
-from typing import List, Dict, Tuple, Optional, Any
-from dataclasses import dataclass
+from typing import List, Dict, Tuple, Optional, Any, Sequence, Iterable, Iterator
+from dataclasses import dataclass, astuple
 from enum import Enum
 import json
 from datetime import datetime, timedelta
 import logging
-from scipy.optimize import minimize
+import operator
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from scipy.stats import norm
 
+from quantum_gate_kernels import (
+    apply_hadamard,
+    apply_phase,
+    apply_controlled_rotation,
+    apply_crystallization,
+    apply_diagonal,
+    num_qubits_for,
+)
+from quantum_result_cache import (
+    SimulationResultCache,
+    scenario_fingerprint,
+    simulation_cache_key,
+)
+from quantum_circuit_plan import compile_process_steps, compile_signature, step_signature
+from quantum_mps import MatrixProductState
+from quantum_parameter_optimizer import ParameterOptimizer
+from quantum_scenario_sweep import ScenarioSweep, score_summary
+from quantum_state_metrics import StateMetrics, state_metrics, normalized_entropy, shannon_entropy
+
 logger = logging.getLogger(__name__)
 
 class QuantumBackend(Enum):
@@ -21,6 +42,12 @@ class QuantumBackend(Enum):
     QISKIT_AER = "qiskit_aer"
     QUANTUM_INSPIRE = "quantum_inspire"
     AWS_BRAKET = "aws_braket"
+    MPS_SIMULATOR = "mps_simulator"
+
+class SimulationPrecision(Enum):
+    """Amplitude precision of state-vector simulation"""
+    DOUBLE = "complex128"
+    SINGLE = "complex64"
 
 @dataclass
 class ProductionScenario:
@@ -34,64 +61,324 @@ class ProductionScenario:
     regulatory_requirements: List[str]
     timeline_days: int
 
+class BasisLabels(Sequence):
+    """Lazy sequence of computational-basis bitstrings for a register
+    
+    Labels are formatted on access, so a 20-qubit state does not carry a
+    million strings just to name the handful of outcomes that were observed.
+    """
+    __slots__ = ('num_qubits',)
+    
+    def __init__(self, num_qubits: int):
+        self.num_qubits = num_qubits
+    
+    def __len__(self) -> int:
+        return 2 ** self.num_qubits
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("basis index out of range")
+        return format(index, f'0{self.num_qubits}b')
+    
+    def index(self, label: str, *args) -> int:
+        if (isinstance(label, str) and len(label) == self.num_qubits
+                and set(label) <= {'0', '1'}):
+            return int(label, 2) if self.num_qubits else 0
+        raise ValueError(f"{label!r} is not a basis label")
+    
+    def __contains__(self, label) -> bool:
+        try:
+            self.index(label)
+        except ValueError:
+            return False
+        return True
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BasisLabels):
+            return self.num_qubits == other.num_qubits
+        return isinstance(other, Sequence) and list(self) == list(other)
+    
+    def __repr__(self) -> str:
+        return f"BasisLabels(num_qubits={self.num_qubits})"
+
 @dataclass
 class QuantumState:
     """Represents a quantum state in the production simulation"""
     amplitudes: np.ndarray
-    basis_labels: List[str]
+    basis_labels: Sequence[str]
     measurement_probabilities: np.ndarray
     entanglement_measure: float
+    metrics: Optional[StateMetrics] = None
+    
+    def label_counts(self, indices: np.ndarray, counts: np.ndarray) -> Dict[str, int]:
+        """Measurement counts keyed by basis label, from an integer-index histogram
+        
+        Only the observed indices are formatted, so the result is proportional
+        to the number of distinct outcomes rather than the state size.
+        """
+        return {self.basis_labels[idx]: count for idx, count in zip(indices, counts)}
+    
+    # Shots per basis state above which one multinomial draw beats inverse-CDF sampling
+    multinomial_shot_ratio = 0.1
+    
+    def sample_counts(self, num_shots: int,
+                      rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Sample basis indices, returning observed indices and their counts
+        
+        Draws from ``rng``, or the global NumPy RNG if it is None. When shots
+        are plentiful relative to the state size the histogram comes from one
+        ``multinomial`` call; otherwise the shots are placed by a single
+        inverse-CDF search, since multinomial costs a binomial draw per state.
+        """
+        sampler = rng if rng is not None else np.random
+        probabilities = _sampling_probabilities(self.measurement_probabilities)
+        
+        if num_shots >= self.multinomial_shot_ratio * len(probabilities):
+            counts = sampler.multinomial(num_shots, probabilities)
+            observed = np.flatnonzero(counts)
+            return observed, counts[observed]
+        
+        uniform = sampler.random(num_shots) if rng is not None else sampler.random_sample(num_shots)
+        cdf = np.cumsum(probabilities)
+        outcomes = np.searchsorted(cdf, uniform * cdf[-1], side='right')
+        return np.unique(outcomes, return_counts=True)
+
+class MPSQuantumState:
+    """QuantumState interface over a matrix product state
+    
+    Dense ``amplitudes`` and ``measurement_probabilities`` are only built on
+    request and only for registers within the state's dense limit; sampling
+    and the entanglement measure work directly on the MPS.
+    """
+    
+    def __init__(self, mps: MatrixProductState, entanglement_measure: float):
+        self.mps = mps
+        self.basis_labels = BasisLabels(mps.num_qubits)
+        self.entanglement_measure = entanglement_measure
+        self.metrics = None
+    
+    @property
+    def amplitudes(self) -> np.ndarray:
+        return self.mps.to_dense()
+    
+    @property
+    def measurement_probabilities(self) -> np.ndarray:
+        return np.abs(self.amplitudes) ** 2
+    
+    label_counts = QuantumState.label_counts
+    
+    def sample_counts(self, num_shots: int,
+                      rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Sample basis indices, returning observed indices and their counts"""
+        outcomes, _ = self.mps.sample(num_shots, rng)
+        return np.unique(outcomes, return_counts=True)
     
 class QuantumProductionSimulator:
-    """Quantum simulator for pharmaceutical production optimization"""
+    """Quantum simulator for pharmaceutical production optimization
+    
+    With ``precision=SimulationPrecision.SINGLE`` state-vector backends run
+    in complex64. Every ``precision_check_interval``-th simulation is then
+    re-evolved in complex128 and its result carries a ``precision_report``
+    comparing the two; ``get_precision_summary`` aggregates recent reports.
+    The MPS backend always runs in double precision.
+    """
     
-    def __init__(self, backend: QuantumBackend = QuantumBackend.NUMPY_SIMULATOR):
+    # Acceptance limits for single-precision runs against the double reference
+    precision_fidelity_tolerance = 1e-5
+    precision_tvd_tolerance = 1e-3
+    
+    def __init__(self, backend: QuantumBackend = QuantumBackend.NUMPY_SIMULATOR,
+                 cache_size: int = 1024, cache_dir: Optional[str] = None,
+                 max_bond_dimension: int = 64,
+                 precision: SimulationPrecision = SimulationPrecision.DOUBLE,
+                 precision_check_interval: int = 10):
         self.backend = backend
+        self.max_bond_dimension = max_bond_dimension  # MPS backend memory budget
+        self.precision = precision
+        self.precision_check_interval = precision_check_interval  # 0 disables checks
+        self.precision_reports = deque(maxlen=256)
+        self._precision_check_counter = 0
         self.qubit_count = 0
         self.circuit_depth = 0
-        self.simulation_cache = {}
+        self.simulation_cache = SimulationResultCache(cache_size, cache_dir)
+        self.parameter_optimizer = ParameterOptimizer()
         self.quantum_advantage_threshold = 0.3  # 30% improvement needed
         
     def initialize_quantum_circuit(self, scenario: ProductionScenario) -> int:
         """Initialize quantum circuit based on production complexity"""
+        self.qubit_count, self.circuit_depth = self._circuit_dimensions(scenario)
+        
+        logger.info(f"Initialized quantum circuit with {self.qubit_count} qubits, depth {self.circuit_depth}")
+        return self.qubit_count
+    
+    def _circuit_dimensions(self, scenario: ProductionScenario) -> Tuple[int, int]:
+        """Qubit count and circuit depth required by a scenario"""
         # Calculate required qubits based on scenario complexity
         material_qubits = int(np.ceil(np.log2(len(scenario.starting_materials) + 1)))
         process_qubits = int(np.ceil(np.log2(len(scenario.process_steps) + 1)))
         quality_qubits = int(np.ceil(np.log2(len(scenario.quality_targets) + 1)))
         
-        self.qubit_count = material_qubits + process_qubits + quality_qubits + 2  # +2 for ancilla
-        self.circuit_depth = 2 * self.qubit_count + len(scenario.process_steps)
-        
-        logger.info(f"Initialized quantum circuit with {self.qubit_count} qubits, depth {self.circuit_depth}")
-        return self.qubit_count
+        qubit_count = material_qubits + process_qubits + quality_qubits + 2  # +2 for ancilla
+        circuit_depth = 2 * qubit_count + len(scenario.process_steps)
+        return qubit_count, circuit_depth
     
     def simulate_production_scenario(self, scenario: ProductionScenario, 
-                                   num_shots: int = 1000) -> Dict[str, Any]:
-        """Run quantum simulation of production scenario"""
+                                   num_shots: int = 1000,
+                                   seed: Optional[int] = None,
+                                   rng: Optional[np.random.Generator] = None,
+                                   check_precision: Optional[bool] = None) -> Dict[str, Any]:
+        """Run quantum simulation of production scenario
+        
+        Measurement sampling draws from ``rng`` when given, otherwise from a
+        generator seeded with ``seed``; unseeded runs seed theirs from the
+        global NumPy RNG, so ``np.random.seed`` still makes them repeatable.
+        Only seeded runs are reproducible, so only they are served from and
+        stored in the result cache. ``check_precision`` forces or skips the
+        single-precision check; by default it follows the sampling interval.
+        """
+        reproducible = seed is not None and rng is None
+        if reproducible:
+            cache_key = simulation_cache_key(scenario, num_shots, seed, **self._cache_settings())
+            cached = self.simulation_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         start_time = datetime.utcnow()
         
         # Initialize quantum system
         self.initialize_quantum_circuit(scenario)
         
-        # Encode scenario into quantum state
-        initial_state = self._encode_scenario(scenario)
+        if self.backend == QuantumBackend.MPS_SIMULATOR:
+            # Encode and evolve as a bond-limited matrix product state
+            evolved_state = self._simulate_mps_evolution(scenario)
+        else:
+            # Encode scenario into quantum state
+            initial_state = self._encode_scenario(scenario)
+            
+            # Apply quantum evolution (production process simulation); the
+            # initial state is not used again, so it is evolved in place
+            evolved_state = self._apply_quantum_evolution(initial_state, scenario, in_place=True)
+            del initial_state
+        
+        # Measure and extract classical results
+        if rng is None:
+            rng = _simulation_rng(seed)
+        measurement_results = self._measure_quantum_state(evolved_state, num_shots, rng)
+        
+        results = self._finalize_simulation(scenario, evolved_state, measurement_results, start_time,
+                                            check_precision=check_precision)
+        
+        # Cache results
+        if reproducible:
+            self.simulation_cache.put(cache_key, results)
+        
+        return results
+    
+    def simulate_batch(self, scenarios: List[ProductionScenario], num_shots: int = 1000,
+                       seed: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Simulate many scenarios at once, returning results in input order
+        
+        Scenarios that share a qubit count and process route are stacked into
+        one (batch, 2**n) amplitude matrix, evolved together by the circuit
+        plan and measured with a single multinomial draw. The MPS backend has
+        no dense amplitude matrix to stack, so it simulates scenarios in turn.
+        """
+        if self.backend == QuantumBackend.MPS_SIMULATOR:
+            return [
+                self.simulate_production_scenario(scenario, num_shots, seed=scenario_seed)
+                for scenario, scenario_seed in zip(scenarios,
+                                                   _derive_scenario_seeds(seed, len(scenarios)))
+            ]
+        
+        rng = _simulation_rng(seed)
         
-        # Apply quantum evolution (production process simulation)
-        evolved_state = self._apply_quantum_evolution(initial_state, scenario)
+        groups: Dict[Tuple[int, Tuple[str, ...]], List[int]] = {}
+        for index, scenario in enumerate(scenarios):
+            qubit_count, _ = self._circuit_dimensions(scenario)
+            key = (qubit_count, step_signature(scenario.process_steps))
+            groups.setdefault(key, []).append(index)
         
+        results: List[Optional[Dict[str, Any]]] = [None] * len(scenarios)
+        for (qubit_count, signature), indices in groups.items():
+            start_time = datetime.utcnow()
+            logger.info(f"Simulating batch of {len(indices)} scenarios on {qubit_count} qubits")
+            
+            # Encode and evolve the whole group as one amplitude matrix
+            amplitudes = np.stack([
+                self._encode_amplitudes(scenarios[index], qubit_count) for index in indices
+            ])
+            amplitudes = compile_signature(signature, qubit_count).apply(amplitudes)
+            amplitudes /= np.linalg.norm(amplitudes, axis=1, keepdims=True)
+            probabilities = np.abs(amplitudes)
+            np.square(probabilities, out=probabilities)
+            
+            # One vectorized draw for every scenario in the group
+            shot_counts = rng.multinomial(num_shots, _sampling_probabilities(probabilities))
+            
+            basis_labels = BasisLabels(qubit_count)
+            group_metrics = state_metrics(probabilities, amplitudes)
+            
+            for row, index in enumerate(indices):
+                scenario = scenarios[index]
+                self.qubit_count, self.circuit_depth = self._circuit_dimensions(scenario)
+                metrics = group_metrics.row(row)
+                state = QuantumState(amplitudes[row], basis_labels, probabilities[row],
+                                     metrics.normalized_entropy, metrics)
+                observed = np.flatnonzero(shot_counts[row])
+                measurement_results = self._summarize_measurement(
+                    state, observed, shot_counts[row, observed], num_shots
+                )
+                # Outcomes depend on the whole group's draw, so they are not cached
+                results[index] = self._finalize_simulation(
+                    scenario, state, measurement_results, start_time, group_size=len(indices)
+                )
+        
+        return results
+    
+    def _cache_settings(self) -> Dict[str, Any]:
+        """Simulator options that change results and so belong in cache keys"""
+        settings = {'backend': self.backend.value}
+        if self.backend == QuantumBackend.MPS_SIMULATOR:
+            settings['max_bond_dimension'] = self.max_bond_dimension
+        elif self.precision != SimulationPrecision.DOUBLE:
+            settings['precision'] = self.precision.value
+        return settings
+    
+    @property
+    def amplitude_dtype(self) -> np.dtype:
+        """Complex dtype used for dense state vectors"""
+        return np.dtype(self.precision.value)
+    
+    def _finalize_simulation(self, scenario: ProductionScenario, evolved_state: QuantumState,
+                             measurement_results: Dict[str, Any], start_time: datetime,
+                             group_size: int = 1,
+                             check_precision: Optional[bool] = None) -> Dict[str, Any]:
+        """Optimize parameters and assemble the result record for a measured scenario
+        
+        Scenarios simulated together share wall time, so each reports an equal
+        share of the time elapsed since ``start_time``.
+        """
         # Perform quantum optimization
         optimized_params = self._quantum_parameter_optimization(evolved_state, scenario)
         
-        # Measure and extract classical results
-        measurement_results = self._measure_quantum_state(evolved_state, num_shots)
-        
         # Calculate quantum advantage metrics
         quantum_metrics = self._calculate_quantum_advantage(scenario, optimized_params)
         
         # Generate production recommendations
         recommendations = self._generate_recommendations(measurement_results, optimized_params, scenario)
         
-        simulation_time = (datetime.utcnow() - start_time).total_seconds()
+        simulation_time = (datetime.utcnow() - start_time).total_seconds() / group_size
+        
+        if check_precision is None:
+            check_precision = self._precision_check_due()
+        precision_report = None
+        if check_precision and self._precision_checks_apply():
+            precision_report = self._check_precision(scenario, evolved_state, optimized_params)
         
         results = {
             "scenario_id": self._generate_scenario_id(scenario),
@@ -105,64 +392,195 @@ class QuantumProductionSimulator:
             "production_recommendations": recommendations,
             "timestamp": datetime.utcnow().isoformat()
         }
-        
-        # Cache results
-        self.simulation_cache[results["scenario_id"]] = results
+        if precision_report is not None:
+            results["precision_report"] = precision_report
         
         return results
     
+    def _precision_checks_apply(self) -> bool:
+        """Whether this simulator's runs can be checked against double precision"""
+        return (self.precision != SimulationPrecision.DOUBLE
+                and self.backend != QuantumBackend.MPS_SIMULATOR)
+    
+    def _precision_check_due(self) -> bool:
+        """Whether this single-precision simulation is one of the sampled checks"""
+        if not self._precision_checks_apply() or not self.precision_check_interval:
+            return False
+        due = self._precision_check_counter % self.precision_check_interval == 0
+        self._precision_check_counter += 1
+        return due
+    
+    def _check_precision(self, scenario: ProductionScenario, state: QuantumState,
+                         optimized_params: Dict[str, float]) -> Dict[str, Any]:
+        """Compare a reduced-precision state with a complex128 re-evolution"""
+        qubit_count = num_qubits_for(state.amplitudes)
+        reference = compile_process_steps(scenario.process_steps, qubit_count).apply(
+            self._encode_amplitudes(scenario, qubit_count, dtype=np.complex128)
+        )
+        reference /= np.linalg.norm(reference)
+        reference_probabilities = np.abs(reference) ** 2
+        reference_state = QuantumState(reference, state.basis_labels, reference_probabilities,
+                                       self._calculate_entanglement(reference))
+        reference_params = self._quantum_parameter_optimization(reference_state, scenario)
+        
+        amplitudes = state.amplitudes.astype(np.complex128)
+        amplitudes /= np.linalg.norm(amplitudes)
+        probabilities = np.abs(amplitudes) ** 2
+        fidelity = float(abs(np.vdot(reference, amplitudes)) ** 2)
+        total_variation_distance = float(0.5 * np.sum(np.abs(reference_probabilities - probabilities)))
+        
+        # Share of the reduced-precision top 5 that are also top 5 in the reference,
+        # treating states tied with the reference 5th place as top 5
+        top_k = min(5, len(probabilities))
+        top_states = np.argsort(probabilities)[::-1][:top_k]
+        kth_reference = np.partition(reference_probabilities, -top_k)[-top_k]
+        top_5_agreement = float(np.mean(
+            reference_probabilities[top_states] >= kth_reference - np.finfo(np.float32).eps
+        ))
+        
+        report = {
+            'precision': self.precision.value,
+            'fidelity': fidelity,
+            'total_variation_distance': total_variation_distance,
+            'max_probability_error': float(np.max(np.abs(reference_probabilities - probabilities))),
+            'entanglement_error': float(abs(reference_state.entanglement_measure
+                                            - state.entanglement_measure)),
+            'predicted_yield_error': float(abs(reference_params['predicted_yield']
+                                               - optimized_params['predicted_yield'])),
+            'predicted_purity_error': float(abs(reference_params['predicted_purity']
+                                                - optimized_params['predicted_purity'])),
+            'top_5_agreement': top_5_agreement,
+        }
+        report['within_tolerance'] = bool(
+            fidelity >= 1 - self.precision_fidelity_tolerance
+            and total_variation_distance <= self.precision_tvd_tolerance
+        )
+        if not report['within_tolerance']:
+            logger.warning(f"Single-precision run of {self._generate_scenario_id(scenario)} "
+                           f"exceeds tolerance: fidelity {fidelity:.8f}, "
+                           f"TVD {total_variation_distance:.2e}")
+        
+        self.precision_reports.append(report)
+        return report
+    
+    def get_precision_summary(self) -> Dict[str, Any]:
+        """Worst-case accuracy over recent single-precision checks"""
+        reports = list(self.precision_reports)
+        if not reports:
+            return {'precision': self.precision.value, 'checks': 0}
+        return {
+            'precision': self.precision.value,
+            'checks': len(reports),
+            'min_fidelity': min(r['fidelity'] for r in reports),
+            'max_total_variation_distance': max(r['total_variation_distance'] for r in reports),
+            'max_predicted_yield_error': max(r['predicted_yield_error'] for r in reports),
+            'max_predicted_purity_error': max(r['predicted_purity_error'] for r in reports),
+            'min_top_5_agreement': min(r['top_5_agreement'] for r in reports),
+            'all_within_tolerance': all(r['within_tolerance'] for r in reports)
+        }
+    
     def _encode_scenario(self, scenario: ProductionScenario) -> QuantumState:
         """Encode production scenario into quantum state"""
+        amplitudes = self._encode_amplitudes(scenario, self.qubit_count)
+        
+        # Basis labels are formatted lazily, only for observed outcomes
+        basis_labels = BasisLabels(self.qubit_count)
+        
+        # Calculate measurement probabilities
+        probabilities = np.abs(amplitudes)
+        np.square(probabilities, out=probabilities)
+        
+        # Calculate entanglement measure (simplified); the encoded state is a
+        # product state, so there is no bipartite entanglement to compute
+        metrics = state_metrics(probabilities)
+        
+        return QuantumState(amplitudes, basis_labels, probabilities,
+                            metrics.normalized_entropy, metrics)
+    
+    def _encode_amplitudes(self, scenario: ProductionScenario, qubit_count: int,
+                           dtype: Optional[np.dtype] = None) -> np.ndarray:
+        """Phase-encoded equal superposition amplitudes for a scenario
+        
+        Amplitudes use the simulator's precision unless ``dtype`` is given.
+        """
         # Create superposition of all possible production paths
-        num_basis_states = 2 ** self.qubit_count
-        amplitudes = np.zeros(num_basis_states, dtype=complex)
+        num_basis_states = 2 ** qubit_count
+        amplitudes = np.zeros(num_basis_states, dtype=dtype or self.amplitude_dtype)
         
         # Initialize with equal superposition
         amplitudes[:] = 1.0 / np.sqrt(num_basis_states)
         
-        # Apply scenario-specific phase encoding
-        for i, material in enumerate(scenario.starting_materials):
+        # Apply scenario-specific phase encoding as one in-place diagonal multiply
+        return apply_diagonal(amplitudes, self._material_phase_factors(scenario, qubit_count),
+                              out=amplitudes)
+    
+    def _material_phase_factors(self, scenario: ProductionScenario, qubit_count: int) -> np.ndarray:
+        """Per-qubit diag(1, e^{i*phase}) factors encoding the starting materials
+        
+        Material i phases the basis states whose i-th least significant bit is
+        set; materials beyond the register width touch no basis state.
+        """
+        phase_factors = np.ones((qubit_count, 2), dtype=complex)
+        for i, material in enumerate(scenario.starting_materials[:qubit_count]):
             phase = 2 * np.pi * list(material.values())[0] / 100  # Normalize concentration
-            for j in range(num_basis_states):
-                if (j >> i) & 1:  # If ith qubit is |1>
-                    amplitudes[j] *= np.exp(1j * phase)
+            phase_factors[qubit_count - 1 - i, 1] = np.exp(1j * phase)
+        return phase_factors
+    
+    def _simulate_mps_evolution(self, scenario: ProductionScenario) -> MPSQuantumState:
+        """Encode and evolve a scenario on the matrix product state backend"""
+        # The phase-encoded equal superposition is a product state
+        site_vectors = self._material_phase_factors(scenario, self.qubit_count) / np.sqrt(2)
+        mps = MatrixProductState.product_state(site_vectors,
+                                               max_bond_dimension=self.max_bond_dimension)
         
-        # Generate basis labels
-        basis_labels = [format(i, f'0{self.qubit_count}b') for i in range(num_basis_states)]
+        mps.apply_plan(compile_process_steps(scenario.process_steps, self.qubit_count))
+        mps.normalize()
         
-        # Calculate measurement probabilities
-        probabilities = np.abs(amplitudes) ** 2
+        if mps.truncation_error > 0:
+            logger.info(f"MPS truncation discarded {mps.truncation_error:.2e} of the state weight "
+                        f"at bond dimension {mps.bond_dimension}")
         
-        # Calculate entanglement measure (simplified)
-        entanglement = self._calculate_entanglement(amplitudes)
+        return MPSQuantumState(mps, self._calculate_mps_entanglement(mps))
+    
+    def _calculate_mps_entanglement(self, mps: MatrixProductState,
+                                    num_samples: int = 4096) -> float:
+        """Entanglement measure of an MPS, matching _calculate_entanglement
         
-        return QuantumState(amplitudes, basis_labels, probabilities, entanglement)
+        Small registers are contracted and measured exactly; wider ones use a
+        fixed-seed Monte Carlo estimate of the Shannon entropy, -E[log2 p(x)].
+        """
+        if mps.num_qubits <= 16:
+            return self._calculate_entanglement(mps.to_dense())
+        _, log_probabilities = mps.sample(num_samples, np.random.default_rng(0))
+        return float(-np.mean(log_probabilities)) / mps.num_qubits
     
     def _apply_quantum_evolution(self, initial_state: QuantumState, 
-                               scenario: ProductionScenario) -> QuantumState:
-        """Apply quantum gates representing production process evolution"""
-        evolved_amplitudes = initial_state.amplitudes.copy()
-        
-        # Apply process-specific quantum gates
-        for step in scenario.process_steps:
-            if "mixing" in step.lower():
-                evolved_amplitudes = self._apply_mixing_gate(evolved_amplitudes)
-            elif "reaction" in step.lower():
-                evolved_amplitudes = self._apply_reaction_gate(evolved_amplitudes)
-            elif "purification" in step.lower():
-                evolved_amplitudes = self._apply_purification_gate(evolved_amplitudes)
-            elif "crystallization" in step.lower():
-                evolved_amplitudes = self._apply_crystallization_gate(evolved_amplitudes)
+                               scenario: ProductionScenario,
+                               in_place: bool = False) -> QuantumState:
+        """Apply quantum gates representing production process evolution
+        
+        The plan ping-pongs between two state buffers. With ``in_place`` the
+        initial state's amplitudes serve as one of them instead of a copy,
+        leaving ``initial_state`` holding scratch data.
+        """
+        evolved_amplitudes = initial_state.amplitudes
+        if not in_place:
+            evolved_amplitudes = evolved_amplitudes.copy()
+        
+        # Apply process-specific quantum gates as a fused, cached circuit plan
+        plan = compile_process_steps(scenario.process_steps, self.qubit_count)
+        evolved_amplitudes = plan.apply(evolved_amplitudes)
         
         # Normalize
         evolved_amplitudes /= np.linalg.norm(evolved_amplitudes)
         
         # Recalculate properties
-        probabilities = np.abs(evolved_amplitudes) ** 2
-        entanglement = self._calculate_entanglement(evolved_amplitudes)
+        probabilities = np.abs(evolved_amplitudes)
+        np.square(probabilities, out=probabilities)
+        metrics = state_metrics(probabilities, evolved_amplitudes)
         
         return QuantumState(evolved_amplitudes, initial_state.basis_labels, 
-                          probabilities, entanglement)
+                          probabilities, metrics.normalized_entropy, metrics)
     
     def _apply_mixing_gate(self, amplitudes: np.ndarray) -> np.ndarray:
         """Quantum gate for mixing process"""
@@ -198,139 +616,72 @@ class QuantumProductionSimulator:
     
     def _apply_crystallization_gate(self, amplitudes: np.ndarray) -> np.ndarray:
         """Quantum gate for crystallization process"""
-        # Measurement-like projection
-        # Simulate partial measurement collapse
-        probabilities = np.abs(amplitudes) ** 2
-        
-        # Enhance high-probability states (crystallization nucleation)
-        threshold = np.mean(probabilities)
-        for i in range(len(amplitudes)):
-            if probabilities[i] > threshold:
-                amplitudes[i] *= 1.2
-            else:
-                amplitudes[i] *= 0.8
-        
-        # Renormalize
-        amplitudes /= np.linalg.norm(amplitudes)
-        return amplitudes
+        # Measurement-like projection: enhance high-probability states
+        # (crystallization nucleation) and renormalize
+        return apply_crystallization(amplitudes)
     
     def _apply_single_qubit_gate(self, amplitudes: np.ndarray, qubit: int, 
                                 gate_type: str, param: float = None) -> np.ndarray:
         """Apply single qubit gate to quantum state"""
-        n_qubits = int(np.log2(len(amplitudes)))
-        new_amplitudes = amplitudes.copy()
-        
         if gate_type == 'hadamard':
-            # Hadamard gate
-            for i in range(len(amplitudes)):
-                if not (i >> (n_qubits - qubit - 1)) & 1:  # |0> state
-                    j = i | (1 << (n_qubits - qubit - 1))  # Corresponding |1> state
-                    temp = new_amplitudes[i]
-                    new_amplitudes[i] = (amplitudes[i] + amplitudes[j]) / np.sqrt(2)
-                    new_amplitudes[j] = (temp - amplitudes[j]) / np.sqrt(2)
+            return apply_hadamard(amplitudes, qubit)
         
         elif gate_type == 'phase':
-            # Phase gate
             phase = param if param else np.pi / 4
-            for i in range(len(amplitudes)):
-                if (i >> (n_qubits - qubit - 1)) & 1:  # |1> state
-                    new_amplitudes[i] *= np.exp(1j * phase)
+            return apply_phase(amplitudes, qubit, phase)
         
-        return new_amplitudes
+        return amplitudes.copy()
     
     def _apply_controlled_rotation(self, amplitudes: np.ndarray, control: int, 
                                   target: int, angle: float) -> np.ndarray:
         """Apply controlled rotation gate"""
-        n_qubits = int(np.log2(len(amplitudes)))
-        new_amplitudes = amplitudes.copy()
-        
-        for i in range(len(amplitudes)):
-            if (i >> (n_qubits - control - 1)) & 1:  # Control qubit is |1>
-                if not (i >> (n_qubits - target - 1)) & 1:  # Target is |0>
-                    j = i | (1 << (n_qubits - target - 1))  # Target |1> state
-                    
-                    # Apply rotation
-                    temp = new_amplitudes[i]
-                    new_amplitudes[i] = np.cos(angle) * amplitudes[i] - 1j * np.sin(angle) * amplitudes[j]
-                    new_amplitudes[j] = -1j * np.sin(angle) * temp + np.cos(angle) * amplitudes[j]
-        
-        return new_amplitudes
+        return apply_controlled_rotation(amplitudes, control, target, angle)
     
     def _calculate_entanglement(self, amplitudes: np.ndarray) -> float:
-        """Calculate entanglement measure (simplified von Neumann entropy)"""
-        probabilities = np.abs(amplitudes) ** 2
-        # Remove zero probabilities to avoid log(0)
-        probabilities = probabilities[probabilities > 1e-10]
-        
-        # Shannon entropy as proxy for entanglement
-        entropy = -np.sum(probabilities * np.log2(probabilities))
+        """Calculate entanglement measure (simplified von Neumann entropy)
         
-        # Normalize to [0, 1]
-        max_entropy = np.log2(len(amplitudes))
-        return entropy / max_entropy if max_entropy > 0 else 0
+        Normalized Shannon entropy of the measurement distribution, as a proxy;
+        see quantum_state_metrics for the full set of state metrics.
+        """
+        return normalized_entropy(np.abs(amplitudes) ** 2)
     
     def _quantum_parameter_optimization(self, state: QuantumState, 
                                       scenario: ProductionScenario) -> Dict[str, float]:
-        """Perform quantum-inspired parameter optimization"""
-        
-        def objective_function(params):
-            """Objective function for optimization"""
-            # Simulate production with given parameters
-            yield_factor = params[0]
-            purity_factor = params[1]
-            time_factor = params[2]
-            
-            # Cost function balancing yield, purity, and time
-            cost = -(
-                0.4 * yield_factor * scenario.quality_targets.get('yield', 0.9) +
-                0.4 * purity_factor * scenario.quality_targets.get('purity', 0.99) +
-                0.2 * (1 / time_factor)  # Minimize time
-            )
-            
-            # Add quantum state information
-            cost += 0.1 * (1 - state.entanglement_measure)  # Favor entangled states
-            
-            return cost
+        """Perform quantum-inspired parameter optimization
         
-        # Initial parameters
-        x0 = [0.8, 0.9, 1.0]  # yield, purity, time factors
-        
-        # Bounds
-        bounds = [(0.5, 1.0), (0.5, 1.0), (0.5, 2.0)]
-        
-        # Optimize
-        result = minimize(objective_function, x0, method='L-BFGS-B', bounds=bounds)
+        Solved by ``parameter_optimizer``, which memoizes solutions on the
+        quality targets and entanglement measure and warm-starts new ones.
+        """
+        params, converged, cost = self.parameter_optimizer.optimize(
+            scenario.quality_targets, state.entanglement_measure
+        )
         
         optimized_params = {
-            'yield_optimization_factor': result.x[0],
-            'purity_optimization_factor': result.x[1],
-            'time_optimization_factor': result.x[2],
-            'predicted_yield': result.x[0] * scenario.quality_targets.get('yield', 0.9),
-            'predicted_purity': result.x[1] * scenario.quality_targets.get('purity', 0.99),
-            'predicted_time_days': scenario.timeline_days / result.x[2],
-            'optimization_convergence': result.success,
-            'final_cost': -result.fun
+            'yield_optimization_factor': params[0],
+            'purity_optimization_factor': params[1],
+            'time_optimization_factor': params[2],
+            'predicted_yield': params[0] * scenario.quality_targets.get('yield', 0.9),
+            'predicted_purity': params[1] * scenario.quality_targets.get('purity', 0.99),
+            'predicted_time_days': scenario.timeline_days / params[2],
+            'optimization_convergence': converged,
+            'final_cost': -cost
         }
         
         return optimized_params
     
-    def _measure_quantum_state(self, state: QuantumState, num_shots: int) -> Dict[str, Any]:
+    def _measure_quantum_state(self, state: QuantumState, num_shots: int,
+                               rng: Optional[np.random.Generator] = None) -> Dict[str, Any]:
         """Perform quantum measurement and extract results"""
-        # Sample from probability distribution
-        outcomes = np.random.choice(
-            len(state.amplitudes),
-            size=num_shots,
-            p=state.measurement_probabilities
-        )
-        
-        # Count outcomes
-        unique, counts = np.unique(outcomes, return_counts=True)
+        # Sample from probability distribution and count outcomes
+        unique, counts = state.sample_counts(num_shots, rng)
         
+        return self._summarize_measurement(state, unique, counts, num_shots)
+    
+    def _summarize_measurement(self, state: QuantumState, unique: np.ndarray,
+                               counts: np.ndarray, num_shots: int) -> Dict[str, Any]:
+        """Build measurement counts and statistics from observed basis indices"""
         # Convert to basis state outcomes
-        measurement_counts = {}
-        for idx, count in zip(unique, counts):
-            basis_state = state.basis_labels[idx]
-            measurement_counts[basis_state] = count
+        measurement_counts = state.label_counts(unique, counts)
         
         # Extract most probable outcomes
         sorted_outcomes = sorted(measurement_counts.items(), key=lambda x: x[1], reverse=True)
@@ -342,10 +693,17 @@ class QuantumProductionSimulator:
             'unique_outcomes': len(unique),
             'most_probable_state': top_outcomes[0][0] if top_outcomes else None,
             'highest_probability': top_outcomes[0][1] / num_shots if top_outcomes else 0,
-            'entropy': -np.sum((counts/num_shots) * np.log2(counts/num_shots + 1e-10)),
+            'entropy': shannon_entropy(counts / num_shots),
             'top_5_outcomes': dict(top_outcomes)
         }
         
+        # Exact distribution metrics, when the state carries them
+        if state.metrics is not None:
+            outcome_stats['state_entropy'] = state.metrics.entropy
+            outcome_stats['participation_ratio'] = state.metrics.participation_ratio
+            if state.metrics.von_neumann_entropy is not None:
+                outcome_stats['von_neumann_entropy'] = state.metrics.von_neumann_entropy
+        
         return {
             'measurement_counts': measurement_counts,
             'statistics': outcome_stats,
@@ -447,19 +805,23 @@ class QuantumProductionSimulator:
         return recommendations
     
     def _generate_scenario_id(self, scenario: ProductionScenario) -> str:
-        """Generate unique ID for scenario"""
-        data = json.dumps({
-            'batch_size': scenario.batch_size,
-            'target': scenario.target_molecule,
-            'steps': scenario.process_steps
-        }, sort_keys=True)
-        
-        import hashlib
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        """Generate unique ID for scenario from all of its fields"""
+        return scenario_fingerprint(scenario)[:16]
     
     def compare_scenarios(self, scenarios: List[ProductionScenario], 
-                         num_shots: int = 1000) -> Dict[str, Any]:
-        """Compare multiple production scenarios using quantum simulation"""
+                         num_shots: int = 1000, workers: Optional[int] = None,
+                         seed: Optional[int] = None) -> Dict[str, Any]:
+        """Compare multiple production scenarios using quantum simulation
+        
+        With ``workers`` > 1 the scenarios are simulated in a process pool;
+        each task receives a compact scenario payload and returns only the
+        summary used for scoring, and results are merged in submission order.
+        Scenario results from pool workers are not added to ``simulation_cache``,
+        but precision checks are sampled here and their reports merged into
+        ``precision_reports``, as in a serial run.
+        When ``seed`` is given each scenario gets its own derived seed, so the
+        comparison is reproducible regardless of the worker count.
+        """
         comparison_results = {
             'scenarios': [],
             'best_scenario_index': None,
@@ -467,20 +829,32 @@ class QuantumProductionSimulator:
             'recommendations': []
         }
         
+        scenario_seeds = _derive_scenario_seeds(seed, len(scenarios))
+        
+        if workers and workers > 1:
+            payloads = [
+                self._pool_payload(scenario, num_shots, scenario_seed)
+                for scenario, scenario_seed in zip(scenarios, scenario_seeds)
+            ]
+            chunksize = max(1, len(payloads) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(_simulate_scenario_summary, payloads,
+                                             chunksize=chunksize))
+            summaries = [summary for summary, _ in outcomes]
+            self._merge_precision_reports(report for _, report in outcomes)
+        else:
+            summaries = [
+                _summarize_result(self.simulate_production_scenario(scenario, num_shots,
+                                                                    seed=scenario_seed))
+                for scenario, scenario_seed in zip(scenarios, scenario_seeds)
+            ]
+        
         best_score = -float('inf')
         best_index = 0
         
-        for i, scenario in enumerate(scenarios):
-            # Run simulation for each scenario
-            result = self.simulate_production_scenario(scenario, num_shots)
-            
+        for i, summary in enumerate(summaries):
             # Calculate overall score
-            score = (
-                result['optimized_parameters']['predicted_yield'] * 0.3 +
-                result['optimized_parameters']['predicted_purity'] * 0.3 +
-                (1 / result['optimized_parameters']['predicted_time_days']) * 0.2 +
-                result['quantum_advantage_metrics']['overall_quantum_advantage'] * 0.2
-            )
+            score = score_summary(summary)
             
             if score > best_score:
                 best_score = score
@@ -489,12 +863,7 @@ class QuantumProductionSimulator:
             comparison_results['scenarios'].append({
                 'index': i,
                 'score': score,
-                'summary': {
-                    'yield': result['optimized_parameters']['predicted_yield'],
-                    'purity': result['optimized_parameters']['predicted_purity'],
-                    'time': result['optimized_parameters']['predicted_time_days'],
-                    'quantum_advantage': result['quantum_advantage_metrics']['overall_quantum_advantage']
-                }
+                'summary': summary
             })
         
         comparison_results['best_scenario_index'] = best_index
@@ -506,4 +875,167 @@ class QuantumProductionSimulator:
             'improvement_potential': (best_score - comparison_results['scenarios'][0]['score']) / comparison_results['scenarios'][0]['score']
         }
         
-        return comparison_results
\ No newline at end of file
+        return comparison_results
+    
+    def sweep_scenarios(self, scenarios: Iterable[ProductionScenario],
+                        num_shots: int = 1000, top_k: int = 10,
+                        score_threshold: Optional[float] = None,
+                        workers: Optional[int] = None,
+                        seed: Optional[int] = None) -> ScenarioSweep:
+        """Stream scored summaries of a scenario sweep as simulations complete
+        
+        ``scenarios`` may be any iterable, including a lazy grid generator;
+        it is consumed as the sweep advances. Only the best ``top_k`` full
+        results are retained (see ScenarioSweep), and the sweep stops early
+        once a scenario scores at least ``score_threshold``. With ``workers``
+        > 1 at most two tasks per worker are in flight, and summaries arrive
+        in completion order. Seeds are derived as in compare_scenarios, so a
+        seeded sweep scores scenarios exactly as compare_scenarios does.
+        """
+        results = self._iter_sweep_results(scenarios, num_shots, workers, seed)
+        return ScenarioSweep(results, _summarize_result, top_k, score_threshold)
+    
+    def _iter_sweep_results(self, scenarios: Iterable[ProductionScenario], num_shots: int,
+                            workers: Optional[int],
+                            seed: Optional[int]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """(index, full result) pairs for a sweep, in completion order"""
+        indexed = enumerate(zip(scenarios, _iter_scenario_seeds(seed)))
+        if not workers or workers <= 1:
+            for index, (scenario, scenario_seed) in indexed:
+                yield index, self.simulate_production_scenario(scenario, num_shots,
+                                                               seed=scenario_seed)
+            return
+        
+        executor = ProcessPoolExecutor(max_workers=workers)
+        pending = {}
+        try:
+            for index, (scenario, scenario_seed) in indexed:
+                payload = self._pool_payload(scenario, num_shots, scenario_seed)
+                pending[executor.submit(_simulate_scenario_result, payload)] = index
+                if len(pending) < 2 * workers:
+                    continue
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), self._collect_pool_result(future.result())
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), self._collect_pool_result(future.result())
+        finally:
+            # Reached on exhaustion, early exit or an abandoned sweep
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _pool_payload(self, scenario: ProductionScenario, num_shots: int,
+                      seed: Optional[int]) -> Tuple[Dict[str, Any], tuple, int, int, bool]:
+        """Compact, picklable description of one simulation for a pool worker"""
+        # Forked workers inherit identical global RNG state, so unseeded
+        # scenarios get their seeds drawn here instead. Workers start with
+        # fresh check counters, so precision checks are sampled here too.
+        return (self._worker_settings(), astuple(scenario), num_shots,
+                seed if seed is not None else _global_seed(), self._precision_check_due())
+    
+    def _collect_pool_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Record the precision report of a result returned by a pool worker"""
+        self._merge_precision_reports([result.get('precision_report')])
+        return result
+    
+    def _merge_precision_reports(self, reports: Iterable[Optional[Dict[str, Any]]]):
+        """Add precision reports made in pool workers to this simulator's history"""
+        self.precision_reports.extend(report for report in reports if report is not None)
+    
+    def _worker_settings(self) -> Dict[str, Any]:
+        """Every setting a pool worker needs to rebuild an equivalent simulator"""
+        return {
+            'backend': self.backend.value,
+            'max_bond_dimension': self.max_bond_dimension,
+            'precision': self.precision.value,
+            'precision_check_interval': self.precision_check_interval,
+            'precision_fidelity_tolerance': self.precision_fidelity_tolerance,
+            'precision_tvd_tolerance': self.precision_tvd_tolerance,
+            'quantum_advantage_threshold': self.quantum_advantage_threshold
+        }
+
+
+def _global_seed() -> int:
+    """A seed drawn from the global NumPy RNG"""
+    return int(np.random.randint(np.iinfo(np.int64).max, dtype=np.int64))
+
+
+def _simulation_rng(seed: Optional[int]) -> np.random.Generator:
+    """Generator for one simulation; unseeded ones take their seed from the global RNG"""
+    return np.random.default_rng(_global_seed() if seed is None else seed)
+
+
+def _derive_scenario_seeds(seed: Optional[int], count: int) -> List[Optional[int]]:
+    """Independent per-scenario seeds derived from one sweep seed"""
+    if seed is None:
+        return [None] * count
+    return [int(value) for value in np.random.SeedSequence(seed).generate_state(count)]
+
+
+def _iter_scenario_seeds(seed: Optional[int]) -> Iterator[Optional[int]]:
+    """Unbounded stream of the per-scenario seeds _derive_scenario_seeds would give"""
+    if seed is None:
+        while True:
+            yield None
+    # SeedSequence words are prefix-stable, so the stream can grow in chunks
+    sequence = np.random.SeedSequence(seed)
+    produced, chunk = 0, 64
+    while True:
+        for value in sequence.generate_state(produced + chunk)[produced:]:
+            yield int(value)
+        produced += chunk
+        chunk *= 2
+
+
+def _summarize_result(result: Dict[str, Any]) -> Dict[str, float]:
+    """Scoring summary of a full simulation result"""
+    return {
+        'yield': result['optimized_parameters']['predicted_yield'],
+        'purity': result['optimized_parameters']['predicted_purity'],
+        'time': result['optimized_parameters']['predicted_time_days'],
+        'quantum_advantage': result['quantum_advantage_metrics']['overall_quantum_advantage']
+    }
+
+
+def _sampling_probabilities(probabilities: np.ndarray) -> np.ndarray:
+    """Measurement probabilities in double precision, as NumPy's samplers expect
+    
+    Single-precision probabilities are renormalized after the upcast so that
+    rounding cannot push a distribution's total past 1.
+    """
+    if probabilities.dtype == np.float64:
+        return probabilities
+    probabilities = probabilities.astype(np.float64)
+    probabilities /= probabilities.sum(axis=-1, keepdims=True)
+    return probabilities
+
+
+def _simulator_from_settings(settings: Dict[str, Any]) -> QuantumProductionSimulator:
+    """Simulator configured like the one whose ``_worker_settings`` gave ``settings``"""
+    simulator = QuantumProductionSimulator(
+        QuantumBackend(settings['backend']),
+        max_bond_dimension=settings['max_bond_dimension'],
+        precision=SimulationPrecision(settings['precision']),
+        precision_check_interval=settings['precision_check_interval']
+    )
+    simulator.precision_fidelity_tolerance = settings['precision_fidelity_tolerance']
+    simulator.precision_tvd_tolerance = settings['precision_tvd_tolerance']
+    simulator.quantum_advantage_threshold = settings['quantum_advantage_threshold']
+    return simulator
+
+
+def _simulate_scenario_result(payload: Tuple[Dict[str, Any], tuple, int, int, bool]) -> Dict[str, Any]:
+    """Process-pool task: simulate one scenario payload and return its full result"""
+    settings, scenario_fields, num_shots, seed, check_precision = payload
+    simulator = _simulator_from_settings(settings)
+    return simulator.simulate_production_scenario(
+        ProductionScenario(*scenario_fields), num_shots, seed=seed, check_precision=check_precision
+    )
+
+
+def _simulate_scenario_summary(payload: Tuple[Dict[str, Any], tuple, int, int, bool]
+                               ) -> Tuple[Dict[str, float], Optional[Dict[str, Any]]]:
+    """Process-pool task: simulate one scenario payload and return its summary and precision report"""
+    result = _simulate_scenario_result(payload)
+    return _summarize_result(result), result.get('precision_report')
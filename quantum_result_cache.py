@@ -0,0 +1,195 @@
+"""
+Simulation Result Cache
+Content-addressed, size-bounded cache for quantum production simulation results
+"""
+
+import numpy as np
+from typing import Dict, Optional, Any
+from dataclasses import asdict
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def _to_builtin(value: Any) -> Any:
+    """JSON fallback for NumPy scalars and arrays"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def scenario_fingerprint(scenario) -> str:
+    """Canonical SHA-256 of every field of a ProductionScenario"""
+    data = json.dumps(asdict(scenario), sort_keys=True, default=_to_builtin)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def simulation_cache_key(scenario, num_shots: int, seed: Optional[int], **settings: Any) -> str:
+    """Cache key covering the scenario and everything else that shapes its result
+
+    ``settings`` carries simulator options that change results, such as the backend.
+    """
+    data = json.dumps({
+        'scenario': scenario_fingerprint(scenario),
+        'num_shots': num_shots,
+        'seed': seed,
+        'settings': settings
+    }, sort_keys=True, default=_to_builtin)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+class SimulationResultCache:
+    """LRU cache of simulation results with an optional on-disk tier
+
+    The in-memory tier holds at most ``max_entries`` results and evicts the
+    least recently used one. When ``cache_dir`` is set, persisted results are
+    also written there as JSON so a restarted process can reuse prior sweeps.
+    The directory keeps at most ``max_disk_entries`` files and, if set,
+    ``max_disk_bytes`` bytes; after each write the least recently used
+    files (by modification time, which disk hits refresh) are deleted.
+    Results are deep-copied going in and coming out, so callers may modify
+    what they put or get without changing the cached entry.
+    """
+
+    def __init__(self, max_entries: int = 1024, cache_dir: Optional[str] = None,
+                 max_disk_entries: int = 10000, max_disk_bytes: Optional[int] = None):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_disk_entries <= 0:
+            raise ValueError("max_disk_entries must be positive")
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_entries = max_disk_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a result, promoting disk hits into memory"""
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(result)
+
+        result = self._load(key)
+        if result is not None:
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, result)
+            return copy.deepcopy(result)
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, result: Dict[str, Any], persist: bool = True):
+        """Store a result in memory and, if enabled and requested, on disk"""
+        self._remember(key, copy.deepcopy(result))
+        if persist and self.cache_dir:
+            self._store(key, result)
+
+    def clear(self):
+        """Drop every in-memory entry; files on disk are kept"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and occupancy"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'disk_hits': self.disk_hits,
+            'evictions': self.evictions,
+            'disk_evictions': self.disk_evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'disk_tier_enabled': bool(self.cache_dir)
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _remember(self, key: str, result: Dict[str, Any]):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                result = json.load(fh)
+            os.utime(path)  # Mark as recently used for pruning
+            return result
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {exc}")
+            return None
+
+    def _store(self, key: str, result: Dict[str, Any]):
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump(result, fh, default=_to_builtin)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning(f"Failed to persist cache entry {key}: {exc}")
+            return
+        self._prune_disk()
+
+    def _prune_disk(self):
+        """Delete the least recently used files beyond the disk limits"""
+        files = []
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        stat = entry.stat()
+                        files.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError as exc:
+            logger.warning(f"Failed to scan cache directory {self.cache_dir}: {exc}")
+            return
+
+        total_bytes = sum(size for _, size, _ in files)
+        files.sort()
+        excess = len(files) - self.max_disk_entries
+        for _, size, path in files:
+            if excess <= 0 and (self.max_disk_bytes is None or total_bytes <= self.max_disk_bytes):
+                break
+            try:
+                os.remove(path)
+                self.disk_evictions += 1
+            except FileNotFoundError:
+                pass  # Pruned concurrently by another process
+            except OSError as exc:
+                logger.warning(f"Failed to prune cache file {path}: {exc}")
+                continue
+            excess -= 1
+            total_bytes -= size
@@ -0,0 +1,103 @@
+"""
+Batched Quantum State Metrics
+Entropy, participation ratio and bipartite entanglement for one or many state vectors
+"""
+
+import numpy as np
+from typing import Optional, Union
+from dataclasses import dataclass
+
+from quantum_gate_kernels import num_qubits_for
+
+# Every function accepts a single state or a stacked (batch, 2**n) array and
+# reduces over the last axis. Sums are taken as dot products, so no masked or
+# compressed copies of the state are made.
+
+ENTROPY_CUTOFF = 1e-10  # Probabilities at or below this are left out of entropies
+
+Metric = Union[float, np.ndarray]
+
+
+def shannon_entropy(probabilities: np.ndarray, cutoff: float = ENTROPY_CUTOFF) -> Metric:
+    """Shannon entropy in bits of each distribution"""
+    logs = np.zeros_like(probabilities)
+    np.log2(probabilities, out=logs, where=probabilities > cutoff)
+    return 0.0 - np.einsum('...i,...i->...', probabilities, logs)
+
+
+def normalized_entropy(probabilities: np.ndarray, cutoff: float = ENTROPY_CUTOFF) -> Metric:
+    """Shannon entropy scaled to [0, 1] by its maximum, log2 of the state size"""
+    max_entropy = np.log2(probabilities.shape[-1])
+    if max_entropy <= 0:
+        return np.zeros(probabilities.shape[:-1]) if probabilities.ndim > 1 else 0
+    return shannon_entropy(probabilities, cutoff) / max_entropy
+
+
+def participation_ratio(probabilities: np.ndarray) -> Metric:
+    """Inverse participation ratio 1 / sum(p**2): the effective number of occupied states"""
+    return 1.0 / np.einsum('...i,...i->...', probabilities, probabilities)
+
+
+def von_neumann_entropy(amplitudes: np.ndarray, subsystem_qubits: Optional[int] = None,
+                        cutoff: float = ENTROPY_CUTOFF) -> Metric:
+    """Entanglement entropy in bits between the leading qubits and the rest
+
+    The reduced density matrix of the first ``subsystem_qubits`` qubits
+    (half the register by default) is built as M M^dagger from the state
+    reshaped to (2**a, 2**b), and its eigenvalues give the entropy.
+    """
+    n_qubits = num_qubits_for(amplitudes)
+    if subsystem_qubits is None:
+        subsystem_qubits = n_qubits // 2
+    if subsystem_qubits in (0, n_qubits):
+        return np.zeros(amplitudes.shape[:-1]) if amplitudes.ndim > 1 else 0.0
+
+    # Trace out the larger side so the density matrix is as small as possible
+    matrix = amplitudes.reshape(amplitudes.shape[:-1]
+                                + (2 ** subsystem_qubits, 2 ** (n_qubits - subsystem_qubits)))
+    if matrix.shape[-2] > matrix.shape[-1]:
+        matrix = np.swapaxes(matrix, -1, -2)
+    density = matrix @ np.swapaxes(matrix, -1, -2).conj()
+    eigenvalues = np.clip(np.linalg.eigvalsh(density), 0.0, None)
+    return shannon_entropy(eigenvalues, cutoff)
+
+
+@dataclass
+class StateMetrics:
+    """Metrics of one state, or arrays of them for a batch"""
+    entropy: Metric  # Shannon entropy of the measurement distribution, in bits
+    normalized_entropy: Metric  # entropy / n_qubits; the simulator's entanglement measure
+    participation_ratio: Metric
+    von_neumann_entropy: Optional[Metric] = None  # Half-register entanglement, in bits
+
+    def row(self, index: int) -> 'StateMetrics':
+        """Metrics of one state of a batch"""
+        return StateMetrics(
+            float(self.entropy[index]),
+            float(self.normalized_entropy[index]),
+            float(self.participation_ratio[index]),
+            None if self.von_neumann_entropy is None else float(self.von_neumann_entropy[index])
+        )
+
+
+def state_metrics(probabilities: np.ndarray, amplitudes: Optional[np.ndarray] = None,
+                  max_von_neumann_qubits: int = 16) -> StateMetrics:
+    """Compute every metric for one state or a (batch, 2**n) stack
+
+    The von Neumann entropy needs ``amplitudes`` and costs an eigensolve of
+    a 2**(n/2) square matrix per state, so it is only computed for registers
+    of at most ``max_von_neumann_qubits`` qubits.
+    """
+    entropy = shannon_entropy(probabilities)
+    n_qubits = num_qubits_for(probabilities)
+    normalized = entropy / n_qubits if n_qubits > 0 else np.zeros_like(entropy)
+
+    von_neumann = None
+    if amplitudes is not None and n_qubits <= max_von_neumann_qubits:
+        von_neumann = von_neumann_entropy(amplitudes)
+
+    if probabilities.ndim == 1:
+        return StateMetrics(float(entropy), float(normalized),
+                            float(participation_ratio(probabilities)),
+                            None if von_neumann is None else float(von_neumann))
+    return StateMetrics(entropy, normalized, participation_ratio(probabilities), von_neumann)
@@ -26,5 +26,42 @@ class TestQuantumSimulator(unittest.TestCase):
         self.assertIsInstance(result, dict)
         self.assertTrue(all(isinstance(k, str) and isinstance(v, int) for k, v in result.items()))
 
+    def test_numpy_backend_samples_exact_product_state(self):
+        simulator = QuantumScenarioSimulator(num_qubits=3, shots=4000, seed=1)
+        # Qubit 0 fully flipped, qubit 1 untouched, qubit 2 in equal superposition
+        result = simulator.run_simulation([np.pi, 0.0, np.pi / 2])
+        self.assertEqual(set(result), {"001", "101"})
+        self.assertEqual(sum(result.values()), 4000)
+        self.assertAlmostEqual(result["101"] / 4000, 0.5, delta=0.05)
+
+    def test_run_sweep_returns_count_matrix(self):
+        simulator = QuantumScenarioSimulator(num_qubits=3, shots=2000, seed=4)
+        param_matrix = np.random.default_rng(0).uniform(0, np.pi, (50, 3))
+        counts = simulator.run_sweep(param_matrix)
+        self.assertEqual(counts.shape, (50, 8))
+        self.assertTrue(np.all(counts.sum(axis=1) == 2000))
+        np.testing.assert_allclose(counts / 2000, simulator.probabilities(param_matrix), atol=0.06)
+        # Row distributions agree with the single-vector path
+        np.testing.assert_allclose(simulator.probabilities(param_matrix)[7],
+                                   simulator.probabilities(param_matrix[7]))
+        with self.assertRaises(ValueError):
+            simulator.run_sweep(np.zeros((2, 4)))
+
+    def test_qiskit_is_not_imported_for_numpy_backend(self):
+        # Run in a fresh interpreter so modules imported by other tests don't leak in
+        import os
+        import subprocess
+        import sys
+        code = (
+            "import sys\n"
+            "from quantum_engine import QuantumScenarioSimulator\n"
+            "QuantumScenarioSimulator(num_qubits=2).run_simulation([0.3, 1.2])\n"
+            "sys.exit('qiskit' in sys.modules)\n"
+        )
+        completed = subprocess.run([sys.executable, "-c", code],
+                                   cwd=os.path.dirname(os.path.abspath(__file__)),
+                                   capture_output=True, text=True)
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,95 @@
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+quality_forecasting = pytest.importorskip("quality_forecasting")
+QualityForecastingEngine = quality_forecasting.QualityForecastingEngine
+ProcessParameters = quality_forecasting.ProcessParameters
+EnvironmentalData = quality_forecasting.EnvironmentalData
+
+
+class FirstFeatureModel:
+    """Stub regressor predicting each row's first feature, the process temperature"""
+
+    def predict(self, features):
+        return np.asarray(features)[:, 0]
+
+
+class IdentityScaler:
+    def transform(self, features):
+        return features
+
+
+def stub_engine(product_id):
+    engine = QualityForecastingEngine(product_id, model_type="single")
+    for metric in engine.models:
+        engine.models[metric] = FirstFeatureModel()
+        engine.scalers[metric] = IdentityScaler()
+    engine.quality_specifications = {}
+    engine.is_trained = True
+    return engine
+
+
+def batch_inputs(temperature):
+    process = ProcessParameters(
+        temperature=temperature, pressure=1.0, humidity=45.0, mixing_speed=200.0,
+        mixing_time=30.0, drying_temperature=60.0, drying_time=120.0,
+        granulation_liquid_amount=10.0, compression_force=15.0,
+        coating_spray_rate=50.0, air_flow_rate=1000.0,
+    )
+    environment = EnvironmentalData(
+        room_temperature=22.0, room_humidity=40.0, room_pressure_differential=15.0,
+        particulate_count_05um=1000, particulate_count_5um=10,
+        air_changes_per_hour=20.0, operator_count=3, shift="day",
+    )
+    return process, environment, None
+
+
+def test_predict_batch_keeps_input_order_and_unique_ids():
+    engine = stub_engine("P-1")
+    temperatures = [20.0, 25.0, 30.0, 25.0]
+
+    results = engine.predict_batch([batch_inputs(t) for t in temperatures], forecast_days=3)
+
+    assert [r["predictions"]["purity"]["initial_value"] for r in results] == temperatures
+    assert len({r["prediction_id"] for r in results}) == len(temperatures)
+    assert engine.prediction_history == results
+
+
+def test_failing_product_does_not_stop_the_others():
+    orchestrator_module = pytest.importorskip("digital_twin_orchestrator")
+
+    def fail(inputs, forecast_days=30):
+        raise RuntimeError("model unavailable")
+
+    failing = stub_engine("P-FAIL")
+    failing.predict_batch = fail
+    orchestrator = orchestrator_module.DigitalTwinOrchestrator.__new__(
+        orchestrator_module.DigitalTwinOrchestrator
+    )
+    orchestrator.config = SimpleNamespace(prediction_horizon_days=3)
+    orchestrator.system_metrics = {"predictions_made": 0}
+    orchestrator.quality_engines = {"P-OK": stub_engine("P-OK"), "P-FAIL": failing}
+    orchestrator.active_batches = {}
+    for batch_id, product_id, temperature in (
+        ("B1", "P-OK", 20.0), ("B2", "P-FAIL", 25.0), ("B3", "P-OK", 30.0)
+    ):
+        _, environment, _ = batch_inputs(temperature)
+        orchestrator.active_batches[batch_id] = {
+            "product_id": product_id,
+            "status": "initialized",
+            "process_data": {"temperature": temperature},
+            "environmental_data": environment,
+            "quality_data": {},
+            "predictions": {},
+        }
+
+    predictions = asyncio.run(orchestrator.score_active_batches())
+
+    assert set(predictions) == {"B1", "B3"}
+    assert predictions["B1"]["predictions"]["purity"]["initial_value"] == 20.0
+    assert predictions["B3"]["predictions"]["purity"]["initial_value"] == 30.0
+    assert orchestrator.active_batches["B2"]["predictions"] == {}
+    assert orchestrator.system_metrics["predictions_made"] == 2
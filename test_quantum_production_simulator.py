@@ -0,0 +1,651 @@
+import os
+import tempfile
+import time
+import tracemalloc
+import unittest
+import numpy as np
+
+from quantum_gate_kernels import (
+    apply_hadamard,
+    apply_phase,
+    apply_controlled_rotation,
+    apply_crystallization,
+)
+from quantum_circuit_plan import (
+    compile_process_steps,
+    step_signature,
+    DiagonalOp,
+    SingleQubitOp,
+)
+from quantum_result_cache import SimulationResultCache, simulation_cache_key
+from quantum_state_metrics import (
+    state_metrics,
+    shannon_entropy,
+    participation_ratio,
+    von_neumann_entropy,
+)
+from quantum_parameter_optimizer import (
+    DEFAULT_START,
+    ParameterOptimizer,
+    production_cost,
+    production_cost_gradient,
+)
+from quantum_production_simulator import (
+    QuantumProductionSimulator,
+    ProductionScenario,
+    QuantumState,
+    QuantumBackend,
+    BasisLabels,
+    SimulationPrecision,
+)
+
+
+def make_scenario(num_materials=3, steps=None):
+    return ProductionScenario(
+        batch_size=100.0,
+        target_molecule="Ibuprofen",
+        starting_materials=[{"isobutylbenzene": 10.0 + i} for i in range(num_materials)],
+        process_steps=steps or ["Mixing", "Reaction", "Purification", "Crystallization"],
+        equipment_constraints={},
+        quality_targets={"yield": 0.9, "purity": 0.99},
+        regulatory_requirements=["GMP"],
+        timeline_days=10,
+    )
+
+
+def random_state(n_qubits, seed=0):
+    rng = np.random.default_rng(seed)
+    amplitudes = rng.normal(size=2 ** n_qubits) + 1j * rng.normal(size=2 ** n_qubits)
+    return amplitudes / np.linalg.norm(amplitudes)
+
+
+def bit_identical(a, b):
+    return np.array_equal(a.view(np.int64), b.view(np.int64))
+
+
+class TestGateKernels(unittest.TestCase):
+    """Kernels must reproduce the original per-index loops exactly."""
+
+    n_qubits = 5
+
+    def test_hadamard_matches_loop(self):
+        amplitudes = random_state(self.n_qubits)
+        n = self.n_qubits
+        for qubit in range(n):
+            expected = amplitudes.copy()
+            for i in range(len(amplitudes)):
+                if not (i >> (n - qubit - 1)) & 1:
+                    j = i | (1 << (n - qubit - 1))
+                    expected[i] = (amplitudes[i] + amplitudes[j]) / np.sqrt(2)
+                    expected[j] = (amplitudes[i] - amplitudes[j]) / np.sqrt(2)
+            self.assertTrue(bit_identical(apply_hadamard(amplitudes, qubit), expected))
+
+    def test_phase_matches_loop(self):
+        amplitudes = random_state(self.n_qubits, seed=1)
+        n = self.n_qubits
+        for qubit in range(n):
+            expected = amplitudes.copy()
+            for i in range(len(amplitudes)):
+                if (i >> (n - qubit - 1)) & 1:
+                    expected[i] *= np.exp(1j * np.pi / 6)
+            self.assertTrue(bit_identical(apply_phase(amplitudes, qubit, np.pi / 6), expected))
+
+    def test_controlled_rotation_matches_loop(self):
+        amplitudes = random_state(self.n_qubits, seed=2)
+        n = self.n_qubits
+        angle = np.pi / 4
+        for control in range(n - 1):
+            target = control + 1
+            expected = amplitudes.copy()
+            for i in range(len(amplitudes)):
+                if (i >> (n - control - 1)) & 1 and not (i >> (n - target - 1)) & 1:
+                    j = i | (1 << (n - target - 1))
+                    expected[i] = np.cos(angle) * amplitudes[i] - 1j * np.sin(angle) * amplitudes[j]
+                    expected[j] = -1j * np.sin(angle) * amplitudes[i] + np.cos(angle) * amplitudes[j]
+            result = apply_controlled_rotation(amplitudes, control, target, angle)
+            self.assertTrue(bit_identical(result, expected))
+
+    def test_crystallization_preserves_norm(self):
+        amplitudes = random_state(self.n_qubits, seed=3)
+        result = apply_crystallization(amplitudes.copy())
+        self.assertAlmostEqual(np.linalg.norm(result), 1.0)
+
+
+class TestCircuitPlan(unittest.TestCase):
+    def test_fused_plan_matches_gate_by_gate_evolution(self):
+        simulator = QuantumProductionSimulator()
+        steps = ["Mixing", "Purification", "Reaction", "Mixing", "Crystallization", "Purification"]
+        n_qubits = 6
+        amplitudes = random_state(n_qubits, seed=4)
+
+        expected = amplitudes.copy()
+        expected = simulator._apply_mixing_gate(expected)
+        expected = simulator._apply_purification_gate(expected)
+        expected = simulator._apply_reaction_gate(expected)
+        expected = simulator._apply_mixing_gate(expected)
+        expected = simulator._apply_crystallization_gate(expected)
+        expected = simulator._apply_purification_gate(expected)
+
+        plan = compile_process_steps(steps, n_qubits)
+        np.testing.assert_allclose(plan.apply(amplitudes.copy()), expected, atol=1e-12)
+        self.assertLess(len(plan.operations), plan.gate_count)
+
+    def test_long_route_runs_in_two_buffers(self):
+        # Large enough that NumPy's fixed-size ufunc buffers are negligible
+        n_qubits = 18
+        plan = compile_process_steps(["Mixing", "Reaction", "Purification", "Crystallization"] * 5,
+                                     n_qubits)
+        amplitudes = random_state(n_qubits, seed=5)
+        workspace = np.empty_like(amplitudes)
+
+        tracemalloc.start()
+        try:
+            result = plan.apply(amplitudes, workspace)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # Both buffers are supplied, so only small per-gate scratch is allocated
+        self.assertLess(peak, amplitudes.nbytes // 8)
+        self.assertTrue(result is amplitudes or result is workspace)
+        self.assertAlmostEqual(np.linalg.norm(result), 1.0)
+
+    def test_adjacent_gates_are_fused(self):
+        plan = compile_process_steps(["Mixing", "Purification", "Purification"], 4)
+        kinds = [type(op) for op in plan.operations]
+        # Two mixed wires become one 2x2 each; the rest collapse to one diagonal
+        self.assertEqual(kinds.count(SingleQubitOp), 2)
+        self.assertEqual(kinds.count(DiagonalOp), 1)
+
+    def test_plans_are_cached_by_step_signature(self):
+        first = compile_process_steps(["Wet mixing", "Reaction", "Drying"], 5)
+        second = compile_process_steps(["mixing", "reaction step"], 5)
+        self.assertEqual(step_signature(["Wet mixing", "Drying"]), ("mixing",))
+        self.assertIs(first, second)
+
+
+class TestQuantumProductionSimulator(unittest.TestCase):
+    def test_simulate_production_scenario(self):
+        simulator = QuantumProductionSimulator()
+        result = simulator.simulate_production_scenario(make_scenario(), num_shots=500)
+        counts = result["measurement_results"]["measurement_counts"]
+        self.assertEqual(sum(counts.values()), 500)
+        self.assertTrue(all(len(label) == result["qubit_count"] for label in counts))
+        self.assertIn("predicted_yield", result["optimized_parameters"])
+
+    def test_phase_encoding_matches_per_material_loop(self):
+        simulator = QuantumProductionSimulator()
+        scenario = make_scenario(6)
+        qubit_count = simulator.initialize_quantum_circuit(scenario)
+
+        expected = np.full(2 ** qubit_count, 1.0 / np.sqrt(2 ** qubit_count), dtype=complex)
+        for i, material in enumerate(scenario.starting_materials):
+            phase = 2 * np.pi * list(material.values())[0] / 100
+            for j in range(len(expected)):
+                if (j >> i) & 1:
+                    expected[j] *= np.exp(1j * phase)
+
+        encoded = simulator._encode_scenario(scenario).amplitudes
+        np.testing.assert_allclose(encoded, expected, atol=1e-14)
+
+    def test_compare_scenarios(self):
+        simulator = QuantumProductionSimulator()
+        comparison = simulator.compare_scenarios(
+            [make_scenario(2), make_scenario(4, ["Reaction", "Crystallization"])], num_shots=200
+        )
+        self.assertEqual(len(comparison["scenarios"]), 2)
+        self.assertIn(comparison["best_scenario_index"], (0, 1))
+
+    def test_simulate_batch_matches_serial_predictions(self):
+        scenarios = [
+            make_scenario(2),
+            make_scenario(3),
+            make_scenario(4, ["Reaction", "Crystallization"]),
+        ]
+        batch_results = QuantumProductionSimulator().simulate_batch(scenarios, num_shots=300, seed=7)
+        self.assertEqual(len(batch_results), len(scenarios))
+
+        simulator = QuantumProductionSimulator()
+        for scenario, batch_result in zip(scenarios, batch_results):
+            serial_result = simulator.simulate_production_scenario(scenario, num_shots=300)
+            self.assertEqual(batch_result["qubit_count"], serial_result["qubit_count"])
+            self.assertEqual(batch_result["scenario_id"], serial_result["scenario_id"])
+            self.assertAlmostEqual(
+                batch_result["optimized_parameters"]["predicted_yield"],
+                serial_result["optimized_parameters"]["predicted_yield"],
+            )
+            counts = batch_result["measurement_results"]["measurement_counts"]
+            self.assertEqual(sum(counts.values()), 300)
+
+    def test_simulate_batch_is_reproducible_with_seed(self):
+        scenarios = [make_scenario(2), make_scenario(3)]
+        first = QuantumProductionSimulator().simulate_batch(scenarios, num_shots=200, seed=11)
+        second = QuantumProductionSimulator().simulate_batch(scenarios, num_shots=200, seed=11)
+        for a, b in zip(first, second):
+            self.assertEqual(a["measurement_results"]["measurement_counts"],
+                             b["measurement_results"]["measurement_counts"])
+
+    def test_compare_scenarios_with_worker_pool_matches_serial(self):
+        scenarios = [make_scenario(n) for n in (1, 2, 3, 5)]
+        simulator = QuantumProductionSimulator()
+        serial = simulator.compare_scenarios(scenarios, num_shots=100, seed=3)
+        pooled = simulator.compare_scenarios(scenarios, num_shots=100, workers=2, seed=3)
+        self.assertEqual(serial["best_scenario_index"], pooled["best_scenario_index"])
+        self.assertEqual([s["index"] for s in pooled["scenarios"]], [0, 1, 2, 3])
+        self.assertEqual([s["score"] for s in serial["scenarios"]],
+                         [s["score"] for s in pooled["scenarios"]])
+
+    def test_generator_threads_through_measurement(self):
+        scenario = make_scenario(4)
+        simulator = QuantumProductionSimulator()
+        first = simulator.simulate_production_scenario(scenario, 300, rng=np.random.default_rng(8))
+        second = simulator.simulate_production_scenario(scenario, 300, rng=np.random.default_rng(8))
+        self.assertEqual(first["measurement_results"]["measurement_counts"],
+                         second["measurement_results"]["measurement_counts"])
+        # Runs driven by a caller's generator are not treated as seeded
+        self.assertEqual(simulator.simulation_cache.stats()["hits"], 0)
+
+    def test_unseeded_runs_follow_global_seed(self):
+        scenario = make_scenario(4)
+        simulator = QuantumProductionSimulator()
+        np.random.seed(21)
+        first = simulator.simulate_production_scenario(scenario, 300)
+        np.random.seed(21)
+        second = simulator.simulate_production_scenario(scenario, 300)
+        self.assertEqual(first["measurement_results"]["measurement_counts"],
+                         second["measurement_results"]["measurement_counts"])
+
+
+class TestScenarioSweep(unittest.TestCase):
+    def make_scenarios(self):
+        scenarios = []
+        for days in (30, 10, 20, 5, 40):
+            scenario = make_scenario(2)
+            scenario.timeline_days = days
+            scenarios.append(scenario)
+        return scenarios
+
+    def test_sweep_scores_match_compare_scenarios(self):
+        scenarios = self.make_scenarios()
+        simulator = QuantumProductionSimulator()
+        comparison = simulator.compare_scenarios(scenarios, num_shots=100, seed=2)
+        sweep = simulator.sweep_scenarios(iter(scenarios), num_shots=100, top_k=2, seed=2)
+        summaries = list(sweep)
+        self.assertEqual([s["score"] for s in summaries],
+                         [s["score"] for s in comparison["scenarios"]])
+        self.assertNotIn("measurement_counts", summaries[0]["summary"])
+
+        top = sweep.top_results
+        self.assertEqual([r["index"] for r in top], [3, 1])
+        self.assertEqual(sweep.best["index"], comparison["best_scenario_index"])
+        self.assertIn("measurement_results", top[0]["result"])
+
+    def test_threshold_stops_a_lazy_sweep(self):
+        consumed = []
+
+        def grid():
+            for scenario in self.make_scenarios():
+                consumed.append(scenario)
+                yield scenario
+
+        simulator = QuantumProductionSimulator()
+        scores = [s["score"] for s in simulator.compare_scenarios(self.make_scenarios(), 100)["scenarios"]]
+        sweep = simulator.sweep_scenarios(grid(), num_shots=100, score_threshold=scores[1])
+        self.assertEqual([s["index"] for s in sweep], [0, 1])
+        self.assertTrue(sweep.stopped_early)
+        self.assertEqual(len(consumed), 2)
+
+    def test_worker_pool_sweep(self):
+        scenarios = self.make_scenarios()
+        simulator = QuantumProductionSimulator()
+        serial = simulator.sweep_scenarios(scenarios, num_shots=100, top_k=1, seed=6).run()
+        pooled = simulator.sweep_scenarios(scenarios, num_shots=100, top_k=1, seed=6,
+                                           workers=2).run()
+        self.assertEqual(serial[0]["index"], pooled[0]["index"])
+        self.assertEqual(serial[0]["score"], pooled[0]["score"])
+
+    def test_worker_pool_uses_simulator_settings(self):
+        steps = ["Mixing", "Reaction", "Crystallization", "Purification"]
+        scenarios = [make_scenario(n, steps) for n in (3, 5)]
+
+        def counts(simulator, workers=None):
+            results = simulator.sweep_scenarios(scenarios, num_shots=200, top_k=2, seed=3,
+                                                workers=workers).run()
+            return {r["index"]: r["result"]["measurement_results"]["measurement_counts"] for r in results}
+
+        narrow = QuantumProductionSimulator(QuantumBackend.MPS_SIMULATOR, max_bond_dimension=1)
+        serial = counts(narrow)
+        self.assertEqual(counts(narrow, workers=2), serial)
+        self.assertNotEqual(counts(QuantumProductionSimulator(QuantumBackend.MPS_SIMULATOR)), serial)
+
+        unchecked = QuantumProductionSimulator(precision=SimulationPrecision.SINGLE,
+                                               precision_check_interval=0)
+        pooled = unchecked.sweep_scenarios(scenarios, num_shots=100, top_k=2, seed=3, workers=2).run()
+        self.assertTrue(all("precision_report" not in r["result"] for r in pooled))
+
+
+class TestStateMetrics(unittest.TestCase):
+    def test_batch_matches_single_states(self):
+        batch = np.stack([random_state(6, seed=seed) for seed in range(4)])
+        probabilities = np.abs(batch) ** 2
+        metrics = state_metrics(probabilities, batch)
+        simulator = QuantumProductionSimulator()
+        for row, amplitudes in enumerate(batch):
+            single = state_metrics(probabilities[row], amplitudes)
+            self.assertEqual(metrics.row(row), single)
+            self.assertAlmostEqual(single.normalized_entropy,
+                                   simulator._calculate_entanglement(amplitudes), places=12)
+
+    def test_known_values(self):
+        bell = np.zeros(4, dtype=complex)
+        bell[[0, 3]] = np.sqrt(0.5)
+        product = np.full(4, 0.5, dtype=complex)
+        self.assertAlmostEqual(von_neumann_entropy(bell), 1.0)
+        self.assertAlmostEqual(von_neumann_entropy(product), 0.0)
+        self.assertAlmostEqual(shannon_entropy(np.abs(product) ** 2), 2.0)
+        self.assertAlmostEqual(participation_ratio(np.abs(bell) ** 2), 2.0)
+        # Zero probabilities contribute nothing rather than NaN
+        self.assertAlmostEqual(shannon_entropy(np.array([0.5, 0.5, 0.0, 0.0])), 1.0)
+
+    def test_metrics_reach_measurement_statistics(self):
+        result = QuantumProductionSimulator().simulate_production_scenario(make_scenario(), 200)
+        statistics = result["measurement_results"]["statistics"]
+        for key in ("state_entropy", "participation_ratio", "von_neumann_entropy"):
+            self.assertIn(key, statistics)
+
+
+class TestStateSampling(unittest.TestCase):
+    def make_state(self, n_qubits):
+        amplitudes = random_state(n_qubits, seed=6)
+        return QuantumState(amplitudes, BasisLabels(n_qubits), np.abs(amplitudes) ** 2, 0.0)
+
+    def test_both_sampling_regimes_match_distribution(self):
+        state = self.make_state(4)
+        # 20 shots over 16 states uses multinomial; 1 shot per call uses inverse CDF
+        for num_shots, calls in ((20000, 1), (1, 20000)):
+            rng = np.random.default_rng(0)
+            totals = np.zeros(16)
+            for _ in range(calls):
+                observed, counts = state.sample_counts(num_shots, rng)
+                self.assertEqual(counts.sum(), num_shots)
+                totals[observed] += counts
+            np.testing.assert_allclose(totals / 20000, state.measurement_probabilities, atol=0.01)
+
+    def test_zero_probability_states_are_never_sampled(self):
+        amplitudes = np.zeros(8, dtype=complex)
+        amplitudes[[2, 5]] = np.sqrt(0.5)
+        state = QuantumState(amplitudes, BasisLabels(3), np.abs(amplitudes) ** 2, 0.0)
+        for num_shots in (1, 100):
+            observed, _ = state.sample_counts(num_shots, np.random.default_rng(1))
+            self.assertTrue(set(observed) <= {2, 5})
+
+
+class TestBasisLabels(unittest.TestCase):
+    def test_labels_match_eager_list(self):
+        labels = BasisLabels(4)
+        self.assertEqual(len(labels), 16)
+        self.assertEqual(labels, [format(i, "04b") for i in range(16)])
+        self.assertEqual(labels[-1], "1111")
+        self.assertEqual(labels.index("0101"), 5)
+        self.assertIn("0011", labels)
+        self.assertNotIn("011", labels)
+
+    def test_label_counts_formats_only_observed_indices(self):
+        n_qubits = 20
+        state = QuantumState(np.zeros(1), BasisLabels(n_qubits), np.zeros(1), 0.0)
+        counts = state.label_counts(np.array([3, 2 ** n_qubits - 1]), np.array([7, 5]))
+        self.assertEqual(counts, {"0" * 18 + "11": 7, "1" * 20: 5})
+
+
+class TestSinglePrecision(unittest.TestCase):
+    def setUp(self):
+        self.scenario = make_scenario(num_materials=6)
+
+    def test_kernels_keep_complex64(self):
+        amplitudes = random_state(6).astype(np.complex64)
+        self.assertEqual(apply_hadamard(amplitudes, 1).dtype, np.complex64)
+        self.assertEqual(apply_phase(amplitudes, 2, 0.3).dtype, np.complex64)
+        self.assertEqual(apply_controlled_rotation(amplitudes, 0, 1, 0.7).dtype, np.complex64)
+        plan = compile_process_steps(["Mixing", "Reaction", "Purification", "Crystallization"], 6)
+        self.assertEqual(plan.apply(amplitudes).dtype, np.complex64)
+
+    def test_sampled_runs_carry_precision_report(self):
+        simulator = QuantumProductionSimulator(precision=SimulationPrecision.SINGLE,
+                                               precision_check_interval=2)
+        results = [simulator.simulate_production_scenario(self.scenario, 200, seed=seed)
+                   for seed in range(4)]
+        self.assertEqual(["precision_report" in r for r in results], [True, False, True, False])
+
+        report = results[0]["precision_report"]
+        self.assertTrue(report["within_tolerance"])
+        self.assertGreater(report["fidelity"], 1 - 1e-5)
+        self.assertLess(report["total_variation_distance"], 1e-4)
+        self.assertEqual(report["top_5_agreement"], 1.0)
+
+        summary = simulator.get_precision_summary()
+        self.assertEqual(summary["checks"], 2)
+        self.assertTrue(summary["all_within_tolerance"])
+
+    def test_pool_precision_checks_match_serial(self):
+        scenarios = []
+        for days in range(6):
+            scenario = make_scenario(num_materials=4)
+            scenario.timeline_days = 10 + days
+            scenarios.append(scenario)
+        serial = QuantumProductionSimulator(precision=SimulationPrecision.SINGLE,
+                                            precision_check_interval=10)
+        pooled = QuantumProductionSimulator(precision=SimulationPrecision.SINGLE,
+                                            precision_check_interval=10)
+        serial.compare_scenarios(scenarios, num_shots=100, seed=5)
+        pooled.compare_scenarios(scenarios, num_shots=100, seed=5, workers=2)
+
+        self.assertEqual(len(pooled.precision_reports), 1)
+        self.assertEqual(len(pooled.precision_reports), len(serial.precision_reports))
+        self.assertEqual(pooled.get_precision_summary(), serial.get_precision_summary())
+
+        swept = QuantumProductionSimulator(precision=SimulationPrecision.SINGLE,
+                                           precision_check_interval=10)
+        list(swept.sweep_scenarios(scenarios, num_shots=100, seed=5, workers=2))
+        self.assertEqual(len(swept.precision_reports), 1)
+
+    def test_matches_double_precision_scoring(self):
+        single = QuantumProductionSimulator(precision=SimulationPrecision.SINGLE)
+        double = QuantumProductionSimulator()
+        single_result = single.simulate_production_scenario(self.scenario, 200, seed=3)
+        double_result = double.simulate_production_scenario(self.scenario, 200, seed=3)
+        self.assertNotIn("precision_report", double_result)
+        for key in ("predicted_yield", "predicted_purity"):
+            self.assertAlmostEqual(single_result["optimized_parameters"][key],
+                                   double_result["optimized_parameters"][key], places=6)
+
+    def test_precision_in_cache_key(self):
+        single = QuantumProductionSimulator(precision=SimulationPrecision.SINGLE)
+        double = QuantumProductionSimulator()
+        self.assertNotEqual(
+            simulation_cache_key(self.scenario, 100, 1, **single._cache_settings()),
+            simulation_cache_key(self.scenario, 100, 1, **double._cache_settings()),
+        )
+
+    def test_batch_in_single_precision(self):
+        simulator = QuantumProductionSimulator(precision=SimulationPrecision.SINGLE)
+        results = simulator.simulate_batch([self.scenario, make_scenario(4)], 300, seed=0)
+        for result in results:
+            self.assertEqual(sum(result["measurement_results"]["measurement_counts"].values()), 300)
+
+
+class TestMPSBackend(unittest.TestCase):
+    def test_mps_state_matches_dense_evolution(self):
+        scenario = make_scenario(5, ["Mixing", "Reaction", "Crystallization", "Purification"])
+        dense = QuantumProductionSimulator()
+        dense.initialize_quantum_circuit(scenario)
+        dense_state = dense._apply_quantum_evolution(dense._encode_scenario(scenario), scenario)
+
+        mps = QuantumProductionSimulator(QuantumBackend.MPS_SIMULATOR)
+        mps.initialize_quantum_circuit(scenario)
+        mps_state = mps._simulate_mps_evolution(scenario)
+
+        np.testing.assert_allclose(mps_state.amplitudes, dense_state.amplitudes, atol=1e-10)
+        self.assertAlmostEqual(mps_state.entanglement_measure, dense_state.entanglement_measure)
+
+    def test_wide_register_runs_within_bond_budget(self):
+        scenario = make_scenario(300, ["Mixing", "Reaction", "Purification", "Reaction"])
+        scenario.quality_targets = {f"target_{i}": 0.9 for i in range(300)}
+        simulator = QuantumProductionSimulator(QuantumBackend.MPS_SIMULATOR, max_bond_dimension=8)
+        simulator.initialize_quantum_circuit(scenario)
+        state = simulator._simulate_mps_evolution(scenario)
+
+        self.assertGreater(state.mps.num_qubits, 20)
+        self.assertLessEqual(state.mps.bond_dimension, 8)
+        indices, counts = state.sample_counts(500, np.random.default_rng(0))
+        self.assertEqual(counts.sum(), 500)
+        self.assertTrue(all(len(state.basis_labels[i]) == state.mps.num_qubits for i in indices))
+
+
+class TestSimulationResultCache(unittest.TestCase):
+    def test_key_covers_whole_scenario(self):
+        base = make_scenario(2)
+        richer = make_scenario(2)
+        richer.quality_targets = {"yield": 0.8, "purity": 0.99}
+        self.assertNotEqual(simulation_cache_key(base, 100, 1), simulation_cache_key(richer, 100, 1))
+        self.assertNotEqual(simulation_cache_key(base, 100, 1), simulation_cache_key(base, 200, 1))
+        self.assertNotEqual(simulation_cache_key(base, 100, 1), simulation_cache_key(base, 100, 2))
+        self.assertEqual(simulation_cache_key(base, 100, 1), simulation_cache_key(make_scenario(2), 100, 1))
+
+    def test_lru_eviction(self):
+        cache = SimulationResultCache(max_entries=2)
+        cache.put("a", {"v": 1})
+        cache.put("b", {"v": 2})
+        cache.get("a")
+        cache.put("c", {"v": 3})
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_seeded_results_are_served_from_cache(self):
+        simulator = QuantumProductionSimulator()
+        first = simulator.simulate_production_scenario(make_scenario(), num_shots=100, seed=5)
+        second = simulator.simulate_production_scenario(make_scenario(), num_shots=100, seed=5)
+        self.assertEqual(first["timestamp"], second["timestamp"])
+        stats = simulator.simulation_cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_only_seeded_results_are_cached(self):
+        simulator = QuantumProductionSimulator()
+        simulator.simulate_production_scenario(make_scenario(), num_shots=100)
+        simulator.simulate_production_scenario(make_scenario(), num_shots=100, rng=np.random.default_rng(1))
+        simulator.simulate_batch([make_scenario(2), make_scenario(3)], num_shots=100, seed=4)
+        self.assertEqual(len(simulator.simulation_cache), 0)
+        simulator.simulate_production_scenario(make_scenario(), num_shots=100, seed=4)
+        self.assertEqual(len(simulator.simulation_cache), 1)
+
+    def test_cached_results_are_isolated_from_callers(self):
+        simulator = QuantumProductionSimulator()
+        first = simulator.simulate_production_scenario(make_scenario(), num_shots=100, seed=5)
+        counts = dict(first["measurement_results"]["measurement_counts"])
+        first["fda_report_files"] = {"json": "report.json"}
+        first["measurement_results"]["measurement_counts"].clear()
+
+        second = simulator.simulate_production_scenario(make_scenario(), num_shots=100, seed=5)
+        self.assertNotIn("fda_report_files", second)
+        self.assertEqual(second["measurement_results"]["measurement_counts"], counts)
+        second["measurement_results"]["measurement_counts"].clear()
+        third = simulator.simulate_production_scenario(make_scenario(), num_shots=100, seed=5)
+        self.assertEqual(third["measurement_results"]["measurement_counts"], counts)
+
+    def test_disk_tier_prunes_least_recently_used_files(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = SimulationResultCache(max_entries=1, cache_dir=cache_dir, max_disk_entries=2)
+            path = lambda key: os.path.join(cache_dir, f"{key}.json")
+            cache.put("a", {"v": 1})
+            cache.put("b", {"v": 2})
+            os.utime(path("a"), (1000, 1000))
+            os.utime(path("b"), (2000, 2000))
+            self.assertEqual(cache.get("a"), {"v": 1})  # A disk hit refreshes "a"
+            cache.put("c", {"v": 3})
+            self.assertEqual(sorted(os.listdir(cache_dir)), ["a.json", "c.json"])
+            self.assertEqual(cache.stats()["disk_evictions"], 1)
+
+            small = SimulationResultCache(cache_dir=cache_dir, max_disk_bytes=os.path.getsize(path("c")))
+            small.put("d", {"v": 4})
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    def test_disk_tier_survives_restart(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = QuantumProductionSimulator(cache_dir=cache_dir).simulate_production_scenario(
+                make_scenario(), num_shots=100, seed=9
+            )
+            restarted = QuantumProductionSimulator(cache_dir=cache_dir)
+            second = restarted.simulate_production_scenario(make_scenario(), num_shots=100, seed=9)
+            self.assertEqual(first["scenario_id"], second["scenario_id"])
+            self.assertEqual(
+                {k: int(v) for k, v in first["measurement_results"]["measurement_counts"].items()},
+                second["measurement_results"]["measurement_counts"],
+            )
+            self.assertEqual(restarted.simulation_cache.stats()["disk_hits"], 1)
+
+
+class TestParameterOptimizer(unittest.TestCase):
+    def test_gradient_matches_finite_differences(self):
+        params = np.array([0.7, 0.8, 1.3])
+        args = (0.9, 0.99, 0.4)
+        step = 1e-6
+        numeric = [
+            (production_cost(params + step * unit, *args)
+             - production_cost(params - step * unit, *args)) / (2 * step)
+            for unit in np.eye(3)
+        ]
+        np.testing.assert_allclose(production_cost_gradient(params, *args), numeric, atol=1e-6)
+
+    def test_memoizes_on_targets_and_rounded_entanglement(self):
+        optimizer = ParameterOptimizer(entanglement_decimals=3)
+        first = optimizer.optimize({"yield": 0.9}, 0.41231)
+        second = optimizer.optimize({"yield": 0.9}, 0.41229)
+        self.assertEqual(optimizer.stats()["hits"], 1)
+        np.testing.assert_array_equal(first[0], second[0])
+        # The cost still reflects each state's exact entanglement
+        self.assertNotEqual(first[2], second[2])
+
+    def test_warm_start_reuses_nearest_solution(self):
+        optimizer = ParameterOptimizer()
+        cold_params, _, _ = optimizer.optimize({"yield": 0.9, "purity": 0.99}, 0.5)
+        cold_evaluations = optimizer.stats()["function_evaluations"]
+        warm_params, converged, _ = optimizer.optimize({"yield": 0.91, "purity": 0.99}, 0.5)
+        stats = optimizer.stats()
+        self.assertTrue(converged)
+        self.assertEqual(stats["warm_starts"], 1)
+        self.assertLess(stats["function_evaluations"] - cold_evaluations, cold_evaluations)
+        np.testing.assert_allclose(warm_params, cold_params)
+
+    def test_solutions_are_bounded(self):
+        optimizer = ParameterOptimizer(max_entries=2)
+        for entanglement in (0.1, 0.2, 0.3):
+            optimizer.optimize({}, entanglement)
+        self.assertEqual(len(optimizer), 2)
+
+    def test_warm_start_tracks_evictions(self):
+        optimizer = ParameterOptimizer(max_entries=8)
+        for entanglement in np.linspace(0.05, 0.95, 20):
+            optimizer.optimize({"yield": 0.9}, entanglement)
+        for entanglement in (0.0, 0.3, 0.62, 1.0):
+            key = (0.9, 0.99, entanglement)
+            nearest = min(optimizer._solutions,
+                          key=lambda k: sum((a - b) ** 2 for a, b in zip(k, key)))
+            self.assertIs(optimizer._warm_start(key), optimizer._solutions[nearest][0])
+
+        optimizer.clear()
+        self.assertIsNone(optimizer._warm_start((0.9, 0.99, 0.5)))
+
+    def test_warm_start_lookup_does_not_rebuild_memo(self):
+        optimizer = ParameterOptimizer()
+        solution = (DEFAULT_START, True)
+        for index in range(optimizer.max_entries + 100):
+            optimizer._remember((0.9, 0.99, index / 5000), solution)
+
+        start = time.perf_counter()
+        for index in range(100):
+            optimizer._warm_start((0.9, 0.99, index / 100))
+        # A rebuild of the 4096-entry memo took ~2 ms per lookup
+        self.assertLess(time.perf_counter() - start, 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,36 @@
 """Tests for the Molecule Twin module"""
 
+import pickle
+import sys
 import pytest
 import numpy as np
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 
 from src.models.molecule_twin import (
     MoleculeTwin,
     MolecularState,
     MolecularProperty,
-    ProcessConditions
+    ProcessConditions,
+    stable_twin_id
+)
+from src.models.molecule_fleet import (
+    MoleculeFleet,
+    condition_columns,
+    condition_grid,
+    ich_zone_axis,
+    ICH_CLIMATIC_ZONES
+)
+from src.models.process_history import ProcessHistory
+from src.models.molecule_property_cache import PropertyCache
+from src.models.molecule_lineage import LineageIndex
+from src.models.degradation_kinetics import (
+    ArrheniusModel,
+    arrhenius_model,
+    degradation_rate,
+    degradation_rates,
+    stability_index,
+    stability_indices
 )
 
 
@@ -256,6 +278,549 @@ class TestMoleculeTwin:
         assert final_purity > 90.0  # Still pharmaceutical grade
 
 
+class TestMoleculeFleet:
+    """Test cases for the vectorized MoleculeFleet"""
+
+    @pytest.fixture
+    def twins_and_conditions(self):
+        """Twins paired with conditions spanning every efficiency and stability branch"""
+        rng = np.random.default_rng(7)
+        twins = [MoleculeTwin(f"C{'C' * i}O", f"Molecule{i}") for i in range(50)]
+        conditions = [
+            ProcessConditions(
+                temperature=rng.uniform(0, 80), pressure=1.0, ph=rng.uniform(1, 13),
+                humidity=rng.uniform(20, 99), light_exposure=rng.uniform(0, 5000),
+                oxygen_level=21.0, mixing_speed=rng.uniform(0, 500), reaction_time=30.0
+            )
+            for _ in twins
+        ]
+        return twins, conditions
+
+    @pytest.fixture
+    def ibuprofen_twin_pair(self):
+        """Identical twins under one set of off-optimum conditions"""
+        twins = [MoleculeTwin("CC(C)CC1=CC=C(C=C1)C(C)C(=O)O", "Ibuprofen") for _ in range(4)]
+        conditions = ProcessConditions(
+            temperature=30.0, pressure=1.0, ph=6.0, humidity=70.0,
+            light_exposure=500.0, oxygen_level=21.0, mixing_speed=50.0, reaction_time=30.0
+        )
+        return twins, conditions
+
+    def test_step_matches_scalar_twins(self, twins_and_conditions):
+        """A fleet step reproduces simulate_process_step on every twin"""
+        twins, conditions = twins_and_conditions
+        fleet = MoleculeFleet.from_twins(twins)
+
+        for _ in range(3):
+            result = fleet.simulate_process_step(conditions, duration=45)
+            records = [twin.simulate_process_step(c, 45) for twin, c in zip(twins, conditions)]
+
+            for metric in ("purity", "yield", "stability_index"):
+                expected = [record["quality_metrics"][metric] for record in records]
+                np.testing.assert_allclose(result["quality_metrics"][metric], expected, rtol=1e-12)
+            np.testing.assert_allclose(result["degradation_rate"],
+                                       [record["degradation_rate"] for record in records], rtol=1e-12)
+
+        assert fleet.quality_metrics(0) == pytest.approx(twins[0].quality_metrics)
+
+    def test_shared_conditions_broadcast(self, ibuprofen_twin_pair):
+        """A single ProcessConditions applies to the whole fleet"""
+        twins, conditions = ibuprofen_twin_pair
+        fleet = MoleculeFleet.from_twins(twins)
+
+        result = fleet.simulate_process_step(conditions, duration=60)
+        expected = twins[0].simulate_process_step(conditions, 60)
+
+        assert result["degradation_rate"].shape == (len(twins),)
+        np.testing.assert_allclose(result["quality_metrics"]["purity"], expected["quality_metrics"]["purity"])
+
+    def test_fleet_does_not_modify_twins(self, ibuprofen_twin_pair):
+        """Fleet steps are what-ifs on a snapshot of the twins"""
+        twins, conditions = ibuprofen_twin_pair
+        fleet = MoleculeFleet.from_twins(twins)
+        fleet.simulate_process_step(conditions, duration=60)
+
+        assert twins[0].quality_metrics == {}
+        assert twins[0].process_history == []
+        assert fleet.steps == 1
+
+    def test_property_columns(self, ibuprofen_twin_pair):
+        """Properties are stored as one column per field"""
+        twins, _ = ibuprofen_twin_pair
+        fleet = MoleculeFleet.from_twins(twins)
+
+        np.testing.assert_array_equal(fleet.properties["molecular_weight"],
+                                      [t.properties.molecular_weight for t in twins])
+        assert fleet.properties["solubility.water"][1] == twins[1].properties.solubility["water"]
+        assert fleet.properties["pka_values"][2, 0] == twins[2].properties.pka_values[0]
+
+    def test_condition_columns_rejects_unknown_fields(self):
+        """Condition mappings must use ProcessConditions field names"""
+        with pytest.raises(ValueError):
+            condition_columns({"temperature": [25.0], "temp": [30.0]})
+
+
+class TestShelfLifeGrid:
+    """Test cases for vectorized shelf-life prediction"""
+
+    @pytest.fixture
+    def twin(self):
+        twin = MoleculeTwin("CC(=O)OC1=CC=CC=C1C(=O)O", "Aspirin")
+        twin.quality_metrics["purity"] = 99.5
+        return twin
+
+    @pytest.fixture
+    def base_conditions(self):
+        return ProcessConditions(
+            temperature=25.0, pressure=1.0, ph=7.0, humidity=60.0,
+            light_exposure=0.0, oxygen_level=21.0, mixing_speed=200.0, reaction_time=30.0
+        )
+
+    def test_grid_matches_scalar_prediction(self, twin, base_conditions):
+        """Every grid point agrees with predict_shelf_life"""
+        criteria = {"min_purity": 96.0}
+        light_levels = [0.0, 50.0, 200.0, 1000.0]
+        grid = condition_grid(base_conditions, ich_zone_axis(), light_exposure=light_levels)
+
+        result = twin.predict_shelf_life_grid(grid, criteria)
+        assert result["shelf_life_months"].shape == (len(ICH_CLIMATIC_ZONES), len(light_levels))
+
+        for i, (temperature, humidity) in enumerate(ICH_CLIMATIC_ZONES.values()):
+            for j, light in enumerate(light_levels):
+                conditions = ProcessConditions(**{**base_conditions.to_dict(), "temperature": temperature,
+                                                  "humidity": humidity, "light_exposure": light})
+                months, profile = twin.predict_shelf_life(conditions, criteria)
+
+                assert result["shelf_life_months"][i, j] == pytest.approx(months)
+                assert result["stability_index"][i, j] == pytest.approx(profile["stability_index"])
+                assert result["degradation_rate_per_month"][i, j] == pytest.approx(
+                    profile["degradation_rate_per_month"])
+                for key, advice in profile["storage_recommendations"].items():
+                    assert result["storage_recommendations"][key][i, j] == advice
+
+    def test_grid_axes_stay_compact(self, base_conditions):
+        """Grid columns broadcast against each other instead of being expanded"""
+        grid = condition_grid(base_conditions, temperature=np.linspace(0, 50, 20), humidity=[30, 60, 90])
+
+        assert grid["temperature"].shape == (20, 1)
+        assert grid["humidity"].shape == (1, 3)
+        assert grid["ph"].shape == ()
+
+    def test_grid_rejects_repeated_fields(self, base_conditions):
+        """A field can only vary along one axis"""
+        with pytest.raises(ValueError):
+            condition_grid(base_conditions, ich_zone_axis(), temperature=[20, 30])
+
+    def test_fleet_grid_leads_with_molecule_axis(self, twin, base_conditions):
+        """A fleet predicts every molecule under every condition"""
+        other = MoleculeTwin("CCO", "Ethanol")
+        fleet = MoleculeFleet.from_twins([twin, other])
+        grid = condition_grid(base_conditions, temperature=[5, 25, 40])
+
+        result = fleet.predict_shelf_life_grid(grid, {"min_purity": 95.0})
+
+        assert result["shelf_life_months"].shape == (2, 3)
+        # The twin starts at 99.5% purity, the fresh one at the default 99.9%
+        assert np.all(result["shelf_life_months"][0] < result["shelf_life_months"][1])
+
+
+class TestProcessHistory:
+    """Test cases for the bounded, columnar process history"""
+
+    @pytest.fixture
+    def conditions(self):
+        return ProcessConditions(
+            temperature=30.0, pressure=1.0, ph=7.0, humidity=50.0,
+            light_exposure=100.0, oxygen_level=21.0, mixing_speed=200.0, reaction_time=30.0
+        )
+
+    def test_records_round_trip(self, conditions):
+        """Stored steps read back equal to the records that were returned"""
+        twin = MoleculeTwin("CCO", "Ethanol")
+        records = [twin.simulate_process_step(conditions, duration=30) for _ in range(20)]
+
+        assert len(twin.process_history) == 20
+        assert twin.process_history[0] == records[0]
+        assert twin.process_history[-1] == records[-1]
+        assert twin.process_history[-10:] == records[-10:]
+        assert twin.to_dict()["process_history"] == records[-10:]
+
+    def test_retention_cap_and_spill(self, conditions, tmp_path):
+        """Records beyond the cap spill to disk oldest first"""
+        spill_path = str(tmp_path / "history.bin")
+        twin = MoleculeTwin("CCO", "Ethanol", history_capacity=8, history_spill_path=spill_path)
+        records = [twin.simulate_process_step(conditions, duration=30) for _ in range(50)]
+
+        history = twin.process_history
+        assert len(history) <= 8
+        assert history.appended == 50
+        assert history[:] == records[-len(history):]
+
+        spilled = history.read_spill()
+        assert len(spilled) == history.evicted == 50 - len(history)
+        np.testing.assert_array_equal(spilled["sequence"], np.arange(len(spilled)))
+        np.testing.assert_array_equal(spilled["purity"],
+                                      [r["quality_metrics"]["purity"] for r in records[:len(spilled)]])
+
+    def test_column_views(self, conditions):
+        """Columns are read-only views for trend analysis"""
+        twin = MoleculeTwin("CCO", "Ethanol")
+        records = [twin.simulate_process_step(conditions, duration=30) for _ in range(5)]
+
+        purity = twin.process_history.column("purity")
+        np.testing.assert_array_equal(purity, [r["quality_metrics"]["purity"] for r in records])
+        assert np.all(np.diff(purity) < 0)
+        assert not purity.flags.writeable
+        assert twin.process_history.column("temperature")[0] == conditions.temperature
+
+    def test_other_records_keep_their_order(self):
+        """Records that are not process steps are stored as they are"""
+        history = ProcessHistory(("temperature",), capacity=4)
+        history.append({"event": "sampled"})
+        history.append({"timestamp": "2024-01-01T00:00:00", "conditions": {"temperature": 25.0},
+                        "duration_minutes": 5, "degradation_rate": 0.01,
+                        "quality_metrics": {"purity": 99.0, "yield": 98.0, "stability_index": 95.0}})
+
+        assert history[0] == {"event": "sampled"}
+        assert history[1]["conditions"] == {"temperature": 25.0}
+        assert history.rows["kind"].tolist() == [1, 0]
+
+
+class TestBulkConstruction:
+    """Test cases for MoleculeTwin.from_many"""
+    
+    @pytest.fixture
+    def records(self):
+        return [
+            ("CC(C)CC1=CC=C(C=C1)C(C)C(=O)O", "Ibuprofen", "15687-27-1"),
+            ("CC(=O)NC1=CC=C(C=C1)O", "Acetaminophen"),
+            {"smiles": "CC(C)(C)NCC(C1=CC(=C(C=C1)O)O)O", "name": "Salbutamol", "cas_number": "18559-94-9"},
+        ]
+    
+    def test_twins_match_records(self, records):
+        """Each record becomes a fresh raw-material twin"""
+        twins = MoleculeTwin.from_many(records, seed=1)
+        
+        assert [t.name for t in twins] == ["Ibuprofen", "Acetaminophen", "Salbutamol"]
+        assert twins[1].cas_number is None
+        assert twins[2].cas_number == "18559-94-9"
+        for twin in twins:
+            assert twin.state == MolecularState.RAW_MATERIAL
+            assert len(twin.id) == 16
+            assert len(twin.process_history) == 0
+            assert twin.quality_metrics == {}
+    
+    def test_deterministic_ids_and_properties(self, records):
+        """The same records, seed and namespace reproduce the same twins"""
+        first = MoleculeTwin.from_many(records, seed=42, namespace="library")
+        second = MoleculeTwin.from_many(records, seed=42, namespace="library")
+        
+        assert [t.id for t in first] == [t.id for t in second]
+        assert [t.properties for t in first] == [t.properties for t in second]
+        assert first[0].id == stable_twin_id("library", *records[0])
+        
+        other_namespace = MoleculeTwin.from_many(records, seed=42, namespace="BATCH-2")
+        assert first[0].id != other_namespace[0].id
+    
+    def test_seeded_properties_ignore_call_mix_and_cache(self, monkeypatch):
+        """A seeded molecule's properties depend only on the seed and its SMILES"""
+        monkeypatch.setattr(MoleculeTwin, "property_cache", PropertyCache())
+        pair = MoleculeTwin.from_many([("CCO", "Ethanol"), ("CCN", "Ethylamine")], seed=1)
+        
+        monkeypatch.setattr(MoleculeTwin, "property_cache", PropertyCache())
+        MoleculeTwin("CCO", "Ethanol")  # Caches an unseeded record first
+        alone = MoleculeTwin.from_many([("CCN", "Ethylamine")], seed=1)
+        mixed = MoleculeTwin.from_many([("CCC", "Propane"), ("CCO", "Ethanol"), ("CCN", "Ethylamine")], seed=1)
+        
+        assert alone[0].properties == pair[1].properties
+        assert mixed[1].properties == pair[0].properties
+        assert mixed[2].properties == pair[1].properties
+        assert MoleculeTwin.from_many([("CCN", "Ethylamine")], seed=2)[0].properties != pair[1].properties
+    
+    def test_repeated_records_get_distinct_ids(self):
+        """Duplicates within one call are numbered by occurrence"""
+        twins = MoleculeTwin.from_many([("CCO", "Ethanol")] * 3, seed=0)
+        
+        assert len({t.id for t in twins}) == 3
+    
+    def test_property_ranges(self):
+        """Bulk draws follow the single-twin property distributions"""
+        twins = MoleculeTwin.from_many([("C" * (i + 1) + "Cl", f"Lot-{i}") for i in range(500)], seed=3)
+        props = [t.properties for t in twins]
+        
+        assert all(150 <= p.molecular_weight <= 500 for p in props)
+        assert all(1 <= len(p.pka_values) <= 2 for p in props)
+        assert all(2 <= v <= 12 for p in props for v in p.pka_values)
+        assert {p.synthesis_complexity for p in props} <= set(range(1, 10))
+        assert isinstance(props[0].molecular_weight, float)
+    
+    def test_bulk_records_match_constructed_records(self):
+        """Records built on the bulk path equal and behave like constructed ones"""
+        record = MoleculeTwin.from_many([("CCO", "Ethanol")], seed=5)[0].properties
+        rebuilt = MolecularProperty.from_dict(record.to_dict())
+        
+        assert rebuilt == record
+        assert isinstance(record.pka_values, tuple)
+        with pytest.raises(TypeError):
+            record.solubility["water"] = 0.0
+        with pytest.raises(FrozenInstanceError):
+            record.logp = 0.0
+        assert pickle.loads(pickle.dumps(record)) == record
+
+
+class TestPropertyCache:
+    """Test cases for shared property records"""
+    
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, monkeypatch):
+        monkeypatch.setattr(MoleculeTwin, "property_cache", PropertyCache(max_entries=3))
+    
+    def test_same_smiles_shares_one_record(self):
+        """Twins of the same molecule reference the same immutable record"""
+        first = MoleculeTwin("CC(=O)OC1=CC=CC=C1C(=O)O", "Aspirin", "50-78-2")
+        second = MoleculeTwin(" CC(=O)OC1=CC=CC=C1C(=O)O ", "Aspirin lot 2")
+        
+        assert first.properties is second.properties
+        assert MoleculeTwin.property_cache.stats()["hits"] == 1
+        with pytest.raises(FrozenInstanceError):
+            first.properties.molecular_weight = 1.0
+    
+    def test_shared_containers_are_read_only(self):
+        """Nested property containers cannot be changed through any twin"""
+        first = MoleculeTwin("CC(=O)OC1=CC=CC=C1C(=O)O", "Aspirin")
+        second = MoleculeTwin("CC(=O)OC1=CC=CC=C1C(=O)O", "Aspirin lot 2")
+        water = second.properties.solubility["water"]
+        
+        with pytest.raises(TypeError):
+            first.properties.solubility["water"] = 0.0
+        with pytest.raises(TypeError):
+            first.properties.stability_profile["40C_75RH"] = 1.0
+        with pytest.raises(AttributeError):
+            first.properties.pka_values.append(7.0)
+        assert second.properties.solubility["water"] == water
+        
+        # Copies handed out by to_dict are the caller's to change
+        data = first.properties.to_dict()
+        data["solubility"]["water"] = 0.0
+        assert second.properties.solubility["water"] == water
+        assert pickle.loads(pickle.dumps(first.properties)) == first.properties
+    
+    def test_bulk_construction_reuses_cached_records(self):
+        """from_many draws only for molecules the cache has not seen"""
+        existing = MoleculeTwin("CCO", "Ethanol")
+        twins = MoleculeTwin.from_many([("CCO", "Ethanol lot"), ("CCN", "Ethylamine"), ("CCN", "Ethylamine lot")])
+        
+        assert twins[0].properties is existing.properties
+        assert twins[1].properties is twins[2].properties
+        assert len(MoleculeTwin.property_cache) == 2
+    
+    def test_cache_is_size_bounded(self):
+        """Least recently used records are evicted beyond max_entries"""
+        for smiles in ["C", "CC", "CCC", "CCCC"]:
+            MoleculeTwin(smiles, smiles)
+        
+        assert len(MoleculeTwin.property_cache) == 3
+        assert "C" not in MoleculeTwin.property_cache
+        assert "CCCC" in MoleculeTwin.property_cache
+    
+    def test_transformation_derives_a_new_record(self):
+        """Transformations leave the parent's shared record untouched"""
+        parent = MoleculeTwin("CCO", "Ethanol")
+        parent_weight = parent.properties.molecular_weight
+        conditions = ProcessConditions(
+            temperature=25.0, pressure=1.0, ph=7.0, humidity=45.0,
+            light_exposure=100.0, oxygen_level=21.0, mixing_speed=200.0, reaction_time=30.0
+        )
+        
+        child = parent.apply_transformation("oxidation", ["O2"], conditions)
+        
+        assert parent.properties.molecular_weight == parent_weight
+        assert child.properties.molecular_weight == pytest.approx(parent_weight * 1.1)
+        assert MoleculeTwin.property_cache.get(child.smiles) is child.properties
+
+
+class TestLineageIndex:
+    """Test cases for the transformation lineage index"""
+    
+    @pytest.fixture(autouse=True)
+    def fresh_index(self, monkeypatch):
+        monkeypatch.setattr(MoleculeTwin, "lineage", LineageIndex())
+    
+    @pytest.fixture
+    def conditions(self):
+        return ProcessConditions(
+            temperature=25.0, pressure=1.0, ph=7.0, humidity=45.0,
+            light_exposure=100.0, oxygen_level=21.0, mixing_speed=200.0, reaction_time=30.0
+        )
+    
+    @pytest.fixture
+    def synthesis_tree(self, conditions):
+        """Raw material with two branches, one of them two steps deep"""
+        raw = MoleculeTwin("CC(=O)O", "Acetic acid")
+        ester = raw.apply_transformation("esterification", ["EtOH"], conditions)
+        amide = raw.apply_transformation("amidation", ["NH3"], conditions)
+        reduced = ester.apply_transformation("reduction", ["LiAlH4"], conditions)
+        return raw, ester, amide, reduced
+    
+    def test_ancestors_and_route(self, synthesis_tree):
+        """Ancestors walk back to the raw material"""
+        raw, ester, amide, reduced = synthesis_tree
+        lineage = MoleculeTwin.lineage
+        
+        assert lineage.ancestors(reduced.id) == [ester.id, raw.id]
+        assert lineage.root(reduced.id) == raw.id
+        assert lineage.root(raw.id) == raw.id
+        assert [edge["reaction_type"] for edge in lineage.route(reduced.id)] == ["esterification", "reduction"]
+    
+    def test_descendants(self, synthesis_tree):
+        """A raw material's subtree holds every derived twin"""
+        raw, ester, amide, reduced = synthesis_tree
+        lineage = MoleculeTwin.lineage
+        
+        assert set(lineage.descendants(raw.id)) == {ester.id, amide.id, reduced.id}
+        assert lineage.descendants(ester.id) == [reduced.id]
+        assert lineage.descendants(amide.id) == []
+    
+    def test_export_round_trip(self, synthesis_tree):
+        """Exported edges rebuild the same index"""
+        raw, _, _, reduced = synthesis_tree
+        edges = MoleculeTwin.lineage.export()
+        
+        rebuilt = LineageIndex.from_edges(edges)
+        assert len(edges) == 3
+        assert rebuilt.ancestors(reduced.id) == MoleculeTwin.lineage.ancestors(reduced.id)
+        assert rebuilt.adjacency() == MoleculeTwin.lineage.adjacency()
+    
+    def test_rejects_cycles_and_second_parents(self):
+        """Each twin has one parent and no twin is its own ancestor"""
+        lineage = LineageIndex()
+        lineage.record("a", "b")
+        lineage.record("b", "c")
+        lineage.record("b", "c")  # Repeating an edge is harmless
+        
+        with pytest.raises(ValueError):
+            lineage.record("c", "a")
+        with pytest.raises(ValueError):
+            lineage.record("a", "c")
+    
+    def test_bounded_index_drops_oldest_edges(self):
+        """Past max_edges the oldest edge goes and its child becomes a root"""
+        lineage = LineageIndex(max_edges=2)
+        for parent, child in (("a", "b"), ("b", "c"), ("c", "d")):
+            lineage.record(parent, child)
+        
+        assert len(lineage) == 2
+        assert lineage.evicted == 1
+        assert lineage.ancestors("d") == ["c", "b"]
+        assert lineage.root("d") == "b"
+        assert "a" not in lineage
+        assert LineageIndex.from_edges(lineage.export()).adjacency() == lineage.adjacency()
+    
+    def test_transformation_into_given_index(self, conditions):
+        """An explicit index receives the edge instead of the class-level one"""
+        raw = MoleculeTwin("CC(=O)O", "Acetic acid")
+        own = LineageIndex()
+        product = raw.apply_transformation("esterification", ["EtOH"], conditions, lineage=own)
+        
+        assert own.parent(product.id) == raw.id
+        assert len(MoleculeTwin.lineage) == 0
+    
+    def test_products_in_one_clock_tick_get_distinct_ids(self, conditions, monkeypatch):
+        """Same-named products made at the same instant do not collide"""
+        class FrozenClock(datetime):
+            @classmethod
+            def utcnow(cls):
+                return datetime(2024, 1, 1)
+        
+        monkeypatch.setattr(sys.modules[MoleculeTwin.__module__], "datetime", FrozenClock)
+        lots = MoleculeTwin.from_many([("CCO", "Ethanol")] * 2, seed=0)
+        products = [lot.apply_transformation("oxidation", ["KMnO4"], conditions) for lot in lots]
+        
+        assert products[0].id != products[1].id
+        assert [MoleculeTwin.lineage.parent(p.id) for p in products] == [lot.id for lot in lots]
+
+
+class TestDegradationKinetics:
+    """Test cases for the shared degradation kinetics model"""
+    
+    def test_scalar_and_array_paths_agree(self):
+        """Array rates and indices match the single-call results"""
+        temperature = np.array([5.0, 25.0, 40.0, 60.0])
+        ph = np.array([7.0, 4.5, 7.0, 9.0])
+        humidity = np.array([30.0, 75.0, 60.0, 90.0])
+        light = np.array([0.0, 100.0, 500.0, 1000.0])
+        
+        rates = degradation_rates(temperature, ph, humidity, light)
+        expected = [degradation_rate(*args) for args in zip(temperature, ph, humidity, light)]
+        np.testing.assert_allclose(rates, expected, rtol=1e-12)
+        np.testing.assert_allclose(stability_indices(rates), [stability_index(r) for r in expected], rtol=1e-12)
+        assert degradation_rate(25.0, 7.0, 45.0, 0.0) == pytest.approx(0.01)
+    
+    def test_models_cached_per_activation_energy(self):
+        """Each activation energy gets one shared model"""
+        assert arrhenius_model() is arrhenius_model()
+        assert arrhenius_model(100000) is not arrhenius_model()
+        assert arrhenius_model(100000).temperature_factor(40.0) > arrhenius_model().temperature_factor(40.0)
+        assert arrhenius_model().temperature_factor(25.0) == pytest.approx(1.0)
+    
+    def test_array_paths_follow_twin_kinetics(self):
+        """Fleets and grids use a twin's non-default model, not the default one"""
+        class LabileTwin(MoleculeTwin):
+            __slots__ = ()
+            kinetics = arrhenius_model(100000)
+        
+        conditions = ProcessConditions(
+            temperature=40.0, pressure=1.0, ph=6.0, humidity=75.0,
+            light_exposure=100.0, oxygen_level=21.0, mixing_speed=200.0, reaction_time=30.0
+        )
+        twins = [LabileTwin("CC(=O)O", "Acetic acid") for _ in range(2)]
+        fleet = MoleculeFleet.from_twins(twins)
+        assert fleet.kinetics is LabileTwin.kinetics
+        
+        record = fleet.simulate_process_step(conditions, duration=60)
+        expected = twins[0].simulate_process_step(conditions, duration=60)
+        np.testing.assert_allclose(record["degradation_rate"], expected["degradation_rate"], rtol=1e-12)
+        assert expected["degradation_rate"] > MoleculeTwin("CC(=O)O", "Acetic acid")._calculate_degradation_rate(conditions)
+        
+        shelf_life, _ = twins[1].predict_shelf_life(conditions, {"min_purity": 95.0})
+        grid = twins[1].predict_shelf_life_grid(conditions, {"min_purity": 95.0})
+        assert grid["shelf_life_months"] == pytest.approx(shelf_life, rel=1e-12)
+        
+        with pytest.raises(ValueError):
+            MoleculeFleet.from_twins([twins[0], MoleculeTwin("CCO", "Ethanol")])
+        
+        product = twins[0].apply_transformation("oxidation", ["KMnO4"], conditions)
+        assert type(product) is LabileTwin
+        product_fleet = MoleculeFleet.from_twins([twins[1], product])
+        assert product_fleet.kinetics is LabileTwin.kinetics
+        np.testing.assert_allclose(product_fleet.simulate_process_step(conditions, duration=60)["degradation_rate"][1],
+                                   product.simulate_process_step(conditions, duration=60)["degradation_rate"],
+                                   rtol=1e-12)
+    
+    def test_step_computes_rate_once(self, monkeypatch):
+        """A process step passes its degradation rate on to the stability index"""
+        calls = []
+        
+        class CountingModel(ArrheniusModel):
+            def rate(self, *args):
+                calls.append(args)
+                return super().rate(*args)
+        
+        monkeypatch.setattr(MoleculeTwin, "kinetics", CountingModel())
+        twin = MoleculeTwin("CC(=O)O", "Acetic acid")
+        conditions = ProcessConditions(
+            temperature=40.0, pressure=1.0, ph=7.0, humidity=75.0,
+            light_exposure=100.0, oxygen_level=21.0, mixing_speed=200.0, reaction_time=30.0
+        )
+        
+        record = twin.simulate_process_step(conditions, duration=60)
+        assert len(calls) == 1
+        assert record["quality_metrics"]["stability_index"] == stability_index(record["degradation_rate"])
+        
+        twin.predict_shelf_life(conditions, {"min_purity": 95.0})
+        assert len(calls) == 2
+
+
 class TestMolecularProperty:
     """Test cases for MolecularProperty dataclass"""
     
@@ -277,7 +842,7 @@ class TestMolecularProperty:
         assert props.melting_point == 76.0
         assert props.solubility["water"] == 0.021
         assert props.solubility["ethanol"] == 200.0
-        assert props.pka_values == [4.91]
+        assert props.pka_values == (4.91,)
         assert props.logp == 3.97
         assert props.bioavailability == 0.8
         assert props.synthesis_complexity == 3
@@ -301,6 +866,16 @@ class TestMolecularProperty:
         assert props_dict["molecular_weight"] == 206.28
         assert props_dict["melting_point"] == 76.0
         assert "solubility" in props_dict
+        assert MolecularProperty.from_dict(props_dict) == props
+    
+    def test_compact_instances(self):
+        """Model objects use __slots__ instead of a per-instance __dict__"""
+        twin = MoleculeTwin("CCO", "Ethanol")
+        
+        for obj in (twin, twin.properties, twin.process_history):
+            assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            twin.unexpected_attribute = 1
 
 
 class TestProcessConditions:
@@ -345,6 +920,20 @@ class TestProcessConditions:
         assert extreme_conditions.temperature == 150.0
         assert extreme_conditions.ph == 14.0
         assert extreme_conditions.oxygen_level == 100.0
+    
+    def test_conditions_to_dict(self):
+        """to_dict replaces __dict__ access on the slotted dataclass"""
+        conditions = ProcessConditions(
+            temperature=25.0, pressure=1.0, ph=7.0, humidity=45.0,
+            light_exposure=100.0, oxygen_level=21.0, mixing_speed=200.0, reaction_time=30.0
+        )
+        
+        assert not hasattr(conditions, "__dict__")
+        assert ProcessConditions(**conditions.to_dict()) == conditions
+        assert list(conditions.to_dict()) == [
+            "temperature", "pressure", "ph", "humidity",
+            "light_exposure", "oxygen_level", "mixing_speed", "reaction_time"
+        ]
 
 
 if __name__ == "__main__":